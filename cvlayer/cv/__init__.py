@@ -7,6 +7,7 @@ from cvlayer.cv.basic import CvlBasic
 from cvlayer.cv.bgsub import CvlBackgroundSubtractor
 from cvlayer.cv.bitwise import CvlBitwise
 from cvlayer.cv.border import CvlBorder
+from cvlayer.cv.capture_group import CvlCaptureGroup
 from cvlayer.cv.color import CvlColor
 from cvlayer.cv.colormap import CvlColormap
 from cvlayer.cv.contour import CvlContour
@@ -17,9 +18,14 @@ from cvlayer.cv.drawable import CvlDrawable
 from cvlayer.cv.filter import CvlFilter
 from cvlayer.cv.fourcc import CvlFourcc
 from cvlayer.cv.fourier_transform import CvlFourierTransform
+from cvlayer.cv.frame_ring import CvlFrameRing
+from cvlayer.cv.frame_skipper import CvlFrameSkipper
+from cvlayer.cv.frame_stats import CvlFrameStats
+from cvlayer.cv.frame_store import CvlFrameStore
 from cvlayer.cv.histogram import CvlHistogram
 from cvlayer.cv.hough_lines import CvlHoughLines
 from cvlayer.cv.hsv import CvlHsv
+from cvlayer.cv.image_cache import CvlImageCache
 from cvlayer.cv.image_crop import CvlImageCrop
 from cvlayer.cv.image_flip import CvlImageFlip
 from cvlayer.cv.image_io import CvlImageIo
@@ -28,20 +34,25 @@ from cvlayer.cv.image_move import CvlImageMove
 from cvlayer.cv.image_normalize import CvlImageNormalize
 from cvlayer.cv.image_resize import CvlImageResize
 from cvlayer.cv.image_rotation import CvlImageRotation
+from cvlayer.cv.image_sequence import CvlImageSequence
 from cvlayer.cv.in_range import CvlInRange
 from cvlayer.cv.iou import CvlIou
 from cvlayer.cv.keymap import CvlKeymap
 from cvlayer.cv.kmeans import CvlKmeans
 from cvlayer.cv.match_template import CvlMatchTemplate
 from cvlayer.cv.matcher import CvlMatcher
+from cvlayer.cv.mjpeg_server import CvlMjpegServer
 from cvlayer.cv.morphology import CvlMorphology
+from cvlayer.cv.mosaic import CvlMosaic
 from cvlayer.cv.norm import CvlNorm
 from cvlayer.cv.orb import CvlOrb
 from cvlayer.cv.palette import CvlPalette
 from cvlayer.cv.perspective import CvlPerspective
 from cvlayer.cv.pyramid import CvlPyramid
+from cvlayer.cv.reduced_capture import CvlReducedCapture
 from cvlayer.cv.roi import CvlRoi
 from cvlayer.cv.rotate_tracer import CvlRotateTracer
+from cvlayer.cv.snapshot_writer import CvlSnapshotWriter
 from cvlayer.cv.stack import CvlStack
 from cvlayer.cv.threshold import CvlThreshold
 from cvlayer.cv.tracker import CvlTracker
@@ -59,6 +70,7 @@ class CvLayer(
     CvlBackgroundSubtractor,
     CvlBitwise,
     CvlBorder,
+    CvlCaptureGroup,
     CvlColor,
     CvlColormap,
     CvlContour,
@@ -69,9 +81,14 @@ class CvLayer(
     CvlFilter,
     CvlFourcc,
     CvlFourierTransform,
+    CvlFrameRing,
+    CvlFrameSkipper,
+    CvlFrameStats,
+    CvlFrameStore,
     CvlHistogram,
     CvlHoughLines,
     CvlHsv,
+    CvlImageCache,
     CvlImageCrop,
     CvlImageFlip,
     CvlImageIo,
@@ -80,20 +97,25 @@ class CvLayer(
     CvlImageNormalize,
     CvlImageResize,
     CvlImageRotation,
+    CvlImageSequence,
     CvlInRange,
     CvlIou,
     CvlKeymap,
     CvlKmeans,
     CvlMatchTemplate,
     CvlMatcher,
+    CvlMjpegServer,
     CvlMorphology,
+    CvlMosaic,
     CvlNorm,
     CvlOrb,
     CvlPalette,
     CvlPerspective,
     CvlPyramid,
+    CvlReducedCapture,
     CvlRoi,
     CvlRotateTracer,
+    CvlSnapshotWriter,
     CvlStack,
     CvlTransform,
     CvlThreshold,
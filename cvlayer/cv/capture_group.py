@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from enum import Enum, auto, unique
+from time import monotonic
+from typing import (
+    Callable,
+    Deque,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import cv2
+from numpy.typing import NDArray
+
+from cvlayer.cv.video_capture import VideoCapture
+
+DEFAULT_SYNC_TOLERANCE: Final[float] = 0.010
+"""Maximum timestamp spread (in seconds) of the frames in one frame set."""
+
+DEFAULT_SYNC_QUEUE_SIZE: Final[int] = 4
+
+
+@unique
+class SyncDropPolicy(Enum):
+    OLDEST = auto()
+    """When a source queue is full, drop its oldest buffered frame."""
+
+    NEWEST = auto()
+    """When a source queue is full, drop the incoming frame."""
+
+
+class TimedFrame(NamedTuple):
+    source: int
+    timestamp: float
+    image: NDArray
+
+
+class FrameSet(NamedTuple):
+    frames: List[TimedFrame]
+
+    @property
+    def timestamp(self) -> float:
+        return max(f.timestamp for f in self.frames)
+
+    @property
+    def spread(self) -> float:
+        timestamps = [f.timestamp for f in self.frames]
+        return max(timestamps) - min(timestamps)
+
+    @property
+    def images(self) -> List[NDArray]:
+        return [f.image for f in self.frames]
+
+
+class FrameSynchronizer:
+    """
+    Assemble time-aligned frame sets, one frame per source.
+
+    A set is emitted when the oldest frames of every source are within `tolerance`.
+    Frames that are too old to be matched by any later frame are dropped.
+    """
+
+    _queues: List[Deque[TimedFrame]]
+
+    def __init__(
+        self,
+        sources: int,
+        tolerance=DEFAULT_SYNC_TOLERANCE,
+        max_queue=DEFAULT_SYNC_QUEUE_SIZE,
+        policy=SyncDropPolicy.OLDEST,
+    ):
+        if sources < 1:
+            raise ValueError("The 'sources' argument must be at least 1")
+        if tolerance < 0:
+            raise ValueError("The 'tolerance' argument must not be negative")
+        if max_queue < 1:
+            raise ValueError("The 'max_queue' argument must be at least 1")
+
+        self._queues = [deque() for _ in range(sources)]
+        self._tolerance = tolerance
+        self._max_queue = max_queue
+        self._policy = policy
+        self._dropped = [0] * sources
+
+    @property
+    def sources(self) -> int:
+        return len(self._queues)
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    @property
+    def policy(self) -> SyncDropPolicy:
+        return self._policy
+
+    @property
+    def dropped(self) -> List[int]:
+        """The number of dropped frames per source."""
+        return self._dropped.copy()
+
+    def pending(self, source: int) -> int:
+        return len(self._queues[source])
+
+    def clear(self) -> None:
+        for queue in self._queues:
+            queue.clear()
+
+    def push(self, source: int, timestamp: float, image: NDArray) -> bool:
+        """
+        :return: `False` if the frame was dropped by the `NEWEST` policy.
+        """
+
+        queue = self._queues[source]
+        if len(queue) >= self._max_queue:
+            self._dropped[source] += 1
+            if self._policy == SyncDropPolicy.NEWEST:
+                return False
+            queue.popleft()
+
+        queue.append(TimedFrame(source, timestamp, image))
+        return True
+
+    def pop(self) -> Optional[FrameSet]:
+        while all(self._queues):
+            heads = [q[0] for q in self._queues]
+            newest = max(f.timestamp for f in heads)
+            oldest = min(f.timestamp for f in heads)
+
+            if newest - oldest <= self._tolerance:
+                return FrameSet([q.popleft() for q in self._queues])
+
+            # Later frames are never older than `newest`,
+            # so heads outside the tolerance window can't be matched anymore.
+            limit = newest - self._tolerance
+            for source, queue in enumerate(self._queues):
+                if queue[0].timestamp < limit:
+                    queue.popleft()
+                    self._dropped[source] += 1
+
+        return None
+
+
+class CaptureGroup:
+    """
+    Capture several sources at once and read them as time-aligned frame sets.
+
+    Ready streams are found with `VideoCapture.wait_any`, so each frame is taken
+    as soon as its camera delivers it. Backends without `waitAny` support
+    (anything but V4L) fall back to grabbing every stream in turn.
+
+    A stream has ended when its grab or retrieve fails, when it's closed,
+    or when a wait without `timeout_nano` returns no ready stream.
+    """
+
+    def __init__(
+        self,
+        captures: Sequence[VideoCapture],
+        tolerance=DEFAULT_SYNC_TOLERANCE,
+        max_queue=DEFAULT_SYNC_QUEUE_SIZE,
+        policy=SyncDropPolicy.OLDEST,
+        timeout_nano: Optional[int] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if not captures:
+            raise ValueError("The 'captures' argument must not be empty")
+
+        self._captures = list(captures)
+        self._synchronizer = FrameSynchronizer(
+            len(self._captures), tolerance, max_queue, policy
+        )
+        self._timeout_nano = timeout_nano
+        self._clock = clock
+        self._use_wait_any = True
+        self._eof = [False] * len(self._captures)
+
+    @property
+    def captures(self) -> List[VideoCapture]:
+        return self._captures
+
+    @property
+    def synchronizer(self) -> FrameSynchronizer:
+        return self._synchronizer
+
+    @property
+    def use_wait_any(self) -> bool:
+        return self._use_wait_any
+
+    @property
+    def eof(self) -> bool:
+        return any(self._eof)
+
+    def _end_idle_streams(self, live: List[int]) -> None:
+        # A blocking wait that returns no stream means none can deliver anymore.
+        for index in live:
+            if self._timeout_nano is None or not self._captures[index].opened:
+                self._eof[index] = True
+
+    def _wait_ready(self, live: List[int]) -> Optional[List[Tuple[int, float]]]:
+        streams = [self._captures[i] for i in live]
+        try:
+            retval, ready = VideoCapture.wait_any(streams, self._timeout_nano)
+        except cv2.error:
+            self._use_wait_any = False
+            return None
+
+        timestamp = self._clock()
+        if not retval or len(ready) == 0:
+            self._end_idle_streams(live)
+            return list()
+        # `waitAny` grabs all ready streams at once.
+        return [(live[i], timestamp) for i in ready]
+
+    def _grab_ready(self) -> List[Tuple[int, float]]:
+        live = [i for i, eof in enumerate(self._eof) if not eof]
+        if not live:
+            return list()
+
+        if self._use_wait_any:
+            result = self._wait_ready(live)
+            if result is not None:
+                return result
+
+        ready = list()
+        for index in live:
+            if self._captures[index].grab():
+                ready.append((index, self._clock()))
+            else:
+                self._eof[index] = True
+        return ready
+
+    def poll(self) -> List[int]:
+        """
+        Retrieve the frames of all ready streams into the synchronizer.
+        Each frame is timestamped right after its stream was grabbed.
+
+        :return: The indices of the streams that delivered a frame.
+        """
+
+        result = list()
+        for index, timestamp in self._grab_ready():
+            retval, image = self._captures[index].retrieve()
+            if not retval:
+                self._eof[index] = True
+                continue
+            if self._synchronizer.push(index, timestamp, image):
+                result.append(index)
+        return result
+
+    def read(self) -> Optional[FrameSet]:
+        """
+        Poll until a frame set is assembled.
+
+        :return: `None` if any stream has ended.
+        """
+
+        while True:
+            frame_set = self._synchronizer.pop()
+            if frame_set is not None:
+                return frame_set
+            if self.eof:
+                return None
+            self.poll()
+
+    def release(self) -> None:
+        for capture in self._captures:
+            capture.release()
+        self._synchronizer.clear()
+
+
+class CvlCaptureGroup:
+    @staticmethod
+    def cvl_create_frame_synchronizer(
+        sources: int,
+        tolerance=DEFAULT_SYNC_TOLERANCE,
+        max_queue=DEFAULT_SYNC_QUEUE_SIZE,
+        policy=SyncDropPolicy.OLDEST,
+    ):
+        return FrameSynchronizer(sources, tolerance, max_queue, policy)
+
+    @staticmethod
+    def cvl_create_capture_group(
+        captures: Sequence[VideoCapture],
+        tolerance=DEFAULT_SYNC_TOLERANCE,
+        max_queue=DEFAULT_SYNC_QUEUE_SIZE,
+        policy=SyncDropPolicy.OLDEST,
+        timeout_nano: Optional[int] = None,
+    ):
+        return CaptureGroup(captures, tolerance, max_queue, policy, timeout_nano)
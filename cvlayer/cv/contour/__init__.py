@@ -6,6 +6,9 @@ from cvlayer.cv.contour.contour import CvlContourContour
 from cvlayer.cv.contour.find import CvlContourFind
 from cvlayer.cv.contour.moments import CvlContourMoments
 from cvlayer.cv.contour.most_point import CvlContourMostPoint
+from cvlayer.cv.contour.roi_mask import CvlContourRoiMask
+from cvlayer.cv.contour.table import CvlContourTable
+from cvlayer.cv.contour.track import CvlContourTrack
 
 
 class CvlContour(
@@ -15,5 +18,8 @@ class CvlContour(
     CvlContourFind,
     CvlContourMoments,
     CvlContourMostPoint,
+    CvlContourRoiMask,
+    CvlContourTable,
+    CvlContourTrack,
 ):
     pass
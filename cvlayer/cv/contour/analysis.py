@@ -5,9 +5,9 @@ from typing import NamedTuple
 
 import cv2
 from cv2.typing import MatLike
-from numpy import logical_and, zeros
 from numpy.typing import NDArray
 
+from cvlayer.cv.contour.roi_mask import RoiMask
 from cvlayer.typing import PointF, RectI, SizeI
 
 
@@ -32,13 +32,11 @@ def box_points(box: RotatedRect) -> NDArray:
 def bitwise_intersection_contours(
     width: int, height: int, contour1: MatLike, contour2: MatLike
 ) -> NDArray:
-    blank1 = zeros((height, width))
-    blank2 = zeros((height, width))
-
-    mask1 = cv2.drawContours(blank1, [contour1], 0, [1])
-    mask2 = cv2.drawContours(blank2, [contour2], 1, [1])
-
-    return logical_and(mask1, mask2)
+    # The outlines are intersected inside their overlapping bounding boxes only.
+    frame_size = width, height
+    mask1 = RoiMask.from_contour(contour1, frame_size, thickness=1)
+    mask2 = RoiMask.from_contour(contour2, frame_size, thickness=1)
+    return mask1.intersection(mask2).to_full() != 0
 
 
 def contour_area(contour: NDArray, oriented=False) -> float:
@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass
-from typing import List, NamedTuple
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import cv2
+from numpy import (
+    arange,
+    asarray,
+    concatenate,
+    flatnonzero,
+    int32,
+    ones,
+    uint8,
+    zeros,
+)
 from numpy.typing import NDArray
 
+from cvlayer.cv.color import PIXEL_8BIT_MAX
 from cvlayer.cv.types.data_type import (
     CV_16U,
     CV_32S,
@@ -13,6 +24,7 @@ from cvlayer.cv.types.data_type import (
     DataTypeLike,
     normalize_data_type,
 )
+from cvlayer.typing import RectI
 
 
 class ConnectedComponentsResult(NamedTuple):
@@ -25,7 +37,7 @@ def connected_components(
     connectivity=8,
     ltype: DataTypeLike = DataType.S32,
 ) -> ConnectedComponentsResult:
-    if connectivity in (4, 8):
+    if connectivity not in (4, 8):
         raise ValueError("The connectivity argument accepts only the values 8 or 4")
 
     _label_type = normalize_data_type(ltype)
@@ -83,13 +95,155 @@ class ConnectedComponentsWithStatsResult(NamedTuple):
             result.append(ConnectedComponentStatistics(x, y, w, h, a, cx, cy))
         return result
 
+    @property
+    def x(self) -> NDArray:
+        return self.stats[:, cv2.CC_STAT_LEFT]
+
+    @property
+    def y(self) -> NDArray:
+        return self.stats[:, cv2.CC_STAT_TOP]
+
+    @property
+    def width(self) -> NDArray:
+        return self.stats[:, cv2.CC_STAT_WIDTH]
+
+    @property
+    def height(self) -> NDArray:
+        return self.stats[:, cv2.CC_STAT_HEIGHT]
+
+    @property
+    def area(self) -> NDArray:
+        return self.stats[:, cv2.CC_STAT_AREA]
+
+    @property
+    def bboxes(self) -> NDArray:
+        """The `(x1, y1, x2, y2)` bounding boxes, with exclusive `x2` and `y2`."""
+
+        result = self.stats[:, :4].copy()
+        result[:, 2] += result[:, 0]
+        result[:, 3] += result[:, 1]
+        return result
+
+    @property
+    def aspect_ratio(self) -> NDArray:
+        """The `width / height` of the bounding boxes."""
+        return self.width / self.height
+
+    def select(
+        self,
+        area_min: Optional[int] = None,
+        area_max: Optional[int] = None,
+        width_min: Optional[int] = None,
+        width_max: Optional[int] = None,
+        height_min: Optional[int] = None,
+        height_max: Optional[int] = None,
+        aspect_ratio_min: Optional[float] = None,
+        aspect_ratio_max: Optional[float] = None,
+    ) -> NDArray:
+        """
+        :return: The labels of the components that pass all the given bounds,
+            in ascending order. The background label `0` is never included.
+        """
+
+        keep = ones(self.number_of_labels, dtype=bool)
+        keep[0] = False
+
+        bounds = (
+            (self.area, area_min, area_max),
+            (self.width, width_min, width_max),
+            (self.height, height_min, height_max),
+        )
+        for column, lower, upper in bounds:
+            if lower is not None:
+                keep &= column >= lower
+            if upper is not None:
+                keep &= column <= upper
+
+        if aspect_ratio_min is not None or aspect_ratio_max is not None:
+            aspect_ratio = self.aspect_ratio
+            if aspect_ratio_min is not None:
+                keep &= aspect_ratio >= aspect_ratio_min
+            if aspect_ratio_max is not None:
+                keep &= aspect_ratio <= aspect_ratio_max
+
+        return flatnonzero(keep).astype(int32)
+
+    def relabel(self, keep: Sequence[int]):
+        """
+        Keep only the given components, numbered `1..len(keep)` in the given order.
+
+        The other components become background, and the background statistics
+        are updated to cover them.
+
+        :return: A new `ConnectedComponentsWithStatsResult`.
+        """
+
+        _keep = asarray(keep, dtype=int32).reshape(-1)
+        if ((_keep <= 0) | (_keep >= self.number_of_labels)).any():
+            raise ValueError("The keep argument accepts only foreground labels")
+
+        lut = zeros(self.number_of_labels, dtype=self.labels.dtype)
+        lut[_keep] = arange(1, len(_keep) + 1)
+        labels = lut.take(self.labels)
+
+        # The background absorbs the removed components.
+        removed = (lut == 0) & (self.area > 0)
+        background = zeros(5, dtype=self.stats.dtype)
+        background_centroid = zeros(2, dtype=self.centroids.dtype)
+        if removed.any():
+            bboxes = self.bboxes[removed]
+            removed_area = self.area[removed]
+            total = removed_area.sum()
+            x1, y1 = bboxes[:, 0].min(), bboxes[:, 1].min()
+            background[cv2.CC_STAT_LEFT] = x1
+            background[cv2.CC_STAT_TOP] = y1
+            background[cv2.CC_STAT_WIDTH] = bboxes[:, 2].max() - x1
+            background[cv2.CC_STAT_HEIGHT] = bboxes[:, 3].max() - y1
+            background[cv2.CC_STAT_AREA] = total
+            weights = removed_area[:, None] / total
+            background_centroid[:] = (self.centroids[removed] * weights).sum(axis=0)
+
+        stats = concatenate([background[None], self.stats[_keep]])
+        centroids = concatenate([background_centroid[None], self.centroids[_keep]])
+        return ConnectedComponentsWithStatsResult(
+            len(_keep) + 1, labels, stats, centroids
+        )
+
+    def component_mask(self, label: int, mask_value=PIXEL_8BIT_MAX) -> NDArray:
+        """
+        :return: The mask of the component inside its bounding box.
+        """
+
+        x, y, w, h = self.stats[label, :4].tolist()
+        roi = self.labels[y : y + h, x : x + w]
+        mask = zeros(roi.shape, dtype=uint8)
+        mask[roi == label] = mask_value
+        return mask
+
+    def iter_component_masks(
+        self,
+        labels: Optional[Iterable[int]] = None,
+        mask_value=PIXEL_8BIT_MAX,
+    ) -> Iterator[Tuple[int, RectI, NDArray]]:
+        """
+        :return: The `(label, bbox, mask)` of each component in `labels`,
+            or of all the foreground components.
+        """
+
+        if labels is None:
+            labels = range(1, self.number_of_labels)
+        for label in labels:
+            x, y, w, h = self.stats[label, :4].tolist()
+            bbox = x, y, x + w, y + h
+            yield int(label), bbox, self.component_mask(label, mask_value)
+
 
 def connected_components_with_stats(
     image: NDArray,
     connectivity=8,
     ltype: DataTypeLike = DataType.S32,
 ) -> ConnectedComponentsWithStatsResult:
-    if connectivity in (4, 8):
+    if connectivity not in (4, 8):
         raise ValueError("The connectivity argument accepts only the values 8 or 4")
 
     _label_type = normalize_data_type(ltype)
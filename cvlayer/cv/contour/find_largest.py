@@ -2,13 +2,14 @@
 
 from typing import Final, Optional
 
-from numpy import int32, ndarray, uint8, zeros
+from numpy import inf, int32, ones, uint8, where
 from numpy.typing import NDArray
 
 from cvlayer.cv.color import PIXEL_8BIT_MAX
 from cvlayer.cv.contour.analysis import contour_area
 from cvlayer.cv.contour.find import find_contours
-from cvlayer.cv.drawable.contours import draw_contour
+from cvlayer.cv.contour.roi_mask import RoiMask
+from cvlayer.cv.contour.table import contour_areas
 from cvlayer.cv.types.chain_approx import DEFAULT_CHAIN_APPROX
 from cvlayer.cv.types.line_type import LINE_8
 from cvlayer.cv.types.retrieval import DEFAULT_RETRIEVAL
@@ -31,6 +32,7 @@ class LargestContourResult:
         self._frame_size = frame_size
         self._contour = contour
         self._mask = mask
+        self._roi_mask: Optional[RoiMask] = None
         self._area = area
         self._mask_value = mask_value
         self._area_oriented = area_oriented
@@ -56,19 +58,26 @@ class LargestContourResult:
         return self._contour
 
     @property
-    def mask(self) -> NDArray[uint8]:
-        if self._mask is None:
+    def roi_mask(self) -> RoiMask:
+        """The filled contour, inside its bounding box only."""
+
+        if self._roi_mask is None:
             if self._contour is None:
                 raise ValueError("Contour does not exist")
-            w, h = self._frame_size
-            mask = zeros((h, w), dtype=uint8)
-            self._mask = draw_contour(
-                image=mask,
+            self._roi_mask = RoiMask.from_contour(
                 contour=self._contour,
-                color=self._mask_value,
+                frame_size=self._frame_size,
+                mask_value=self._mask_value,
                 thickness=FILLED,
                 line=LINE_8,
             )
+        assert self._roi_mask is not None
+        return self._roi_mask
+
+    @property
+    def mask(self) -> NDArray[uint8]:
+        if self._mask is None:
+            self._mask = self.roi_mask.to_full()
         assert self._mask is not None
         return self._mask
 
@@ -105,25 +114,22 @@ def find_contours_filter_area_largest(
             area_oriented=area_oriented,
         )
 
+    areas = contour_areas(contours, area_oriented)
+    candidates = ones(len(areas), dtype=bool)
+    if area_min >= 0.0:
+        candidates &= areas >= area_min
+    if area_max >= 0.0:
+        candidates &= areas <= area_max
+
     largest_contour: Optional[NDArray[int32]] = None
     largest_area = 0.0
 
-    # [IMPORTANT]
-    # 'map object' is not an iterator in 'zip'. So convert it to 'list'.
-    areas = list(map(lambda c: contour_area(c, area_oriented), contours))
-
-    for contour, area in zip(contours, areas):
-        assert isinstance(contour, ndarray)
-        assert isinstance(area, float)
-
-        if area_min >= 0.0 and area < area_min:
-            continue
-        if area_max >= 0.0 and area_max < area:  # noqa
-            continue
-
-        if largest_contour is None or largest_area < area:
-            largest_contour = contour
-            largest_area = area
+    if candidates.any():
+        # The first of the largest areas, like the sequential search.
+        filtered = where(candidates, areas, -inf)
+        index = int(filtered.argmax())
+        largest_contour = contours[index]
+        largest_area = float(areas[index])
 
     return LargestContourResult(
         frame_size=image_size,
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+import cv2
+from numpy import uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.color import PIXEL_8BIT_MAX
+from cvlayer.cv.types.line_type import LINE_8, LINE_AA, normalize_line_type
+from cvlayer.cv.types.thickness import FILLED
+from cvlayer.typing import PointI, RectI, SizeI
+
+
+def intersect_rects(rect1: RectI, rect2: RectI) -> Optional[RectI]:
+    x1 = max(rect1[0], rect2[0])
+    y1 = max(rect1[1], rect2[1])
+    x2 = min(rect1[2], rect2[2])
+    y2 = min(rect1[3], rect2[3])
+    if x1 >= x2 or y1 >= y2:
+        return None
+    return x1, y1, x2, y2
+
+
+class RoiMask:
+    """
+    A binary mask stored only inside its bounding box.
+
+    `mask` covers the `bbox` of the frame, starting at `offset`.
+    Non-zero pixels are set. Operations between masks read only
+    the overlapping area, and `to_full()` expands the mask to the frame on request.
+    """
+
+    def __init__(
+        self,
+        mask: NDArray,
+        offset: PointI = (0, 0),
+        frame_size: Optional[SizeI] = None,
+    ):
+        if len(mask.shape) != 2:
+            raise ValueError("Only single-channel masks are supported")
+
+        self._mask = mask
+        self._offset = int(offset[0]), int(offset[1])
+        self._frame_size = frame_size
+
+    @classmethod
+    def empty(cls, frame_size: Optional[SizeI] = None):
+        return cls(zeros((0, 0), dtype=uint8), (0, 0), frame_size)
+
+    @classmethod
+    def from_contour(
+        cls,
+        contour: NDArray,
+        frame_size: Optional[SizeI] = None,
+        mask_value=PIXEL_8BIT_MAX,
+        thickness=FILLED,
+        line=LINE_8,
+    ):
+        """
+        Draw the contour into a mask of its bounding box only.
+        The result is the same as drawing it into a full frame.
+        """
+
+        _line = normalize_line_type(line)
+        x, y, w, h = cv2.boundingRect(contour)
+        margin = max(thickness, 0)
+        if _line == LINE_AA:
+            # Anti-aliasing blends a fringe just outside the stroke, even when filled.
+            margin += 1
+        x1, y1 = x - margin, y - margin
+        x2, y2 = x + w + margin, y + h + margin
+        if frame_size is not None:
+            x1, y1 = max(x1, 0), max(y1, 0)
+            x2, y2 = min(x2, frame_size[0]), min(y2, frame_size[1])
+        if x1 >= x2 or y1 >= y2:
+            return cls.empty(frame_size)
+
+        mask = zeros((y2 - y1, x2 - x1), dtype=uint8)
+        cv2.drawContours(
+            mask,
+            [contour],
+            0,
+            mask_value,
+            thickness,
+            _line,
+            offset=(-x1, -y1),
+        )
+        return cls(mask, (x1, y1), frame_size)
+
+    @property
+    def mask(self) -> NDArray:
+        return self._mask
+
+    @property
+    def offset(self) -> PointI:
+        return self._offset
+
+    @property
+    def frame_size(self) -> Optional[SizeI]:
+        return self._frame_size
+
+    @property
+    def bbox(self) -> RectI:
+        x, y = self._offset
+        return x, y, x + self._mask.shape[1], y + self._mask.shape[0]
+
+    @property
+    def is_empty(self) -> bool:
+        return self._mask.size == 0
+
+    @property
+    def area(self) -> int:
+        if self.is_empty:
+            return 0
+        return cv2.countNonZero(self._mask)
+
+    def crop(self, rect: RectI) -> NDArray:
+        """The part of the mask inside `rect`, which must be inside `bbox`."""
+
+        x, y = self._offset
+        x1, y1, x2, y2 = rect
+        return self._mask[y1 - y : y2 - y, x1 - x : x2 - x]
+
+    def intersection(self, other: "RoiMask") -> "RoiMask":
+        rect = intersect_rects(self.bbox, other.bbox)
+        if rect is None:
+            return RoiMask.empty(self._frame_size)
+        mask = cv2.bitwise_and(self.crop(rect), other.crop(rect))
+        return RoiMask(mask, (rect[0], rect[1]), self._frame_size)
+
+    def union(self, other: "RoiMask") -> "RoiMask":
+        if other.is_empty:
+            return self
+        if self.is_empty:
+            return other
+
+        b1, b2 = self.bbox, other.bbox
+        x1, y1 = min(b1[0], b2[0]), min(b1[1], b2[1])
+        x2, y2 = max(b1[2], b2[2]), max(b1[3], b2[3])
+        mask = zeros((y2 - y1, x2 - x1), dtype=uint8)
+        for item, (bx1, by1, bx2, by2) in ((self, b1), (other, b2)):
+            area = mask[by1 - y1 : by2 - y1, bx1 - x1 : bx2 - x1]
+            cv2.bitwise_or(area, item.mask, dst=area)
+        return RoiMask(mask, (x1, y1), self._frame_size)
+
+    def intersection_area(self, other: "RoiMask") -> int:
+        rect = intersect_rects(self.bbox, other.bbox)
+        if rect is None:
+            return 0
+        return cv2.countNonZero(cv2.bitwise_and(self.crop(rect), other.crop(rect)))
+
+    def union_area(self, other: "RoiMask") -> int:
+        return self.area + other.area - self.intersection_area(other)
+
+    def iou(self, other: "RoiMask") -> float:
+        intersection = self.intersection_area(other)
+        union = self.area + other.area - intersection
+        return intersection / union if union > 0 else 0.0
+
+    def to_full(self, frame_size: Optional[SizeI] = None) -> NDArray:
+        """
+        Expand the mask to a full frame. The parts outside the frame are dropped.
+        """
+
+        size = frame_size if frame_size is not None else self._frame_size
+        if size is None:
+            raise ValueError("The frame size is unknown")
+
+        width, height = size
+        result = zeros((height, width), dtype=uint8)
+        if self.is_empty:
+            return result
+
+        rect = intersect_rects(self.bbox, (0, 0, width, height))
+        if rect is not None:
+            x1, y1, x2, y2 = rect
+            result[y1:y2, x1:x2] = self.crop(rect)
+        return result
+
+
+class CvlContourRoiMask:
+    @staticmethod
+    def cvl_create_roi_mask_from_contour(
+        contour: NDArray,
+        frame_size: Optional[SizeI] = None,
+        mask_value=PIXEL_8BIT_MAX,
+        thickness=FILLED,
+        line=LINE_8,
+    ):
+        return RoiMask.from_contour(contour, frame_size, mask_value, thickness, line)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+from typing import Final, List, NamedTuple, Optional, Sequence, Union
+
+from numpy import (
+    add,
+    arange,
+    argsort,
+    concatenate,
+    cumsum,
+    empty,
+    empty_like,
+    flatnonzero,
+    float64,
+    fromiter,
+    full,
+    hypot,
+    int32,
+    int64,
+    maximum,
+    minimum,
+    ndarray,
+    ones,
+    partition,
+    repeat,
+    where,
+)
+from numpy.typing import NDArray
+
+from cvlayer.cv.contour.find import FindContoursResult
+
+CONTOUR_TABLE_COLUMNS: Final[Sequence[str]] = (
+    "area",
+    "signed_area",
+    "perimeter",
+    "counts",
+)
+"""The columns that `sort()`, `top_k()` and `largest()` accept as a key."""
+
+
+class _FlatContours(NamedTuple):
+    points: NDArray[int32]
+    x: NDArray[int64]
+    y: NDArray[int64]
+    starts: NDArray[int64]
+    ends: NDArray[int64]
+    counts: NDArray[int64]
+
+
+def _flatten(contours: Sequence[NDArray]) -> _FlatContours:
+    counts = fromiter(map(len, contours), dtype=int64, count=len(contours))
+    if (counts < 1).any():
+        raise ValueError("Empty contours are not supported")
+
+    points = concatenate(contours).reshape(-1, 2)
+    starts = cumsum(counts) - counts
+    ends = starts + counts - 1
+    # Integer coordinates keep the shoelace sums exact.
+    x = points[:, 0].astype(int64)
+    y = points[:, 1].astype(int64)
+    return _FlatContours(points, x, y, starts, ends, counts)
+
+
+def _following(values: NDArray, flat: _FlatContours) -> NDArray:
+    # The value of the next point of each point, wrapping around in each contour.
+    result = empty_like(values)
+    result[:-1] = values[1:]
+    result[flat.ends] = values[flat.starts]
+    return result
+
+
+def _shoelace(flat: _FlatContours, xn: NDArray, yn: NDArray) -> NDArray[int64]:
+    # Twice the signed areas, in the same orientation as `cv2.contourArea`.
+    return flat.x * yn - xn * flat.y
+
+
+def contour_areas(contours: Sequence[NDArray], oriented=False) -> NDArray[float64]:
+    """
+    The `cv2.contourArea` of all contours, in a single vectorized pass.
+    """
+
+    if len(contours) == 0:
+        return empty(0, dtype=float64)
+    flat = _flatten(contours)
+    cross = _shoelace(flat, _following(flat.x, flat), _following(flat.y, flat))
+    areas = add.reduceat(cross, flat.starts) * 0.5
+    return areas if oriented else abs(areas)
+
+
+def _first_in_segments(hits: NDArray, segments: NDArray[int64]) -> NDArray[int64]:
+    # The first hit of each segment, like `argmin()` returns the first minimum.
+    index = flatnonzero(hits)
+    owner = segments[index]
+    first = ones(len(index), dtype=bool)
+    first[1:] = owner[1:] != owner[:-1]
+    return index[first]
+
+
+class ContourTable:
+    """
+    The statistics of contours as NumPy columns, computed in one vectorized pass.
+
+    Tables are filtered with boolean masks or index arrays, e.g.
+    `table[table.area >= 100]`, and the subsets keep the `indices`
+    of their rows in the original contours.
+
+    The centroid is the centroid of the polygon, like `cv2.moments`,
+    or the mean of the points if the polygon has no area.
+    The bounding boxes are `(x1, y1, x2, y2)` with exclusive `x2` and `y2`,
+    like `bounding_rect`. The hierarchy rows are `(next, previous, first_child,
+    parent)`, indexing the original contours.
+    """
+
+    _contours: Sequence[NDArray]
+
+    indices: NDArray[int64]
+    signed_area: NDArray[float64]
+    perimeter: NDArray[float64]
+    counts: NDArray[int64]
+    bbox: NDArray[int32]
+    centroid: NDArray[float64]
+    leftmost: NDArray[int32]
+    rightmost: NDArray[int32]
+    topmost: NDArray[int32]
+    bottommost: NDArray[int32]
+    hierarchy: NDArray[int32]
+
+    def __init__(
+        self,
+        contours: Sequence[NDArray],
+        hierarchy: Optional[NDArray] = None,
+    ):
+        self._contours = contours
+        size = len(contours)
+
+        if hierarchy is None:
+            self.hierarchy = full((size, 4), -1, dtype=int32)
+        else:
+            self.hierarchy = hierarchy.reshape(-1, 4).astype(int32, copy=False)
+            if len(self.hierarchy) != size:
+                raise ValueError("The hierarchy does not match the contours")
+
+        self.indices = arange(size, dtype=int64)
+        if size == 0:
+            self._init_empty()
+            return
+
+        flat = _flatten(contours)
+        points, x, y, starts, _, counts = flat
+        xn = _following(x, flat)
+        yn = _following(y, flat)
+
+        cross = _shoelace(flat, xn, yn)
+        double_area = add.reduceat(cross, starts)
+        self.signed_area = double_area * 0.5
+        self.perimeter = add.reduceat(hypot(xn - x, yn - y), starts)
+        self.counts = counts
+
+        xs = points[:, 0]
+        ys = points[:, 1]
+        x1 = minimum.reduceat(xs, starts)
+        y1 = minimum.reduceat(ys, starts)
+        x2 = maximum.reduceat(xs, starts)
+        y2 = maximum.reduceat(ys, starts)
+        self.bbox = empty((size, 4), dtype=int32)
+        self.bbox[:, 0] = x1
+        self.bbox[:, 1] = y1
+        self.bbox[:, 2] = x2 + 1
+        self.bbox[:, 3] = y2 + 1
+
+        mean_x = add.reduceat(x, starts) / counts
+        mean_y = add.reduceat(y, starts) / counts
+        has_area = double_area != 0
+        divisor = where(has_area, double_area * 3.0, 1.0)
+        cx = add.reduceat((x + xn) * cross, starts) / divisor
+        cy = add.reduceat((y + yn) * cross, starts) / divisor
+        self.centroid = empty((size, 2), dtype=float64)
+        self.centroid[:, 0] = where(has_area, cx, mean_x)
+        self.centroid[:, 1] = where(has_area, cy, mean_y)
+
+        segments = repeat(arange(size, dtype=int64), counts)
+        self.leftmost = points[_first_in_segments(xs == x1[segments], segments)]
+        self.rightmost = points[_first_in_segments(xs == x2[segments], segments)]
+        self.topmost = points[_first_in_segments(ys == y1[segments], segments)]
+        self.bottommost = points[_first_in_segments(ys == y2[segments], segments)]
+
+    def _init_empty(self) -> None:
+        self.signed_area = empty(0, dtype=float64)
+        self.perimeter = empty(0, dtype=float64)
+        self.counts = empty(0, dtype=int64)
+        self.bbox = empty((0, 4), dtype=int32)
+        self.centroid = empty((0, 2), dtype=float64)
+        self.leftmost = empty((0, 2), dtype=int32)
+        self.rightmost = empty((0, 2), dtype=int32)
+        self.topmost = empty((0, 2), dtype=int32)
+        self.bottommost = empty((0, 2), dtype=int32)
+
+    @classmethod
+    def from_find_result(cls, result: FindContoursResult):
+        return cls(result.contours, result.hierarchy)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, key: Union[NDArray, Sequence[int], slice]):
+        result = object.__new__(type(self))
+        result._contours = self._contours
+        result.indices = self.indices[key]
+        result.signed_area = self.signed_area[key]
+        result.perimeter = self.perimeter[key]
+        result.counts = self.counts[key]
+        result.bbox = self.bbox[key]
+        result.centroid = self.centroid[key]
+        result.leftmost = self.leftmost[key]
+        result.rightmost = self.rightmost[key]
+        result.topmost = self.topmost[key]
+        result.bottommost = self.bottommost[key]
+        result.hierarchy = self.hierarchy[key]
+        return result
+
+    @property
+    def area(self) -> NDArray[float64]:
+        return abs(self.signed_area)
+
+    @property
+    def parent(self) -> NDArray[int32]:
+        return self.hierarchy[:, 3]
+
+    @property
+    def contours(self) -> List[NDArray]:
+        """The contours of the rows, in the order of the table."""
+        return [self._contours[i] for i in self.indices.tolist()]
+
+    def contour(self, row: int) -> NDArray:
+        return self._contours[int(self.indices[row])]
+
+    def column(self, key: str) -> NDArray:
+        if key not in CONTOUR_TABLE_COLUMNS:
+            raise ValueError(f"Unsupported column: '{key}'")
+        result = getattr(self, key)
+        assert isinstance(result, ndarray)
+        return result
+
+    def filter_area(
+        self,
+        area_min: Optional[float] = None,
+        area_max: Optional[float] = None,
+    ):
+        mask = ones(len(self), dtype=bool)
+        area = self.area
+        if area_min is not None:
+            mask &= area >= area_min
+        if area_max is not None:
+            mask &= area <= area_max
+        return self[mask]
+
+    def sort(self, key="area", descending=True):
+        values = self.column(key)
+        order = argsort(-values if descending else values, kind="stable")
+        return self[order]
+
+    def top_k(self, k: int, key="area"):
+        """The `k` rows with the largest `key`, in descending order."""
+
+        if k <= 0:
+            return self[empty(0, dtype=int64)]
+        values = self.column(key)
+        if k < len(values):
+            # Keep ties in the original order, like a stable sort.
+            threshold = -partition(-values, k - 1)[k - 1]
+            candidates = flatnonzero(values >= threshold)
+            order = argsort(-values[candidates], kind="stable")[:k]
+            return self[candidates[order]]
+        return self.sort(key)
+
+    def largest(self, key="area") -> Optional[int]:
+        """The row with the largest `key`, or `None` if the table is empty."""
+
+        if len(self) == 0:
+            return None
+        return int(self.column(key).argmax())
+
+
+class CvlContourTable:
+    @staticmethod
+    def cvl_contour_areas(contours: Sequence[NDArray], oriented=False):
+        return contour_areas(contours, oriented)
+
+    @staticmethod
+    def cvl_create_contour_table(
+        contours: Sequence[NDArray],
+        hierarchy: Optional[NDArray] = None,
+    ):
+        return ContourTable(contours, hierarchy)
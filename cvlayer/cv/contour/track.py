@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+from enum import Enum, unique
+from typing import Final, NamedTuple, Optional, Sequence, Tuple, Union
+
+from numpy import (
+    arange,
+    argsort,
+    asarray,
+    bool_,
+    concatenate,
+    cumsum,
+    empty,
+    flatnonzero,
+    float64,
+    floor,
+    full,
+    hypot,
+    int64,
+    log2,
+    maximum,
+    ones,
+    repeat,
+    searchsorted,
+    zeros,
+)
+from numpy.typing import NDArray
+
+from cvlayer.cv.contour.table import ContourTable
+from cvlayer.geometry.iou import calculate_iou_pairs
+
+DEFAULT_TRACK_MIN_IOU: Final[float] = 0.3
+DEFAULT_TRACK_MAX_DISTANCE: Final[float] = 50.0
+DEFAULT_TRACK_MIN_HITS: Final[int] = 3
+DEFAULT_TRACK_MAX_MISSES: Final[int] = 5
+
+
+@unique
+class TrackMetric(Enum):
+    IOU = "iou"
+    DISTANCE = "distance"
+
+
+TrackMetricLike = Union[TrackMetric, str]
+
+
+def normalize_track_metric(metric: TrackMetricLike) -> TrackMetric:
+    if isinstance(metric, TrackMetric):
+        return metric
+    elif isinstance(metric, str):
+        return TrackMetric(metric.lower())
+    else:
+        raise TypeError(f"Unsupported metric type: {type(metric).__name__}")
+
+
+class BlobTrackResult(NamedTuple):
+    ids: NDArray[int64]
+    """The track ID of each detection."""
+
+    confirmed: NDArray[bool_]
+    """Whether the track of each detection is confirmed."""
+
+
+def grid_neighbor_pairs(
+    points1: NDArray,
+    points2: NDArray,
+    cell: float,
+) -> Tuple[NDArray[int64], NDArray[int64]]:
+    """
+    Find the pairs of points that are in the same or adjacent cells of a uniform grid.
+    Every pair closer than `cell` on both axes is included.
+
+    :return: The indices into `points1` and `points2` of each pair.
+    """
+
+    if len(points1) == 0 or len(points2) == 0:
+        return empty(0, dtype=int64), empty(0, dtype=int64)
+
+    keys1 = floor(points1 / cell).astype(int64)
+    keys2 = floor(points2 / cell).astype(int64)
+    low = min(keys1.min(axis=0).min(), keys2.min(axis=0).min()) - 1
+    keys1 -= low
+    keys2 -= low
+    stride = int(max(keys1.max(), keys2.max())) + 2
+
+    flat2 = keys2[:, 0] * stride + keys2[:, 1]
+    order = argsort(flat2, kind="stable")
+    sorted2 = flat2[order]
+
+    firsts = list()
+    seconds = list()
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            query = (keys1[:, 0] + dx) * stride + (keys1[:, 1] + dy)
+            begin = searchsorted(sorted2, query, "left")
+            end = searchsorted(sorted2, query, "right")
+            counts = end - begin
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            offsets = arange(total) - repeat(cumsum(counts) - counts, counts)
+            firsts.append(repeat(arange(len(points1)), counts))
+            seconds.append(order[repeat(begin, counts) + offsets])
+
+    if not firsts:
+        return empty(0, dtype=int64), empty(0, dtype=int64)
+    return concatenate(firsts), concatenate(seconds)
+
+
+def _size_buckets(bboxes: NDArray[float64]) -> NDArray[int64]:
+    sides = maximum(bboxes[:, 2:] - bboxes[:, :2], 1.0).max(axis=1)
+    return floor(log2(sides)).astype(int64)
+
+
+def bbox_neighbor_pairs(
+    bboxes1: NDArray[float64],
+    bboxes2: NDArray[float64],
+) -> Tuple[NDArray[int64], NDArray[int64]]:
+    """
+    Find the pairs of bounding boxes that may overlap.
+    Every overlapping pair is included.
+
+    The boxes are bucketed by the power of two of their largest side,
+    and each pair of buckets is searched on a grid as coarse as its larger boxes,
+    so a few large boxes don't coarsen the grid of the small ones.
+
+    :return: The indices into `bboxes1` and `bboxes2` of each pair.
+    """
+
+    if len(bboxes1) == 0 or len(bboxes2) == 0:
+        return empty(0, dtype=int64), empty(0, dtype=int64)
+
+    centers1 = (bboxes1[:, :2] + bboxes1[:, 2:]) * 0.5
+    centers2 = (bboxes2[:, :2] + bboxes2[:, 2:]) * 0.5
+    buckets1 = _size_buckets(bboxes1)
+    buckets2 = _size_buckets(bboxes2)
+
+    firsts = list()
+    seconds = list()
+    for bucket1 in sorted(set(buckets1.tolist())):
+        indices1 = flatnonzero(buckets1 == bucket1)
+        for bucket2 in sorted(set(buckets2.tolist())):
+            indices2 = flatnonzero(buckets2 == bucket2)
+            # Overlapping boxes have centers closer than the largest side,
+            # which is less than twice the bucket size.
+            cell = float(2 ** (max(bucket1, bucket2) + 1))
+            pairs = grid_neighbor_pairs(centers1[indices1], centers2[indices2], cell)
+            firsts.append(indices1[pairs[0]])
+            seconds.append(indices2[pairs[1]])
+
+    return concatenate(firsts), concatenate(seconds)
+
+
+class BlobTracker:
+    """
+    Give persistent IDs to the blobs detected in each frame.
+
+    Detections are associated with the tracks of the previous frame
+    by IoU of the bounding boxes, or by centroid distance. Only the pairs
+    in neighboring cells of a uniform grid are compared, with the boxes bucketed
+    by size in IoU mode, so the association is close to linear in the number
+    of blobs. The pairs are matched greedily,
+    from the best score.
+
+    A new track is tentative until it's matched in `min_hits` frames in a row.
+    A tentative track is removed when it's missed once,
+    a confirmed track when it's missed in more than `max_misses` frames in a row.
+    """
+
+    ids: NDArray[int64]
+    bboxes: NDArray[float64]
+    centroids: NDArray[float64]
+    hits: NDArray[int64]
+    misses: NDArray[int64]
+    ages: NDArray[int64]
+    confirmed: NDArray[bool_]
+
+    def __init__(
+        self,
+        metric: TrackMetricLike = TrackMetric.IOU,
+        min_iou=DEFAULT_TRACK_MIN_IOU,
+        max_distance=DEFAULT_TRACK_MAX_DISTANCE,
+        min_hits=DEFAULT_TRACK_MIN_HITS,
+        max_misses=DEFAULT_TRACK_MAX_MISSES,
+    ):
+        if not 0 < min_iou <= 1:
+            raise ValueError("The 'min_iou' argument must be in (0, 1]")
+        if max_distance <= 0:
+            raise ValueError("The 'max_distance' argument must be positive")
+        if min_hits < 1:
+            raise ValueError("The 'min_hits' argument must be at least 1")
+        if max_misses < 0:
+            raise ValueError("The 'max_misses' argument must not be negative")
+
+        self._metric = normalize_track_metric(metric)
+        self._min_iou = min_iou
+        self._max_distance = max_distance
+        self._min_hits = min_hits
+        self._max_misses = max_misses
+        self._next_id = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clear(self) -> None:
+        self.ids = empty(0, dtype=int64)
+        self.bboxes = empty((0, 4), dtype=float64)
+        self.centroids = empty((0, 2), dtype=float64)
+        self.hits = empty(0, dtype=int64)
+        self.misses = empty(0, dtype=int64)
+        self.ages = empty(0, dtype=int64)
+        self.confirmed = empty(0, dtype=bool_)
+
+    def _candidates(
+        self,
+        bboxes: NDArray[float64],
+        centroids: NDArray[float64],
+    ) -> Tuple[NDArray[int64], NDArray[int64], NDArray[float64]]:
+        if self._metric == TrackMetric.DISTANCE:
+            dets, tracks = grid_neighbor_pairs(
+                centroids, self.centroids, self._max_distance
+            )
+            delta = centroids[dets] - self.centroids[tracks]
+            distances = hypot(delta[:, 0], delta[:, 1])
+            valid = distances <= self._max_distance
+            # Lower costs are better.
+            return dets[valid], tracks[valid], distances[valid]
+        else:
+            dets, tracks = bbox_neighbor_pairs(bboxes, self.bboxes)
+            ious = calculate_iou_pairs(bboxes[dets], self.bboxes[tracks])
+            valid = ious >= self._min_iou
+            return dets[valid], tracks[valid], -ious[valid]
+
+    def _match(
+        self,
+        bboxes: NDArray[float64],
+        centroids: NDArray[float64],
+    ) -> NDArray[int64]:
+        if len(self.ids) == 0 or len(bboxes) == 0:
+            return full(len(bboxes), -1, dtype=int64)
+
+        dets, tracks, costs = self._candidates(bboxes, centroids)
+        order = argsort(costs, kind="stable")
+        matches = [-1] * len(bboxes)
+        taken = [False] * len(self.ids)
+        for det, track in zip(dets[order].tolist(), tracks[order].tolist()):
+            if matches[det] < 0 and not taken[track]:
+                matches[det] = track
+                taken[track] = True
+        return asarray(matches, dtype=int64)
+
+    def update(
+        self,
+        bboxes: Union[NDArray, Sequence[Sequence[float]]],
+        centroids: Optional[NDArray] = None,
+    ) -> BlobTrackResult:
+        """
+        :param bboxes: The `(x1, y1, x2, y2)` bounding boxes of the detections.
+        :param centroids: The centroids of the detections,
+            or the centers of the bounding boxes.
+        """
+
+        _bboxes = asarray(bboxes, dtype=float64).reshape(-1, 4)
+        if centroids is None:
+            _centroids = (_bboxes[:, :2] + _bboxes[:, 2:]) * 0.5
+        else:
+            _centroids = asarray(centroids, dtype=float64).reshape(-1, 2)
+            if len(_centroids) != len(_bboxes):
+                raise ValueError("The centroids do not match the bounding boxes")
+
+        matches = self._match(_bboxes, _centroids)
+        matched = matches >= 0
+        previous = matches[matched]
+
+        # The tracks that were not matched.
+        missed = ones(len(self.ids), dtype=bool_)
+        missed[previous] = False
+        misses = self.misses[missed] + 1
+        keep = self.confirmed[missed] & (misses <= self._max_misses)
+        lost = flatnonzero(missed)[keep]
+
+        births = int((~matched).sum())
+        born_ids = arange(self._next_id, self._next_id + births, dtype=int64)
+        self._next_id += births
+
+        ids = empty(len(_bboxes), dtype=int64)
+        ids[matched] = self.ids[previous]
+        ids[~matched] = born_ids
+
+        hits = ones(len(_bboxes), dtype=int64)
+        hits[matched] = self.hits[previous] + 1
+        ages = ones(len(_bboxes), dtype=int64)
+        ages[matched] = self.ages[previous] + 1
+        confirmed = hits >= self._min_hits
+        confirmed[matched] |= self.confirmed[previous]
+
+        self.ids = concatenate([ids, self.ids[lost]])
+        self.bboxes = concatenate([_bboxes, self.bboxes[lost]])
+        self.centroids = concatenate([_centroids, self.centroids[lost]])
+        self.hits = concatenate([hits, zeros(len(lost), dtype=int64)])
+        self.misses = concatenate([zeros(len(ids), dtype=int64), misses[keep]])
+        self.ages = concatenate([ages, self.ages[lost] + 1])
+        self.confirmed = concatenate([confirmed, self.confirmed[lost]])
+
+        return BlobTrackResult(ids, confirmed)
+
+    def update_contours(self, contours: Sequence[NDArray]) -> BlobTrackResult:
+        """Track contours by their bounding boxes and polygon centroids."""
+
+        table = ContourTable(contours)
+        return self.update(table.bbox, table.centroid)
+
+
+class CvlContourTrack:
+    @staticmethod
+    def cvl_create_blob_tracker(
+        metric: TrackMetricLike = TrackMetric.IOU,
+        min_iou=DEFAULT_TRACK_MIN_IOU,
+        max_distance=DEFAULT_TRACK_MAX_DISTANCE,
+        min_hits=DEFAULT_TRACK_MIN_HITS,
+        max_misses=DEFAULT_TRACK_MAX_MISSES,
+    ):
+        return BlobTracker(metric, min_iou, max_distance, min_hits, max_misses)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from cvlayer.cv.drawable.arrowed import CvlDrawableArrowed
+from cvlayer.cv.drawable.batch import CvlDrawableBatch
 from cvlayer.cv.drawable.circle import CvlDrawableCircle
 from cvlayer.cv.drawable.contours import CvlDrawableContours
 from cvlayer.cv.drawable.crosshair import CvlDrawableCrosshair
@@ -12,11 +13,13 @@ from cvlayer.cv.drawable.marker import CvlDrawableMarker
 from cvlayer.cv.drawable.plot import CvlDrawablePlot
 from cvlayer.cv.drawable.point import CvlDrawablePoint
 from cvlayer.cv.drawable.rectangle import CvlDrawableRectangle
+from cvlayer.cv.drawable.rolling_plot import CvlDrawableRollingPlot
 from cvlayer.cv.drawable.text import CvlDrawableText
 
 
 class CvlDrawable(
     CvlDrawableArrowed,
+    CvlDrawableBatch,
     CvlDrawableCircle,
     CvlDrawableContours,
     CvlDrawableCrosshair,
@@ -28,6 +31,7 @@ class CvlDrawable(
     CvlDrawablePlot,
     CvlDrawablePoint,
     CvlDrawableRectangle,
+    CvlDrawableRollingPlot,
     CvlDrawableText,
 ):
     pass
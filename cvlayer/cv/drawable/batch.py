@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Final, Iterator, List, Sequence, Tuple, Union
+
+import cv2
+from numpy import (
+    arange,
+    asarray,
+    float64,
+    floating,
+    int32,
+    integer,
+    ndarray,
+    nonzero,
+    repeat,
+    stack,
+    tile,
+    unique,
+)
+from numpy.typing import NDArray
+
+from cvlayer.cv.drawable.crosshair import (
+    CROSSHAIR_POINT_COLOR,
+    CROSSHAIR_POINT_LINE_TYPE,
+    CROSSHAIR_POINT_PADDING,
+    CROSSHAIR_POINT_RADIUS,
+    CROSSHAIR_POINT_SHIFT,
+    CROSSHAIR_POINT_THICKNESS,
+)
+from cvlayer.cv.drawable.defaults import (
+    DEFAULT_COLOR,
+    DEFAULT_LINE_TYPE,
+    DEFAULT_RADIUS,
+    DEFAULT_SHIFT,
+    DEFAULT_THICKNESS,
+)
+from cvlayer.cv.drawable.marker import DEFAULT_MARKER_SIZE, DEFAULT_MARKER_TYPE
+from cvlayer.cv.types.color import ColorLike, normalize_color
+from cvlayer.cv.types.line_type import normalize_line_type
+from cvlayer.cv.types.marker import normalize_marker
+from cvlayer.cv.types.thickness import FILLED
+
+BatchColors = Union[ColorLike, Sequence[ColorLike], NDArray]
+"""A single color for all items, or an `(N, C)` array (or sequence) of item colors."""
+
+
+def as_int_array(values, columns: int) -> NDArray:
+    """
+    Convert coordinates to an `(N, columns)` int32 array.
+    Coordinates are truncated toward zero, like `int()`.
+    """
+
+    return asarray(values, dtype=float64).reshape(-1, columns).astype(int32)
+
+
+def _is_single_color(colors: BatchColors) -> bool:
+    if isinstance(colors, (int, float, str)):
+        return True
+    if isinstance(colors, ndarray):
+        return colors.ndim == 1
+    return all(isinstance(c, (int, float, integer, floating)) for c in colors)
+
+
+def _color_table(colors: BatchColors) -> NDArray:
+    if isinstance(colors, ndarray):
+        return asarray(colors, dtype=float64)
+    elif isinstance(colors, Sequence):
+        # Item colors may be named, e.g. `["red", "blue"]`.
+        return asarray([normalize_color(c) for c in colors], dtype=float64)
+    else:
+        raise TypeError(f"Unsupported colors type: {type(colors).__name__}")
+
+
+def group_colors(colors: BatchColors, count: int) -> List[Tuple[tuple, NDArray]]:
+    """
+    Group item indices by color.
+
+    :return: The `(color, indices)` pairs, in order of the first item of each color.
+    """
+
+    if _is_single_color(colors):
+        single = normalize_color(colors)  # type: ignore[arg-type]
+        return [(tuple(float(c) for c in single), arange(count))]
+
+    table = _color_table(colors)
+    if table.ndim != 2 or len(table) != count:
+        raise ValueError(f"The colors must have {count} rows: {table.shape}")
+
+    palette, first, inverse = unique(
+        table, axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.reshape(-1)
+    groups = list()
+    for group in first.argsort():
+        indices = nonzero(inverse == group)[0]
+        groups.append((tuple(float(c) for c in palette[group]), indices))
+    return groups
+
+
+def _iter_groups(
+    items: Sequence, colors: BatchColors
+) -> Iterator[Tuple[tuple, List[NDArray]]]:
+    for color, indices in group_colors(colors, len(items)):
+        yield color, [items[i] for i in indices]
+
+
+# The unit `(x1, y1, x2, y2)` segments of each marker, scaled by half of the size.
+_MARKER_SEGMENTS: Final[Dict[int, Sequence[Tuple[int, int, int, int]]]] = {
+    cv2.MARKER_CROSS: ((-1, 0, 1, 0), (0, -1, 0, 1)),
+    cv2.MARKER_TILTED_CROSS: ((-1, -1, 1, 1), (1, -1, -1, 1)),
+    cv2.MARKER_STAR: (
+        (-1, 0, 1, 0),
+        (0, -1, 0, 1),
+        (-1, -1, 1, 1),
+        (1, -1, -1, 1),
+    ),
+    cv2.MARKER_DIAMOND: (
+        (0, -1, 1, 0),
+        (1, 0, 0, 1),
+        (0, 1, -1, 0),
+        (-1, 0, 0, -1),
+    ),
+    cv2.MARKER_SQUARE: (
+        (-1, -1, 1, -1),
+        (1, -1, 1, 1),
+        (1, 1, -1, 1),
+        (-1, 1, -1, -1),
+    ),
+    cv2.MARKER_TRIANGLE_UP: (
+        (-1, 1, 1, 1),
+        (1, 1, 0, -1),
+        (0, -1, -1, 1),
+    ),
+    cv2.MARKER_TRIANGLE_DOWN: (
+        (-1, -1, 1, -1),
+        (1, -1, 0, 1),
+        (0, 1, -1, -1),
+    ),
+}
+
+
+def draw_polylines_batch(
+    image: NDArray,
+    polylines: Sequence[Union[NDArray, Sequence]],
+    colors: BatchColors = DEFAULT_COLOR,
+    closed=False,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    """
+    Draw polylines with one `cv2.polylines` call per color.
+    With `FILLED` thickness, each color group is filled with one `cv2.fillPoly` call,
+    so the areas where polygons of the same color overlap follow the even-odd rule.
+    """
+
+    curves = [as_int_array(p, 2).reshape(-1, 1, 2) for p in polylines]
+    _line = normalize_line_type(line)
+    for color, group in _iter_groups(curves, colors):
+        if thickness < 0:
+            cv2.fillPoly(image, group, color, _line, shift)
+        else:
+            cv2.polylines(image, group, closed, color, thickness, _line, shift)
+    return image
+
+
+def draw_lines_batch(
+    image: NDArray,
+    lines: Union[NDArray, Sequence],
+    colors: BatchColors = DEFAULT_COLOR,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    """
+    :param lines: The `(N, 4)` segments as `x1, y1, x2, y2` rows.
+    """
+
+    segments = as_int_array(lines, 4).reshape(-1, 2, 1, 2)
+    _line = normalize_line_type(line)
+    for color, indices in group_colors(colors, len(segments)):
+        group = list(segments[indices])
+        cv2.polylines(image, group, False, color, thickness, _line, shift)
+    return image
+
+
+def draw_rectangles_batch(
+    image: NDArray,
+    boxes: Union[NDArray, Sequence],
+    colors: BatchColors = DEFAULT_COLOR,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    """
+    :param boxes: The `(N, 4)` boxes as `x1, y1, x2, y2` rows.
+    """
+
+    rects = as_int_array(boxes, 4)
+    _line = normalize_line_type(line)
+
+    if thickness < 0:
+        # `cv2.fillPoly` would cut out the areas where the boxes overlap.
+        for color, indices in group_colors(colors, len(rects)):
+            for x1, y1, x2, y2 in rects[indices].tolist():
+                cv2.rectangle(image, (x1, y1), (x2, y2), color, FILLED, _line, shift)
+        return image
+
+    # The outline of `cv2.rectangle` is a closed polyline of its corners.
+    x1, y1, x2, y2 = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+    corners = stack([x1, y1, x2, y1, x2, y2, x1, y2], axis=-1).reshape(-1, 4, 1, 2)
+    for color, indices in group_colors(colors, len(rects)):
+        group = list(corners[indices])
+        cv2.polylines(image, group, True, color, thickness, _line, shift)
+    return image
+
+
+def draw_points_batch(
+    image: NDArray,
+    points: Union[NDArray, Sequence],
+    colors: BatchColors = DEFAULT_COLOR,
+    radius=DEFAULT_RADIUS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    """
+    Draw filled circles, like `draw_point`.
+    """
+
+    return draw_circles_batch(image, points, colors, radius, FILLED, line, shift)
+
+
+def draw_circles_batch(
+    image: NDArray,
+    centers: Union[NDArray, Sequence],
+    colors: BatchColors = DEFAULT_COLOR,
+    radius=DEFAULT_RADIUS,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    xy = as_int_array(centers, 2)
+    _line = normalize_line_type(line)
+    for color, indices in group_colors(colors, len(xy)):
+        for x, y in xy[indices].tolist():
+            cv2.circle(image, (x, y), radius, color, thickness, _line, shift)
+    return image
+
+
+def draw_markers_batch(
+    image: NDArray,
+    points: Union[NDArray, Sequence],
+    colors: BatchColors = DEFAULT_COLOR,
+    marker=DEFAULT_MARKER_TYPE,
+    size=DEFAULT_MARKER_SIZE,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+) -> NDArray:
+    xy = as_int_array(points, 2)
+    _marker = normalize_marker(marker)
+    offsets = _MARKER_SEGMENTS.get(_marker)
+    if offsets is None:
+        raise ValueError(f"Unsupported marker type: {marker}")
+
+    # `cv2.drawMarker` draws the same segments with `cv2.line`.
+    half = int(size) // 2
+    origins = tile(xy, 2)[:, None, :]
+    segments = (origins + asarray(offsets, dtype=int32) * half).reshape(-1, 4)
+    if _is_single_color(colors):
+        segment_colors: BatchColors = colors
+    else:
+        segment_colors = repeat(_color_table(colors), len(offsets), axis=0)
+    return draw_lines_batch(image, segments, segment_colors, thickness, line)
+
+
+def draw_crosshairs_batch(
+    image: NDArray,
+    points: Union[NDArray, Sequence],
+    colors: BatchColors = CROSSHAIR_POINT_COLOR,
+    radius=CROSSHAIR_POINT_RADIUS,
+    thickness=CROSSHAIR_POINT_THICKNESS,
+    line=CROSSHAIR_POINT_LINE_TYPE,
+    shift=CROSSHAIR_POINT_SHIFT,
+    padding=CROSSHAIR_POINT_PADDING,
+    circle=True,
+) -> NDArray:
+    """
+    Draw crosshairs, like `draw_crosshair`.
+    All the line segments of a color are drawn with one `cv2.polylines` call.
+    """
+
+    xy = as_int_array(points, 2)
+    x = xy[:, 0]
+    y = xy[:, 1]
+
+    if padding == 0:
+        segments = [
+            (x - radius, y, x + radius, y),
+            (x, y - radius, x, y + radius),
+        ]
+    else:
+        outer = radius + padding
+        segments = [
+            (x - outer, y, x - padding, y),
+            (x, y - outer, x, y - padding),
+            (x + outer, y, x + padding, y),
+            (x, y + outer, x, y + padding),
+        ]
+
+    per_point = len(segments)
+    lines = stack([stack(s, axis=-1) for s in segments], axis=1).reshape(-1, 4)
+    if _is_single_color(colors):
+        line_colors: BatchColors = colors
+    else:
+        line_colors = repeat(_color_table(colors), per_point, axis=0)
+
+    draw_lines_batch(image, lines, line_colors, thickness, line, shift)
+    if circle:
+        draw_circles_batch(image, xy, colors, radius, thickness, line, shift)
+    return image
+
+
+class CvlDrawableBatch:
+    @staticmethod
+    def cvl_draw_polylines_batch(
+        image: NDArray,
+        polylines: Sequence[Union[NDArray, Sequence]],
+        colors: BatchColors = DEFAULT_COLOR,
+        closed=False,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        shift=DEFAULT_SHIFT,
+    ):
+        return draw_polylines_batch(
+            image, polylines, colors, closed, thickness, line, shift
+        )
+
+    @staticmethod
+    def cvl_draw_lines_batch(
+        image: NDArray,
+        lines: Union[NDArray, Sequence],
+        colors: BatchColors = DEFAULT_COLOR,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        shift=DEFAULT_SHIFT,
+    ):
+        return draw_lines_batch(image, lines, colors, thickness, line, shift)
+
+    @staticmethod
+    def cvl_draw_rectangles_batch(
+        image: NDArray,
+        boxes: Union[NDArray, Sequence],
+        colors: BatchColors = DEFAULT_COLOR,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        shift=DEFAULT_SHIFT,
+    ):
+        return draw_rectangles_batch(image, boxes, colors, thickness, line, shift)
+
+    @staticmethod
+    def cvl_draw_points_batch(
+        image: NDArray,
+        points: Union[NDArray, Sequence],
+        colors: BatchColors = DEFAULT_COLOR,
+        radius=DEFAULT_RADIUS,
+        line=DEFAULT_LINE_TYPE,
+        shift=DEFAULT_SHIFT,
+    ):
+        return draw_points_batch(image, points, colors, radius, line, shift)
+
+    @staticmethod
+    def cvl_draw_circles_batch(
+        image: NDArray,
+        centers: Union[NDArray, Sequence],
+        colors: BatchColors = DEFAULT_COLOR,
+        radius=DEFAULT_RADIUS,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        shift=DEFAULT_SHIFT,
+    ):
+        return draw_circles_batch(
+            image, centers, colors, radius, thickness, line, shift
+        )
+
+    @staticmethod
+    def cvl_draw_markers_batch(
+        image: NDArray,
+        points: Union[NDArray, Sequence],
+        colors: BatchColors = DEFAULT_COLOR,
+        marker=DEFAULT_MARKER_TYPE,
+        size=DEFAULT_MARKER_SIZE,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+    ):
+        return draw_markers_batch(image, points, colors, marker, size, thickness, line)
+
+    @staticmethod
+    def cvl_draw_crosshairs_batch(
+        image: NDArray,
+        points: Union[NDArray, Sequence],
+        colors: BatchColors = CROSSHAIR_POINT_COLOR,
+        radius=CROSSHAIR_POINT_RADIUS,
+        thickness=CROSSHAIR_POINT_THICKNESS,
+        line=CROSSHAIR_POINT_LINE_TYPE,
+        padding=CROSSHAIR_POINT_PADDING,
+        circle=True,
+    ):
+        return draw_crosshairs_batch(
+            image,
+            points,
+            colors,
+            radius,
+            thickness,
+            line,
+            padding=padding,
+            circle=circle,
+        )
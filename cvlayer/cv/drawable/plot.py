@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum, auto, unique
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 
+import cv2
+from numpy import asarray, float64, full_like, int32, stack
 from numpy.typing import NDArray
 
 from cvlayer.cv.drawable.defaults import (
@@ -12,9 +14,9 @@ from cvlayer.cv.drawable.defaults import (
     DEFAULT_SHIFT,
     DEFAULT_THICKNESS,
 )
-from cvlayer.cv.drawable.line import draw_line
-from cvlayer.cv.drawable.point import draw_point
-from cvlayer.cv.drawable.rectangle import draw_rectangle
+from cvlayer.cv.types.color import normalize_color
+from cvlayer.cv.types.line_type import normalize_line_type
+from cvlayer.cv.types.thickness import FILLED
 from cvlayer.typing import Number, PointN, RectI
 
 
@@ -26,6 +28,76 @@ class PlotMode(Enum):
     BAR_Y = auto()
 
 
+def as_plot_points(points: Union[NDArray, Sequence[PointN]]) -> NDArray:
+    """
+    Convert points to an `(N, 2)` int32 array for the OpenCV drawing functions.
+    Coordinates are truncated toward zero, like `int()`.
+    """
+
+    return asarray(points, dtype=float64).reshape(-1, 2).astype(int32)
+
+
+def _draw_plot_points(
+    canvas: NDArray,
+    points: NDArray,
+    radius=DEFAULT_RADIUS,
+    color=DEFAULT_COLOR,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    _color = normalize_color(color)
+    _line = normalize_line_type(line)
+    for x, y in points.tolist():
+        cv2.circle(canvas, (x, y), radius, _color, FILLED, _line, shift)
+    return canvas
+
+
+def _draw_plot_lines(
+    canvas: NDArray,
+    points: NDArray,
+    color=DEFAULT_COLOR,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    if len(points) < 2:
+        return canvas
+    _color = normalize_color(color)
+    _line = normalize_line_type(line)
+    curve = points.reshape(-1, 1, 2)
+    return cv2.polylines(canvas, [curve], False, _color, thickness, _line, shift)
+
+
+def _draw_plot_bars(
+    canvas: NDArray,
+    x1: NDArray,
+    y1: NDArray,
+    x2: NDArray,
+    y2: NDArray,
+    color=DEFAULT_COLOR,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    shift=DEFAULT_SHIFT,
+) -> NDArray:
+    _color = normalize_color(color)
+    _line = normalize_line_type(line)
+    corners = stack([x1, y1, x2, y1, x2, y2, x1, y2], axis=-1)
+    corners = as_plot_points(corners).reshape(-1, 4, 2)
+
+    if thickness > 0:
+        # The outline of `cv2.rectangle` is a closed polyline of its corners.
+        return cv2.polylines(
+            canvas, list(corners), True, _color, thickness, _line, shift
+        )
+
+    # `cv2.fillPoly` would cut the overlapping bars out, so fill them one by one.
+    for (left, top), _, (right, bottom), _ in corners.tolist():
+        p1 = left, top
+        p2 = right, bottom
+        cv2.rectangle(canvas, p1, p2, _color, thickness, _line, shift)
+    return canvas
+
+
 def draw_absolute_plot_points(
     canvas: NDArray,
     *points: PointN,
@@ -34,9 +106,8 @@ def draw_absolute_plot_points(
     line=DEFAULT_LINE_TYPE,
     shift=DEFAULT_SHIFT,
 ) -> NDArray:
-    for point in points:
-        draw_point(canvas, point, radius, color, line, shift)
-    return canvas
+    xy = as_plot_points(points)
+    return _draw_plot_points(canvas, xy, radius, color, line, shift)
 
 
 def draw_absolute_plot_lines(
@@ -47,11 +118,8 @@ def draw_absolute_plot_lines(
     line=DEFAULT_LINE_TYPE,
     shift=DEFAULT_SHIFT,
 ) -> NDArray:
-    prev = points[0]
-    for point in points[1:]:
-        draw_line(canvas, prev, point, color, thickness, line, shift)
-        prev = point
-    return canvas
+    xy = as_plot_points(points)
+    return _draw_plot_lines(canvas, xy, color, thickness, line, shift)
 
 
 def draw_absolute_plot_x_bars(
@@ -64,14 +132,13 @@ def draw_absolute_plot_x_bars(
     line=DEFAULT_LINE_TYPE,
     shift=DEFAULT_SHIFT,
 ) -> NDArray:
-    for point in points:
-        x1 = point[0] - radius
-        y1 = point[1]
-        x2 = point[0] + radius
-        y2 = bottom
-        roi = x1, y1, x2, y2
-        draw_rectangle(canvas, roi, color, thickness, line, shift)
-    return canvas
+    xy = asarray(points, dtype=float64).reshape(-1, 2)
+    xs = xy[:, 0]
+    ys = xy[:, 1]
+    bottoms = full_like(ys, bottom)
+    return _draw_plot_bars(
+        canvas, xs - radius, ys, xs + radius, bottoms, color, thickness, line, shift
+    )
 
 
 def draw_absolute_plot_y_bars(
@@ -84,19 +151,18 @@ def draw_absolute_plot_y_bars(
     line=DEFAULT_LINE_TYPE,
     shift=DEFAULT_SHIFT,
 ) -> NDArray:
-    for point in points:
-        x1 = left
-        y1 = point[1] - radius
-        x2 = point[0]
-        y2 = point[1] + radius
-        roi = x1, y1, x2, y2
-        draw_rectangle(canvas, roi, color, thickness, line, shift)
-    return canvas
+    xy = asarray(points, dtype=float64).reshape(-1, 2)
+    xs = xy[:, 0]
+    ys = xy[:, 1]
+    lefts = full_like(xs, left)
+    return _draw_plot_bars(
+        canvas, lefts, ys - radius, xs, ys + radius, color, thickness, line, shift
+    )
 
 
 def draw_plot_2d(
     canvas: NDArray,
-    *datasets: Sequence[Number],
+    *datasets: Union[NDArray, Sequence[Number]],
     roi: Optional[RectI] = None,
     mode=PlotMode.POINT,
     color=DEFAULT_COLOR,
@@ -111,20 +177,20 @@ def draw_plot_2d(
 ) -> NDArray:
     if len(datasets) != 2:
         raise ValueError("There must be 2 datasets")
-    if datasets[0] == 0:
+    if len(datasets[0]) == 0:
         raise ValueError("The datasets[0] must exist")
-    if datasets[1] == 0:
+    if len(datasets[1]) == 0:
         raise ValueError("The datasets[1] must exist")
 
-    xs = datasets[0]
-    ys = datasets[1]
+    xs = asarray(datasets[0], dtype=float64).ravel()
+    ys = asarray(datasets[1], dtype=float64).ravel()
     if len(xs) != len(ys):
         raise ValueError("The dataset size must be the same")
 
-    min_x = min_x if min_x is not None else min(xs)
-    max_x = max_x if max_x is not None else max(xs)
-    min_y = min_y if min_y is not None else min(ys)
-    max_y = max_y if max_y is not None else max(ys)
+    min_x = min_x if min_x is not None else float(xs.min())
+    max_x = max_x if max_x is not None else float(xs.max())
+    min_y = min_y if min_y is not None else float(ys.min())
+    max_y = max_y if max_y is not None else float(ys.max())
     assert min_x is not None
     assert max_x is not None
     assert min_y is not None
@@ -147,53 +213,25 @@ def draw_plot_2d(
     if width * height == 0:
         raise ValueError("There is no area to draw")
 
-    def canvas_x(real_x: Number):
-        return left + (real_x / x_size * width)
-
-    def canvas_y(real_y: Number):
-        return bottom - (real_y / y_size * height)
-
-    points = [(canvas_x(x), canvas_y(y)) for x, y in zip(xs, ys)]
+    canvas_xs = left + (xs / x_size * width)
+    canvas_ys = bottom - (ys / y_size * height)
 
     if mode == PlotMode.POINT:
-        draw_absolute_plot_points(
-            canvas,
-            *points,
-            radius=radius,
-            color=color,
-            line=line,
-        )
+        points = as_plot_points(stack([canvas_xs, canvas_ys], axis=-1))
+        _draw_plot_points(canvas, points, radius, color, line, shift)
     elif mode == PlotMode.LINE:
-        draw_absolute_plot_lines(
-            canvas,
-            *points,
-            color=color,
-            thickness=thickness,
-            line=line,
-            shift=shift,
-        )
+        points = as_plot_points(stack([canvas_xs, canvas_ys], axis=-1))
+        _draw_plot_lines(canvas, points, color, thickness, line, shift)
     elif mode == PlotMode.BAR_X:
-        draw_absolute_plot_x_bars(
-            canvas,
-            *points,
-            bottom=bottom,
-            radius=radius,
-            color=color,
-            thickness=thickness,
-            line=line,
-            shift=shift,
-        )
+        x1 = canvas_xs - radius
+        x2 = canvas_xs + radius
+        y2 = full_like(canvas_ys, bottom)
+        _draw_plot_bars(canvas, x1, canvas_ys, x2, y2, color, thickness, line, shift)
     elif mode == PlotMode.BAR_Y:
-        draw_absolute_plot_y_bars(
-            canvas,
-            *points,
-            left=left,
-            radius=radius,
-            color=color,
-            thickness=thickness,
-            line=line,
-            shift=shift,
-        )
+        x1 = full_like(canvas_xs, left)
+        y1 = canvas_ys - radius
+        y2 = canvas_ys + radius
+        _draw_plot_bars(canvas, x1, y1, canvas_xs, y2, color, thickness, line, shift)
     else:
         raise ValueError(f"Unknown plot mode: {mode}")
 
@@ -204,7 +242,7 @@ class CvlDrawablePlot:
     @staticmethod
     def cvl_draw_plot_2d(
         canvas: NDArray,
-        *datasets: Sequence[Number],
+        *datasets: Union[NDArray, Sequence[Number]],
         roi: Optional[RectI] = None,
         color=DEFAULT_COLOR,
         thickness=DEFAULT_THICKNESS,
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+from typing import Final, Iterable, Optional, Tuple
+
+import cv2
+from numpy import arange, empty, float64, full, int32, isfinite, uint8
+from numpy.typing import NDArray
+
+from cvlayer.cv.drawable.defaults import DEFAULT_FONT_FACE, DEFAULT_LINE_TYPE
+from cvlayer.cv.drawable.text.measure import get_text_size
+from cvlayer.cv.types.color import Color, normalize_color
+from cvlayer.cv.types.font_face import normalize_font_face
+from cvlayer.cv.types.line_type import normalize_line_type
+from cvlayer.palette.basic import BLACK, WHITE, YELLOW
+from cvlayer.typing import Number, RectI
+
+DEFAULT_ROLLING_PLOT_CAPACITY: Final[int] = 256
+DEFAULT_ROLLING_PLOT_COLOR: Final[Color] = YELLOW
+DEFAULT_ROLLING_PLOT_THICKNESS: Final[int] = 1
+DEFAULT_ROLLING_PLOT_BACKGROUND_COLOR: Final[Color] = BLACK
+DEFAULT_ROLLING_PLOT_BACKGROUND_ALPHA: Final[float] = 0.4
+DEFAULT_ROLLING_PLOT_TEXT_COLOR: Final[Color] = WHITE
+DEFAULT_ROLLING_PLOT_FONT_SCALE: Final[float] = 0.4
+DEFAULT_ROLLING_PLOT_PADDING: Final[int] = 4
+
+
+class RollingPlot:
+    """
+    A time-series plot over the last `capacity` values.
+
+    Values are kept in a preallocated ring buffer, so `append()` is O(1).
+    The y-axis range follows the data: it grows immediately when a value exceeds it,
+    and it is recomputed lazily only when the value that defined it is overwritten.
+    Fixed bounds can be given with `min_y` and `max_y`.
+    """
+
+    _values: NDArray
+    _xs_cache: Optional[Tuple[Tuple[int, int], NDArray]]
+
+    def __init__(
+        self,
+        capacity=DEFAULT_ROLLING_PLOT_CAPACITY,
+        label: Optional[str] = None,
+        color=DEFAULT_ROLLING_PLOT_COLOR,
+        thickness=DEFAULT_ROLLING_PLOT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        min_y: Optional[Number] = None,
+        max_y: Optional[Number] = None,
+        background_color=DEFAULT_ROLLING_PLOT_BACKGROUND_COLOR,
+        background_alpha=DEFAULT_ROLLING_PLOT_BACKGROUND_ALPHA,
+        text_color=DEFAULT_ROLLING_PLOT_TEXT_COLOR,
+        font=DEFAULT_FONT_FACE,
+        font_scale=DEFAULT_ROLLING_PLOT_FONT_SCALE,
+        padding=DEFAULT_ROLLING_PLOT_PADDING,
+    ):
+        if capacity < 2:
+            raise ValueError("The 'capacity' argument must be at least 2")
+        if not 0 <= background_alpha <= 1:
+            raise ValueError("The 'background_alpha' argument must be in [0, 1]")
+
+        self._values = empty(capacity, dtype=float64)
+        self._head = 0
+        self._count = 0
+        self._min = 0.0
+        self._max = 0.0
+        self._has_range = False
+        self._range_dirty = False
+
+        self.label = label
+        self.min_y = min_y
+        self.max_y = max_y
+        self._color = normalize_color(color)
+        self._thickness = thickness
+        self._line = normalize_line_type(line)
+        self._background_color = normalize_color(background_color)
+        self._background_alpha = background_alpha
+        self._text_color = normalize_color(text_color)
+        self._font = normalize_font_face(font)
+        self._font_scale = font_scale
+        self._padding = padding
+        self._xs_cache = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self._values)
+
+    @property
+    def last(self) -> Optional[float]:
+        if self._count == 0:
+            return None
+        return float(self._values[self._head - 1])
+
+    @property
+    def values(self) -> NDArray:
+        """A copy of the values in insertion order."""
+
+        capacity = len(self._values)
+        if self._count < capacity:
+            return self._values[: self._count].copy()
+        head = self._head
+        result = empty(capacity, dtype=float64)
+        result[: capacity - head] = self._values[head:]
+        result[capacity - head :] = self._values[:head]
+        return result
+
+    @property
+    def range(self) -> Tuple[float, float]:
+        """The y-axis range; `(0, 0)` when there are no finite values."""
+
+        if self._range_dirty:
+            self._update_range()
+        min_y = self._min if self.min_y is None else float(self.min_y)
+        max_y = self._max if self.max_y is None else float(self.max_y)
+        return min_y, max_y
+
+    def _update_range(self) -> None:
+        data = self._values[: self._count]
+        finite = data[isfinite(data)]
+        self._has_range = len(finite) > 0
+        self._min = float(finite.min()) if self._has_range else 0.0
+        self._max = float(finite.max()) if self._has_range else 0.0
+        self._range_dirty = False
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+        self._min = 0.0
+        self._max = 0.0
+        self._has_range = False
+        self._range_dirty = False
+
+    def append(self, value: Number) -> None:
+        value = float(value)
+        capacity = len(self._values)
+
+        if self._count == capacity and not self._range_dirty:
+            dropped = self._values[self._head]
+            if dropped <= self._min or dropped >= self._max:
+                self._range_dirty = True
+
+        self._values[self._head] = value
+        self._head = (self._head + 1) % capacity
+        self._count = min(self._count + 1, capacity)
+
+        if self._range_dirty or not isfinite(value):
+            return
+        if self._has_range:
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+        else:
+            self._min = value
+            self._max = value
+            self._has_range = True
+
+    def extend(self, values: Iterable[Number]) -> None:
+        for value in values:
+            self.append(value)
+
+    def _xs(self, left: int, width: int) -> NDArray:
+        key = left, width
+        if self._xs_cache is None or self._xs_cache[0] != key:
+            step = (width - 1) / (len(self._values) - 1)
+            xs = (left + arange(len(self._values)) * step).astype(int32)
+            self._xs_cache = key, xs
+        return self._xs_cache[1]
+
+    def _points(self, roi: RectI) -> NDArray:
+        x1, y1, x2, y2 = roi
+        capacity = len(self._values)
+        count = self._count
+
+        min_y, max_y = self.range
+        y_size = max_y - min_y
+        if y_size <= 0:
+            # A flat series is drawn through the middle.
+            y_size = 2.0
+            min_y -= 1.0
+
+        # The newest value is always at the right edge.
+        xs = self._xs(x1, x2 - x1)[capacity - count :]
+        points = empty((count, 2), dtype=int32)
+        points[:, 0] = xs
+
+        values = self.values if count == capacity else self._values[:count]
+        scale = (y2 - y1 - 1) / y_size
+        ys = (y2 - 1) - (values - min_y) * scale
+        ys = ys.clip(y1, y2 - 1)
+        ys[~isfinite(ys)] = y2 - 1
+        points[:, 1] = ys
+        return points
+
+    def draw(self, canvas: NDArray, roi: RectI) -> NDArray:
+        """
+        Draw the plot into the `roi` of `canvas` in place.
+        """
+
+        height, width = canvas.shape[0], canvas.shape[1]
+        x1 = max(min(roi[0], roi[2]), 0)
+        y1 = max(min(roi[1], roi[3]), 0)
+        x2 = min(max(roi[0], roi[2]), width)
+        y2 = min(max(roi[1], roi[3]), height)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return canvas
+
+        area = canvas[y1:y2, x1:x2]
+        background_color = self._background_color[:3]
+        if self._background_alpha >= 1:
+            area[...] = background_color
+        elif self._background_alpha > 0:
+            background = full(area.shape, background_color, dtype=uint8)
+            alpha = self._background_alpha
+            beta = 1.0 - alpha
+            area[...] = cv2.addWeighted(area, beta, background, alpha, 0)
+
+        p = self._padding
+        plot_roi = x1 + p, y1 + p, x2 - p, y2 - p
+        if plot_roi[2] - plot_roi[0] < 2 or plot_roi[3] - plot_roi[1] < 2:
+            return canvas
+
+        if self._count >= 2:
+            points = self._points(plot_roi).reshape(-1, 1, 2)
+            cv2.polylines(
+                canvas, [points], False, self._color, self._thickness, self._line
+            )
+
+        if self.label is not None:
+            last = self.last
+            text = self.label if last is None else f"{self.label}: {last:.3g}"
+            (_, text_height), _ = get_text_size(text, self._font, self._font_scale, 1)
+            org = x1 + p, y1 + p + text_height
+            cv2.putText(
+                canvas,
+                text,
+                org,
+                self._font,
+                self._font_scale,
+                self._text_color,
+                1,
+                self._line,
+            )
+
+        return canvas
+
+
+class CvlDrawableRollingPlot:
+    @staticmethod
+    def cvl_create_rolling_plot(
+        capacity=DEFAULT_ROLLING_PLOT_CAPACITY,
+        label: Optional[str] = None,
+        color=DEFAULT_ROLLING_PLOT_COLOR,
+        min_y: Optional[Number] = None,
+        max_y: Optional[Number] = None,
+    ):
+        return RollingPlot(capacity, label, color, min_y=min_y, max_y=max_y)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from cvlayer.cv.drawable.text.atlas import CvlDrawableTextAtlas
 from cvlayer.cv.drawable.text.measure import CvlDrawableTextMeasure
 from cvlayer.cv.drawable.text.multiline import CvlDrawableTextMultiline
 from cvlayer.cv.drawable.text.outline import CvlDrawableTextOutline
@@ -7,6 +8,7 @@ from cvlayer.cv.drawable.text.text import CvlDrawableTextText
 
 
 class CvlDrawableText(
+    CvlDrawableTextAtlas,
     CvlDrawableTextMeasure,
     CvlDrawableTextMultiline,
     CvlDrawableTextOutline,
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from functools import lru_cache
+from math import ceil, gcd
+from typing import Dict, Final, List, Optional, Sequence, Tuple
+
+import cv2
+from numpy import full, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.drawable.defaults import (
+    DEFAULT_FONT_COLOR,
+    DEFAULT_FONT_FACE,
+    DEFAULT_FONT_SCALE,
+    DEFAULT_LINE_TYPE,
+    DEFAULT_TEXT_ORIGIN,
+    DEFAULT_THICKNESS,
+)
+from cvlayer.cv.drawable.text.text import draw_text_coord
+from cvlayer.cv.types.color import normalize_color
+from cvlayer.cv.types.font_face import normalize_font_face
+from cvlayer.cv.types.line_type import LINE_AA, normalize_line_type
+from cvlayer.cv.types.text_origin import normalize_text_origin
+from cvlayer.typing import Number, PointN, RectI
+
+DEFAULT_GLYPH_ATLAS_SIZE: Final[int] = 1024
+SHARED_GLYPH_ATLASES: Final[int] = 32
+
+XY_SHIFT: Final[int] = 16
+"""The fixed-point precision of the glyph positions in `cv2.putText`."""
+
+XY_ONE: Final[int] = 1 << XY_SHIFT
+XY_MASK: Final[int] = XY_ONE - 1
+
+HERSHEY_MAX_EXTENT: Final[int] = 66
+"""An upper bound of the glyph coordinates of the Hershey fonts, in font units."""
+
+
+class _Glyph:
+    __slots__ = ("mask", "x", "y")
+
+    def __init__(self, mask: Optional[NDArray], x: int, y: int):
+        self.mask = mask
+        self.x = x
+        self.y = y
+
+
+class GlyphAtlas:
+    """
+    Pre-rasterized Hershey font glyphs of one font, scale, thickness and line type.
+
+    `cv2.putText` places glyphs at 16-bit fixed-point positions,
+    so each glyph is rasterized once per character and sub-pixel phase.
+    Drawing composes the glyph masks of the text and paints the text box only.
+
+    Without anti-aliasing, the output is identical to `cv2.putText`.
+    Anti-aliased text is composed from its coverage,
+    so the output can differ from `cv2.putText` by a few levels at the glyph edges.
+
+    Text with characters other than printable ASCII,
+    text that is not fully inside the image and non-8-bit images
+    are drawn with `cv2.putText`.
+    """
+
+    _glyphs: OrderedDict[Tuple[str, int], _Glyph]
+    _advances: Dict[str, int]
+    _foreground_buffer: Optional[NDArray]
+    _foreground_value: Optional[Tuple[float, ...]]
+
+    def __init__(
+        self,
+        font=DEFAULT_FONT_FACE,
+        scale=DEFAULT_FONT_SCALE,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        origin=DEFAULT_TEXT_ORIGIN,
+        max_glyphs=DEFAULT_GLYPH_ATLAS_SIZE,
+    ):
+        if scale <= 0:
+            raise ValueError("The 'scale' argument must be positive")
+        if thickness < 1:
+            raise ValueError("The 'thickness' argument must be at least 1")
+
+        self._font = normalize_font_face(font)
+        self._scale = scale
+        self._thickness = thickness
+        self._line = normalize_line_type(line)
+        self._bottom_left = normalize_text_origin(origin)
+        self._max_glyphs = max_glyphs
+
+        # `cvRound()` rounds half to even, like `round()`.
+        self._hscale = round(scale * XY_ONE)
+        self._margin = ceil(HERSHEY_MAX_EXTENT * scale) + thickness + 2
+        self._glyphs = OrderedDict()
+        self._advances = dict()
+        self._foreground_buffer = None
+        self._foreground_value = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def clear(self) -> None:
+        self._glyphs.clear()
+
+    def advance(self, char: str) -> int:
+        """The advance width of a character in font units."""
+
+        advance = self._advances.get(char)
+        if advance is None:
+            (advance, _), _ = cv2.getTextSize(char, self._font, 1.0, 0)
+            self._advances[char] = advance
+        return advance
+
+    def _gap(self) -> str:
+        # Spaces that move the pen far enough without changing its sub-pixel phase.
+        space = self.advance(" ")
+        step = (space * self._hscale) & XY_MASK
+        period = XY_ONE // gcd(step, XY_ONE)
+        distance = period * space * self._scale
+        return " " * (period * ceil(self._margin * 2 / distance))
+
+    def _rasterize(self, prefix: str, char: str) -> _Glyph:
+        # The glyph is rendered after the same prefix as in the text,
+        # so it has the same sub-pixel phase. The prefix is pushed out of the canvas.
+        context = prefix + self._gap()
+        units = sum(self.advance(c) for c in context)
+        pen = units * self._hscale
+
+        margin = self._margin
+        width = ceil(self.advance(char) * self._scale) + margin * 2
+        height = margin * 2
+        canvas = zeros((height, width), dtype=uint8)
+        org = margin - (pen >> XY_SHIFT), margin
+        cv2.putText(
+            canvas,
+            context + char,
+            org,
+            self._font,
+            self._scale,
+            (255,),
+            self._thickness,
+            self._line,
+            self._bottom_left,
+        )
+
+        ys, xs = canvas.nonzero()
+        if len(xs) == 0:
+            return _Glyph(None, 0, 0)
+
+        x1, x2 = int(xs.min()), int(xs.max()) + 1
+        y1, y2 = int(ys.min()), int(ys.max()) + 1
+        # The mask is the transmittance of the glyph, `255 - coverage`.
+        transmittance = 255 - canvas[y1:y2, x1:x2]
+        return _Glyph(transmittance, x1 - margin, y1 - margin)
+
+    def _glyph(self, text: str, index: int, phase: int) -> _Glyph:
+        char = text[index]
+        key = char, phase
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self._glyphs.move_to_end(key)
+            self._hits += 1
+            return glyph
+
+        self._misses += 1
+        glyph = self._rasterize(text[:index], char)
+        self._glyphs[key] = glyph
+        while len(self._glyphs) > self._max_glyphs:
+            self._glyphs.popitem(last=False)
+        return glyph
+
+    def _layout(self, text: str, x: int, y: int) -> List[Tuple[NDArray, int, int]]:
+        result = list()
+        units = 0
+        for index, char in enumerate(text):
+            pen = units * self._hscale
+            glyph = self._glyph(text, index, pen & XY_MASK)
+            if glyph.mask is not None:
+                gx = x + (pen >> XY_SHIFT) + glyph.x
+                gy = y + glyph.y
+                result.append((glyph.mask, gx, gy))
+            units += self.advance(char)
+        return result
+
+    def _put_text(self, image: NDArray, text: str, org: Tuple[int, int], color):
+        return cv2.putText(
+            image,
+            text,
+            org,
+            self._font,
+            self._scale,
+            color,
+            self._thickness,
+            self._line,
+            self._bottom_left,
+        )
+
+    def _foreground(self, shape: Tuple[int, ...], color: Sequence[float]) -> NDArray:
+        channels = shape[2] if len(shape) == 3 else 1
+        value = tuple(color[i] if i < len(color) else 0 for i in range(channels))
+
+        buffer = self._foreground_buffer
+        if (
+            buffer is None
+            or self._foreground_value != value
+            or buffer.shape[0] < shape[0]
+            or buffer.shape[1] < shape[1]
+            or buffer.shape[2:] != shape[2:]
+        ):
+            height = max(shape[0], 0 if buffer is None else buffer.shape[0])
+            width = max(shape[1], 0 if buffer is None else buffer.shape[1])
+            buffer = full((height, width) + tuple(shape[2:]), value, dtype=uint8)
+            self._foreground_buffer = buffer
+            self._foreground_value = value
+        return buffer[: shape[0], : shape[1]]
+
+    def draw(
+        self,
+        image: NDArray,
+        text: str,
+        pos: PointN,
+        color=DEFAULT_FONT_COLOR,
+    ) -> Tuple[NDArray, Optional[RectI]]:
+        """
+        Draw the text into `image` (in place), like `draw_text`.
+
+        :return: The image and the painted text box,
+            or `None` if the text was drawn with `cv2.putText`.
+        """
+
+        x, y = int(pos[0]), int(pos[1])
+        _color = normalize_color(color)
+
+        if image.dtype != uint8 or not (text.isascii() and text.isprintable()):
+            return self._put_text(image, text, (x, y), _color), None
+
+        layout = self._layout(text, x, y)
+        if not layout:
+            return image, None
+
+        x1 = min(gx for _, gx, _ in layout)
+        y1 = min(gy for _, _, gy in layout)
+        x2 = max(gx + mask.shape[1] for mask, gx, _ in layout)
+        y2 = max(gy + mask.shape[0] for mask, _, gy in layout)
+
+        # `cv2.putText` clips the strokes at the image border,
+        # which can rasterize them differently.
+        height, width = image.shape[0], image.shape[1]
+        if x1 < 1 or y1 < 1 or x2 > width - 1 or y2 > height - 1:
+            return self._put_text(image, text, (x, y), _color), None
+
+        # Overlapping strokes are blended one after another by `cv2.putText`,
+        # so the glyphs are combined by multiplying their transmittances.
+        transmittance = full((y2 - y1, x2 - x1), 255, dtype=uint8)
+        for mask, gx, gy in layout:
+            mh, mw = mask.shape
+            dst = transmittance[gy - y1 : gy - y1 + mh, gx - x1 : gx - x1 + mw]
+            cv2.multiply(dst, mask, dst=dst, scale=1 / 255)
+
+        area = image[y1:y2, x1:x2]
+        foreground = self._foreground(area.shape, _color)
+        coverage = 255 - transmittance
+
+        if self._line != LINE_AA:
+            cv2.copyTo(foreground, coverage, area)
+        else:
+            weights: Sequence[NDArray] = transmittance, coverage
+            if len(area.shape) == 3:
+                weights = [cv2.merge([w] * area.shape[2]) for w in weights]
+            background = cv2.multiply(area, weights[0], scale=1 / 255)
+            cv2.multiply(foreground, weights[1], dst=area, scale=1 / 255)
+            cv2.add(area, background, dst=area)
+
+        return image, (x1, y1, x2, y2)
+
+
+@lru_cache(maxsize=SHARED_GLYPH_ATLASES)
+def _shared_glyph_atlas(
+    font: int,
+    scale: float,
+    thickness: int,
+    line: int,
+    bottom_left: bool,
+) -> GlyphAtlas:
+    return GlyphAtlas(font, scale, thickness, line, bottom_left)
+
+
+def shared_glyph_atlas(
+    font=DEFAULT_FONT_FACE,
+    scale=DEFAULT_FONT_SCALE,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    origin=DEFAULT_TEXT_ORIGIN,
+) -> GlyphAtlas:
+    """
+    The process-wide atlas of a text style, shared by the drawing functions.
+    Like the other drawing state, it's meant to be used from a single thread.
+    """
+
+    return _shared_glyph_atlas(
+        normalize_font_face(font),
+        float(scale),
+        int(thickness),
+        normalize_line_type(line),
+        normalize_text_origin(origin),
+    )
+
+
+def draw_atlas_text_coord(
+    image: NDArray,
+    text: str,
+    x: Number,
+    y: Number,
+    font=DEFAULT_FONT_FACE,
+    scale=DEFAULT_FONT_SCALE,
+    color=DEFAULT_FONT_COLOR,
+    thickness=DEFAULT_THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    origin=DEFAULT_TEXT_ORIGIN,
+) -> NDArray:
+    """
+    `draw_text_coord` through the shared glyph atlas of the text style.
+    Anti-aliased text is drawn with `cv2.putText`,
+    because the atlas can only reproduce it within a few levels.
+    """
+
+    if normalize_line_type(line) == LINE_AA:
+        return draw_text_coord(
+            image, text, x, y, font, scale, color, thickness, line, origin
+        )
+
+    atlas = shared_glyph_atlas(font, scale, thickness, line, origin)
+    return atlas.draw(image, text, (x, y), color)[0]
+
+
+class CvlDrawableTextAtlas:
+    @staticmethod
+    def cvl_create_glyph_atlas(
+        font=DEFAULT_FONT_FACE,
+        scale=DEFAULT_FONT_SCALE,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        origin=DEFAULT_TEXT_ORIGIN,
+        max_glyphs=DEFAULT_GLYPH_ATLAS_SIZE,
+    ):
+        return GlyphAtlas(font, scale, thickness, line, origin, max_glyphs)
+
+    @staticmethod
+    def cvl_shared_glyph_atlas(
+        font=DEFAULT_FONT_FACE,
+        scale=DEFAULT_FONT_SCALE,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        origin=DEFAULT_TEXT_ORIGIN,
+    ):
+        return shared_glyph_atlas(font, scale, thickness, line, origin)
+
+    @staticmethod
+    def cvl_draw_atlas_text_coord(
+        image: NDArray,
+        text: str,
+        x: Number,
+        y: Number,
+        font=DEFAULT_FONT_FACE,
+        scale=DEFAULT_FONT_SCALE,
+        color=DEFAULT_FONT_COLOR,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        origin=DEFAULT_TEXT_ORIGIN,
+    ):
+        return draw_atlas_text_coord(
+            image, text, x, y, font, scale, color, thickness, line, origin
+        )
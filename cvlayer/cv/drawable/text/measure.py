@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from typing import NamedTuple
+from functools import lru_cache
+from typing import Final, NamedTuple
 
 import cv2
 
@@ -12,6 +13,8 @@ from cvlayer.cv.drawable.defaults import (
 from cvlayer.cv.types.font_face import normalize_font_face
 from cvlayer.typing import SizeI
 
+TEXT_SIZE_CACHE_SIZE: Final[int] = 1024
+
 
 class TextSize(NamedTuple):
     size: SizeI
@@ -27,17 +30,31 @@ def get_font_scale_from_height(
     return cv2.getFontScaleFromHeight(_font, pixel_height, thickness)
 
 
+@lru_cache(maxsize=TEXT_SIZE_CACHE_SIZE)
+def _get_text_size(text: str, font, scale, thickness) -> TextSize:
+    _font = normalize_font_face(font)
+    text_size = cv2.getTextSize(text, _font, scale, thickness)
+    width, height = text_size[0]
+    baseline = text_size[1]
+    return TextSize((width, height), baseline)
+
+
 def get_text_size(
     text: str,
     font=DEFAULT_FONT_FACE,
     scale=DEFAULT_FONT_SCALE,
     thickness=DEFAULT_THICKNESS,
 ) -> TextSize:
-    _font = normalize_font_face(font)
-    text_size = cv2.getTextSize(text, _font, scale, thickness)
-    width, height = text_size[0]
-    baseline = text_size[1]
-    return TextSize((width, height), baseline)
+    """
+    The same as `cv2.getTextSize`, but the results of
+    the last `TEXT_SIZE_CACHE_SIZE` arguments are cached.
+    """
+
+    return _get_text_size(text, font, scale, thickness)
+
+
+def clear_text_size_cache() -> None:
+    _get_text_size.cache_clear()
 
 
 class CvlDrawableTextMeasure:
@@ -57,3 +74,7 @@ class CvlDrawableTextMeasure:
         thickness=DEFAULT_THICKNESS,
     ):
         return get_text_size(text, font, scale, thickness)
+
+    @staticmethod
+    def cvl_clear_text_size_cache():
+        clear_text_size_cache()
@@ -3,6 +3,7 @@
 from cvlayer.cv.drawable.text.multiline.box import CvlDrawableTextMultilineBox
 from cvlayer.cv.drawable.text.multiline.lines import CvlDrawableTextMultilineLines
 from cvlayer.cv.drawable.text.multiline.measure import CvlDrawableTextMultilineMeasure
+from cvlayer.cv.drawable.text.multiline.overlay import CvlDrawableTextMultilineOverlay
 from cvlayer.cv.drawable.text.multiline.text import CvlDrawableTextMultilineText
 
 
@@ -10,6 +11,7 @@ class CvlDrawableTextMultiline(
     CvlDrawableTextMultilineBox,
     CvlDrawableTextMultilineLines,
     CvlDrawableTextMultilineMeasure,
+    CvlDrawableTextMultilineOverlay,
     CvlDrawableTextMultilineText,
 ):
     pass
@@ -13,8 +13,8 @@ from cvlayer.cv.drawable.defaults import (
     MULTILINE_COLOR,
     MULTILINE_LINE_SPACING,
 )
+from cvlayer.cv.drawable.text.atlas import draw_atlas_text_coord
 from cvlayer.cv.drawable.text.multiline.measure import LineTextSize
-from cvlayer.cv.drawable.text.text import draw_text_coord
 from cvlayer.typing import Number, PointN
 
 
@@ -36,7 +36,9 @@ def draw_multiline_text_lines_coord(
         width, height = lts.size
         baseline = lts.baseline
         y += height
-        draw_text_coord(image, text, x, y, font, scale, color, thickness, line, origin)
+        draw_atlas_text_coord(
+            image, text, x, y, font, scale, color, thickness, line, origin
+        )
         y += baseline + spacing
     return image
 
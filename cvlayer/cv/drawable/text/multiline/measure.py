@@ -2,8 +2,6 @@
 
 from typing import List, NamedTuple
 
-import cv2
-
 from cvlayer.cv.drawable.defaults import (
     DEFAULT_FONT_FACE,
     DEFAULT_FONT_SCALE,
@@ -11,6 +9,7 @@ from cvlayer.cv.drawable.defaults import (
     MULTILINE_LINE_SPACING,
     MULTILINE_LINEFEED,
 )
+from cvlayer.cv.drawable.text.measure import get_text_size
 from cvlayer.cv.types.font_face import normalize_font_face
 from cvlayer.typing import SizeI
 
@@ -40,9 +39,9 @@ def measure_multiline_text_box_size(
     lines = list()
     _font = normalize_font_face(font)
     for line in text.split(linefeed):
-        text_size = cv2.getTextSize(line, _font, scale, thickness)
-        text_width, text_height = text_size[0]
-        baseline = text_size[1]
+        (text_width, text_height), baseline = get_text_size(
+            line, _font, scale, thickness
+        )
         line_height = text_height + baseline + spacing
         tws.append(text_width)
         ths.append(line_height)
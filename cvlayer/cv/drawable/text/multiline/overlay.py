@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from typing import Any, Final, List, Optional, Sequence, Tuple
+
+import cv2
+from numpy import add, array, float32, maximum, multiply, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.drawable.defaults import (
+    DEFAULT_FONT_FACE,
+    DEFAULT_FONT_SCALE,
+    DEFAULT_LINE_TYPE,
+    DEFAULT_THICKNESS,
+    MULTILINE_BACKGROUND_ALPHA,
+    MULTILINE_BACKGROUND_COLOR,
+    MULTILINE_BOX_ANCHOR,
+    MULTILINE_BOX_MARGIN,
+    MULTILINE_COLOR,
+    MULTILINE_LINE_SPACING,
+    MULTILINE_LINEFEED,
+)
+from cvlayer.cv.drawable.text.atlas import draw_atlas_text_coord
+from cvlayer.cv.drawable.text.multiline.measure import LineTextSize
+from cvlayer.cv.types.color import normalize_color
+from cvlayer.cv.types.font_face import normalize_font_face
+from cvlayer.cv.types.line_type import normalize_line_type
+from cvlayer.typing import PointN, RectI
+
+DEFAULT_OVERLAY_LINE_CACHE: Final[int] = 256
+
+
+class _LineSprite:
+    __slots__ = ("size", "mask", "padding")
+
+    def __init__(self, size: LineTextSize, mask: NDArray, padding: int):
+        self.size = size
+        self.mask = mask
+        self.padding = padding
+
+
+class MultilineTextOverlay:
+    """
+    A cached version of `draw_multiline_text_box`.
+
+    Each line is measured and rasterized once with `draw_atlas_text_coord`
+    into a coverage mask, and the box is rebuilt only when the text or style changes.
+    Drawing blends the box area of the image in place,
+    so the rest of the image is never read or copied.
+
+    Anti-aliased text is composed from its coverage,
+    so the output can differ from `cv2.putText` by a few levels at the glyph edges.
+    """
+
+    _lines: OrderedDict[Tuple[Any, ...], _LineSprite]
+    _sprite_key: Optional[Tuple[Any, ...]]
+    _gain: Optional[NDArray]
+    _offset: Optional[NDArray]
+    _buffer: Optional[NDArray]
+
+    def __init__(self, max_lines=DEFAULT_OVERLAY_LINE_CACHE):
+        self._max_lines = max_lines
+        self._lines = OrderedDict()
+        self._sprite_key = None
+        self._gain = None
+        self._offset = None
+        self._buffer = None
+        self._box_size = 0, 0
+        self._line_hits = 0
+        self._line_misses = 0
+
+    @property
+    def line_hits(self) -> int:
+        return self._line_hits
+
+    @property
+    def line_misses(self) -> int:
+        return self._line_misses
+
+    @property
+    def box_size(self) -> Tuple[int, int]:
+        return self._box_size
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._sprite_key = None
+        self._gain = None
+        self._offset = None
+        self._buffer = None
+
+    def _line_sprite(
+        self,
+        text: str,
+        font: int,
+        scale: float,
+        thickness: int,
+        line: int,
+    ) -> _LineSprite:
+        key = text, font, scale, thickness, line
+        sprite = self._lines.get(key)
+        if sprite is not None:
+            self._lines.move_to_end(key)
+            self._line_hits += 1
+            return sprite
+
+        self._line_misses += 1
+        (width, height), baseline = cv2.getTextSize(text, font, scale, thickness)
+
+        # Glyph strokes, like brackets and descenders, can exceed the measured box.
+        padding = thickness + (height + baseline) // 2
+        shape = height + baseline + padding * 2, width + padding * 2
+        mask = zeros(shape, dtype=uint8)
+        org = padding, padding + height
+        draw_atlas_text_coord(
+            mask, text, org[0], org[1], font, scale, (255,), thickness, line
+        )
+
+        sprite = _LineSprite(
+            LineTextSize(text, (width, height), baseline), mask, padding
+        )
+        self._lines[key] = sprite
+        while len(self._lines) > self._max_lines:
+            self._lines.popitem(last=False)
+        return sprite
+
+    def _build(
+        self,
+        text: str,
+        font: int,
+        scale: float,
+        color: Sequence[float],
+        thickness: int,
+        line: int,
+        linefeed: str,
+        spacing: int,
+        background_color: Sequence[float],
+        background_alpha: float,
+        margin: int,
+    ) -> None:
+        sprites: List[_LineSprite] = list()
+        box_width = 0
+        box_height = 0
+        for text_line in text.split(linefeed):
+            sprite = self._line_sprite(text_line, font, scale, thickness, line)
+            width, height = sprite.size.size
+            box_width = max(box_width, width)
+            box_height += height + sprite.size.baseline + spacing
+            sprites.append(sprite)
+
+        if sprites:
+            box_height -= spacing  # The last line has no bottom line spacing.
+
+        bw = box_width + margin * 2
+        bh = box_height + margin * 2
+        coverage = zeros((bh, bw), dtype=uint8)
+
+        y = margin
+        for sprite in sprites:
+            width, height = sprite.size.size
+            mh, mw = sprite.mask.shape
+            mx = margin - sprite.padding
+            my = y - sprite.padding
+
+            # Clip the padded line mask to the box.
+            cx1, cy1 = max(mx, 0), max(my, 0)
+            cx2, cy2 = min(mx + mw, bw), min(my + mh, bh)
+            if cx1 < cx2 and cy1 < cy2:
+                src = sprite.mask[cy1 - my : cy2 - my, cx1 - mx : cx2 - mx]
+                dst = coverage[cy1:cy2, cx1:cx2]
+                maximum(dst, src, out=dst)
+
+            y += height + sprite.size.baseline + spacing
+
+        # out = (image * beta + background * alpha) * (1 - c) + color * c
+        #     = image * gain + offset
+        weight = coverage[:, :, None] / float32(255)
+        inverse = 1.0 - weight
+        alpha = background_alpha
+        beta = 1.0 - background_alpha
+        background = array(background_color[:3], dtype=float32)
+        foreground = array(color[:3], dtype=float32)
+
+        self._gain = (inverse * beta).astype(float32)
+        self._offset = (inverse * (background * alpha) + weight * foreground).astype(
+            float32
+        )
+        if self._buffer is None or self._buffer.shape[:2] != (bh, bw):
+            self._buffer = zeros((bh, bw, 3), dtype=float32)
+        self._box_size = bw, bh
+
+    def draw(
+        self,
+        image: NDArray,
+        text: str,
+        pos: PointN,
+        font=DEFAULT_FONT_FACE,
+        scale=DEFAULT_FONT_SCALE,
+        color=MULTILINE_COLOR,
+        thickness=DEFAULT_THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        linefeed=MULTILINE_LINEFEED,
+        spacing=MULTILINE_LINE_SPACING,
+        background_color=MULTILINE_BACKGROUND_COLOR,
+        background_alpha=MULTILINE_BACKGROUND_ALPHA,
+        margin=MULTILINE_BOX_MARGIN,
+        anchor=MULTILINE_BOX_ANCHOR,
+    ) -> Tuple[NDArray, RectI]:
+        """
+        Draw the text box into `image` (in place) and return the box ROI.
+        """
+
+        anchor_x, anchor_y = anchor
+        assert 0 <= anchor_x <= 1
+        assert 0 <= anchor_y <= 1
+        assert 0 <= background_alpha <= 1
+        assert len(image.shape) == 3 and image.shape[2] == 3
+
+        _font = normalize_font_face(font)
+        _color = normalize_color(color)
+        _line = normalize_line_type(line)
+        _background = normalize_color(background_color)
+
+        key = (
+            text,
+            _font,
+            scale,
+            tuple(_color),
+            thickness,
+            _line,
+            linefeed,
+            spacing,
+            tuple(_background),
+            background_alpha,
+            margin,
+        )
+        if key != self._sprite_key:
+            self._build(
+                text,
+                _font,
+                scale,
+                _color,
+                thickness,
+                _line,
+                linefeed,
+                spacing,
+                _background,
+                background_alpha,
+                margin,
+            )
+            self._sprite_key = key
+
+        assert self._gain is not None
+        assert self._offset is not None
+        assert self._buffer is not None
+
+        ch = image.shape[0]
+        cw = image.shape[1]
+        bw, bh = self._box_size
+
+        x, y = pos
+        x1 = max(int((x + cw * anchor_x) - bw * anchor_x), 0)
+        y1 = max(int((y + ch * anchor_y) - bh * anchor_y), 0)
+        x2 = min(x1 + bw, cw)
+        y2 = min(y1 + bh, ch)
+        w = x2 - x1
+        h = y2 - y1
+
+        if w > 0 and h > 0:
+            area = image[y1:y2, x1:x2]
+            buffer = self._buffer[0:h, 0:w]
+            multiply(area, self._gain[0:h, 0:w], out=buffer)
+            add(buffer, self._offset[0:h, 0:w], out=buffer)
+            add(buffer, 0.5, out=buffer)
+            area[...] = buffer
+
+        roi = x1, y1, x2, y2
+        return image, roi
+
+
+class CvlDrawableTextMultilineOverlay:
+    @staticmethod
+    def cvl_create_multiline_text_overlay(max_lines=DEFAULT_OVERLAY_LINE_CACHE):
+        return MultilineTextOverlay(max_lines)
@@ -12,7 +12,7 @@ from cvlayer.cv.drawable.defaults import (
     DEFAULT_TEXT_ORIGIN,
     DEFAULT_THICKNESS,
 )
-from cvlayer.cv.drawable.text.text import draw_text_coord
+from cvlayer.cv.drawable.text.atlas import draw_atlas_text_coord
 from cvlayer.typing import Number, PointN
 
 
@@ -30,7 +30,11 @@ def draw_outline_text_coord(
     line=DEFAULT_LINE_TYPE,
     origin=DEFAULT_TEXT_ORIGIN,
 ) -> NDArray:
-    draw_text_coord(
+    """
+    Draw the outline and then the text, each with `draw_atlas_text_coord`.
+    """
+
+    draw_atlas_text_coord(
         image,
         text,
         x,
@@ -42,7 +46,7 @@ def draw_outline_text_coord(
         line,
         origin,
     )
-    draw_text_coord(
+    draw_atlas_text_coord(
         image,
         text,
         x,
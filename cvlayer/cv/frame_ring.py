@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+from math import prod
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from numpy import copyto, dtype, may_share_memory, ndarray, uint8
+from numpy.typing import DTypeLike, NDArray
+
+from cvlayer.cv.frame_source import FrameSourceInterface
+
+DEFAULT_FRAME_RING_SLOTS: Final[int] = 4
+
+
+class FrameRingItem(NamedTuple):
+    slot: int
+    sequence: int
+    image: NDArray
+
+
+class SharedFrameRing:
+    """
+    Fixed-size frame slots in shared memory, passed between processes by index.
+
+    Only the slot index and sequence number travel through the queues,
+    so frames are never pickled. A producer takes a free slot with `acquire()`,
+    writes into `slot_view()` and publishes it with `commit()`.
+    Each reader gets the slot with `read()` as a zero-copy view
+    and must `release()` it when done. The slot returns to the free list
+    when its reference count drops to zero,
+    so a slow reader blocks the producer in `acquire()` (backpressure).
+
+    The ring can be passed to `multiprocessing.Process` arguments.
+    Child processes attach to the same shared memory block by name.
+    """
+
+    _array: Optional[NDArray]
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        dtype_like: DTypeLike = uint8,
+        slots=DEFAULT_FRAME_RING_SLOTS,
+        readers=1,
+        context: Optional[BaseContext] = None,
+    ):
+        if slots < 1:
+            raise ValueError("The 'slots' argument must be at least 1")
+        if readers < 1:
+            raise ValueError("The 'readers' argument must be at least 1")
+
+        ctx = context if context is not None else get_context()
+
+        self._shape = tuple(int(x) for x in shape)
+        self._dtype = dtype(dtype_like)
+        self._slots = slots
+        self._readers = readers
+
+        nbytes = max(prod(self._shape) * self._dtype.itemsize * slots, 1)
+        self._shm = SharedMemory(create=True, size=nbytes)
+        self._owner = True
+
+        self._refcounts = ctx.Array("q", slots, lock=True)
+        self._free = ctx.Queue(slots)
+        self._ready = [ctx.Queue() for _ in range(readers)]
+
+        for slot in range(slots):
+            self._free.put(slot)
+
+        self._array = self._create_array()
+
+    def _create_array(self) -> NDArray:
+        shape = (self._slots, *self._shape)
+        return ndarray(shape, dtype=self._dtype, buffer=self._shm.buf)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        state["_array"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._shm = SharedMemory(name=state["_shm"], create=False)
+        self._array = self._create_array()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def readers(self) -> int:
+        return self._readers
+
+    @property
+    def array(self) -> NDArray:
+        if self._array is None:
+            raise ValueError("The frame ring has been closed")
+        return self._array
+
+    def slot_view(self, slot: int) -> NDArray:
+        return self.array[slot]
+
+    def refcount(self, slot: int) -> int:
+        return self._refcounts[slot]
+
+    def acquire(self, block=True, timeout: Optional[float] = None) -> int:
+        """
+        Take a free slot for writing.
+
+        :raises queue.Empty: No slot became free within the timeout.
+        """
+
+        return self._free.get(block, timeout)
+
+    def abort(self, slot: int) -> None:
+        """
+        Return an acquired slot without publishing it.
+        """
+
+        self._free.put(slot)
+
+    def commit(self, slot: int, sequence: int) -> None:
+        with self._refcounts.get_lock():
+            self._refcounts[slot] = self._readers
+        for ready in self._ready:
+            ready.put((slot, sequence))
+
+    def finish(self, count=1) -> None:
+        """
+        Signal the end of the stream. Use one `count` per process sharing a reader.
+        """
+
+        for ready in self._ready:
+            for _ in range(count):
+                ready.put(None)
+
+    def read(
+        self,
+        reader=0,
+        block=True,
+        timeout: Optional[float] = None,
+    ) -> Optional[FrameRingItem]:
+        """
+        Take the next committed slot as a read-only view.
+
+        :return: `None` at the end of the stream.
+        :raises queue.Empty: No slot was committed within the timeout.
+        """
+
+        message = self._ready[reader].get(block, timeout)
+        if message is None:
+            return None
+
+        slot, sequence = message
+        image = self.array[slot].view()
+        image.setflags(write=False)
+        return FrameRingItem(slot, sequence, image)
+
+    def retain(self, slot: int) -> None:
+        with self._refcounts.get_lock():
+            if self._refcounts[slot] < 1:
+                raise ValueError(f"The slot is not in use: {slot}")
+            self._refcounts[slot] += 1
+
+    def release(self, slot: int) -> None:
+        with self._refcounts.get_lock():
+            if self._refcounts[slot] < 1:
+                raise ValueError(f"The slot is not in use: {slot}")
+            self._refcounts[slot] -= 1
+            free = self._refcounts[slot] == 0
+
+        if free:
+            self._free.put(slot)
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block.
+        All views returned by this ring must be released before closing.
+        """
+
+        self._array = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block. Call once, in the creating process.
+        """
+
+        self._shm.unlink()
+
+
+def write_frame_ring(
+    ring: SharedFrameRing,
+    capture: FrameSourceInterface,
+    sequence: int,
+    block=True,
+    timeout: Optional[float] = None,
+) -> bool:
+    """
+    Decode the next frame directly into a free slot and commit it.
+    """
+
+    slot = ring.acquire(block, timeout)
+    view = ring.slot_view(slot)
+
+    try:
+        retval, frame = capture.read(view)
+        if retval and not may_share_memory(frame, view):
+            copyto(view, frame)
+    except BaseException:
+        ring.abort(slot)
+        raise
+
+    if not retval:
+        ring.abort(slot)
+        return False
+
+    ring.commit(slot, sequence)
+    return True
+
+
+def process_frame_ring(
+    input_ring: SharedFrameRing,
+    output_ring: SharedFrameRing,
+    process: Callable[[NDArray, Any], Tuple[NDArray, Any]],
+    reader=0,
+) -> int:
+    """
+    Run `process` on each input frame and commit the result to the output ring.
+
+    `process` has the same signature as `CvManager.run`,
+    and the result must match the output ring shape.
+    The output stream is finished when the input stream ends,
+    or when `process` raises an exception.
+
+    :return: The number of processed frames.
+    """
+
+    count = 0
+    try:
+        while True:
+            item = input_ring.read(reader)
+            if item is None:
+                break
+
+            try:
+                result, _ = process(item.image, None)
+                slot = output_ring.acquire()
+                view = output_ring.slot_view(slot)
+                if result.shape != view.shape:
+                    output_ring.abort(slot)
+                    raise ValueError(
+                        f"The result shape {result.shape} does not match "
+                        f"the output ring shape {view.shape}"
+                    )
+                copyto(view, result)
+                output_ring.commit(slot, item.sequence)
+            finally:
+                input_ring.release(item.slot)
+
+            count += 1
+    finally:
+        # Readers of the output ring must not wait forever if processing fails.
+        output_ring.finish()
+
+    return count
+
+
+class CvlFrameRing:
+    @staticmethod
+    def cvl_create_frame_ring(
+        shape: Sequence[int],
+        dtype_like: DTypeLike = uint8,
+        slots=DEFAULT_FRAME_RING_SLOTS,
+        readers=1,
+        context: Optional[BaseContext] = None,
+    ):
+        return SharedFrameRing(shape, dtype_like, slots, readers, context)
+
+    @staticmethod
+    def cvl_write_frame_ring(
+        ring: SharedFrameRing,
+        capture: FrameSourceInterface,
+        sequence: int,
+        block=True,
+        timeout: Optional[float] = None,
+    ):
+        return write_frame_ring(ring, capture, sequence, block, timeout)
+
+    @staticmethod
+    def cvl_process_frame_ring(
+        input_ring: SharedFrameRing,
+        output_ring: SharedFrameRing,
+        process: Callable[[NDArray, Any], Tuple[NDArray, Any]],
+        reader=0,
+    ):
+        return process_frame_ring(input_ring, output_ring, process, reader)
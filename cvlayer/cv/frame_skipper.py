@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+from time import monotonic
+from typing import Callable, Final, Optional
+
+DEFAULT_MAX_FRAME_SKIP: Final[int] = 30
+
+DRAINED_GRAB_RATIO: Final[float] = 0.5
+"""A grab that waits longer than this part of the frame interval drained the source."""
+
+
+class FrameSkipper:
+    """
+    Drop the frames of a live source that the processing can't keep up with.
+
+    The backlog is the time the source ran ahead of the processing:
+    every iteration adds its duration and subtracts one frame interval
+    for each frame consumed. Whenever the backlog exceeds `latency_target`,
+    the stale frames are grabbed without being decoded.
+
+    A grab that waits for the source means no frame was queued,
+    so the backlog is reset and the skipping stops early.
+    """
+
+    _last: Optional[float]
+
+    def __init__(
+        self,
+        fps: float,
+        latency_target: Optional[float] = None,
+        max_skip=DEFAULT_MAX_FRAME_SKIP,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if fps <= 0:
+            raise ValueError("The 'fps' argument must be positive")
+        if latency_target is not None and latency_target < 0:
+            raise ValueError("The 'latency_target' argument must not be negative")
+        if max_skip < 0:
+            raise ValueError("The 'max_skip' argument must not be negative")
+
+        self._interval = 1.0 / fps
+        self._latency_target = latency_target if latency_target else 0.0
+        self._max_skip = max_skip
+        self._clock = clock
+
+        self._last = None
+        self._backlog = 0.0
+        self._processed = 0
+        self._dropped = 0
+        self._last_dropped = 0
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def backlog(self) -> float:
+        """The estimated latency of the next frame, in seconds."""
+        return self._backlog
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def last_dropped(self) -> int:
+        """The number of frames dropped by the last `skip()`."""
+        return self._last_dropped
+
+    @property
+    def drop_ratio(self) -> float:
+        total = self._processed + self._dropped
+        return self._dropped / total if total else 0.0
+
+    def reset(self) -> None:
+        """Restart the measurement, e.g. after a pause or a seek."""
+
+        self._last = None
+        self._backlog = 0.0
+        self._last_dropped = 0
+
+    def clear(self) -> None:
+        self.reset()
+        self._processed = 0
+        self._dropped = 0
+
+    def pending(self, now: Optional[float] = None) -> int:
+        """
+        Update the backlog up to `now`, and return the number of frames to drop.
+        """
+
+        if now is None:
+            now = self._clock()
+        if self._last is not None:
+            elapsed = now - self._last
+            self._backlog = max(self._backlog + elapsed - self._interval, 0.0)
+        self._last = now
+
+        excess = self._backlog - self._latency_target
+        if excess < self._interval:
+            return 0
+        return min(int(excess / self._interval), self._max_skip)
+
+    def skip(self, grab: Callable[[], bool]) -> int:
+        """
+        Drop the stale frames with `grab`, before the next frame is read.
+
+        :param grab: Advance the source by one frame without decoding it,
+            like `cv2.VideoCapture.grab`.
+        :return: The number of frames dropped.
+        """
+
+        count = self.pending()
+        dropped = 0
+        for _ in range(count):
+            begin = self._clock()
+            if not grab():
+                break
+
+            dropped += 1
+            self._backlog = max(self._backlog - self._interval, 0.0)
+            if self._clock() - begin >= self._interval * DRAINED_GRAB_RATIO:
+                self._backlog = 0.0
+                break
+
+        self._processed += 1
+        self._dropped += dropped
+        self._last_dropped = dropped
+        return dropped
+
+
+class CvlFrameSkipper:
+    @staticmethod
+    def cvl_create_frame_skipper(
+        fps: float,
+        latency_target: Optional[float] = None,
+        max_skip=DEFAULT_MAX_FRAME_SKIP,
+    ):
+        return FrameSkipper(fps, latency_target, max_skip)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABCMeta, abstractmethod
+from typing import Optional, Tuple
+
+from numpy.typing import NDArray
+
+
+class FrameSourceInterface(metaclass=ABCMeta):
+    """
+    The minimal `cv2.VideoCapture`-like interface that `CvWindow` reads from.
+    """
+
+    @property
+    @abstractmethod
+    def opened(self) -> bool:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def width(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def height(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def fps(self) -> float:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def frames(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def pos(self) -> int:
+        raise NotImplementedError
+
+    @pos.setter
+    @abstractmethod
+    def pos(self, value: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def grab(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, image: Optional[NDArray] = None) -> Tuple[bool, NDArray]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+from io import StringIO
+from time import monotonic
+from typing import Any, Callable, Final, Hashable, List, NamedTuple, Optional, Tuple
+
+import cv2
+from numpy import arange, float32, float64, histogram, stack, uint8
+from numpy.typing import NDArray
+
+from cvlayer.cv.color import PIXEL_8BIT_MAX
+from cvlayer.cv.roi import normalize_image_roi
+from cvlayer.typing import RectI
+
+STATS_BINS: Final[int] = PIXEL_8BIT_MAX + 1
+STATS_RANGES: Final[Tuple[float, float]] = (0.0, float(STATS_BINS))
+DEFAULT_STATS_STRIDE: Final[int] = 1
+DEFAULT_STATS_INTERVAL_FRAMES: Final[int] = 0
+DEFAULT_STATS_INTERVAL: Final[float] = 0.0
+
+
+class FrameStats(NamedTuple):
+    shape: Tuple[int, ...]
+    samples: int
+    means: List[float]
+    mins: List[float]
+    maxs: List[float]
+    histograms: NDArray
+    """The `(channels, 256)` float32 histograms of the sampled pixels."""
+
+
+def _crop_roi(frame: NDArray, roi: Optional[RectI] = None) -> NDArray:
+    if roi is not None:
+        x1, y1, x2, y2 = normalize_image_roi(frame, roi)
+        if (x2 - x1) * (y2 - y1) != 0:
+            return frame[y1:y2, x1:x2]
+    return frame
+
+
+def _subsample_8bit(frame: NDArray, stride: int) -> NDArray:
+    if stride == 1:
+        return frame
+
+    # Nearest-neighbor resizing by an exact integer factor picks the same pixels
+    # as `frame[::stride, ::stride]`, but without a slow strided copy.
+    # The last partial row and column of samples are dropped.
+    height = frame.shape[0] // stride
+    width = frame.shape[1] // stride
+    if height == 0 or width == 0:
+        return frame[::stride, ::stride]
+    trimmed = frame[: height * stride, : width * stride]
+    return cv2.resize(trimmed, (width, height), interpolation=cv2.INTER_NEAREST)
+
+
+def compute_frame_stats(
+    frame: NDArray,
+    roi: Optional[RectI] = None,
+    stride=DEFAULT_STATS_STRIDE,
+) -> FrameStats:
+    """
+    Compute the per-channel histogram, mean, min and max of a frame.
+
+    Only every `stride`-th pixel of every `stride`-th row is sampled.
+    For 8-bit frames the mean, min and max are derived from the histograms,
+    so the pixels are visited only once.
+    """
+
+    if stride < 1:
+        raise ValueError("The 'stride' argument must be at least 1")
+
+    frame = _crop_roi(frame, roi)
+    if len(frame.shape) == 2:
+        channels = 1
+    elif len(frame.shape) == 3:
+        channels = frame.shape[2]
+    else:
+        raise ValueError(f"Unsupported frame shape: {frame.shape}")
+
+    if frame.dtype == uint8:
+        sampled = _subsample_8bit(frame, stride)
+        samples = sampled.shape[0] * sampled.shape[1]
+        if samples == 0:
+            raise ValueError("There are no pixels to sample")
+
+        hists = [
+            cv2.calcHist([sampled], [c], None, [STATS_BINS], STATS_RANGES).ravel()
+            for c in range(channels)
+        ]
+        histograms = stack(hists)
+
+        # The single pass over the pixels is the histogram; derive the rest from it.
+        levels = arange(STATS_BINS, dtype=float64)
+        means = [float(v) for v in (histograms @ levels) / samples]
+        mins = list()
+        maxs = list()
+        for hist in histograms:
+            nonzero = hist.nonzero()[0]
+            mins.append(float(nonzero[0]))
+            maxs.append(float(nonzero[-1]))
+    else:
+        pixels = frame[::stride, ::stride].reshape(-1, channels)
+        samples = pixels.shape[0]
+        if samples == 0:
+            raise ValueError("There are no pixels to sample")
+
+        means = [float(v) for v in pixels.mean(axis=0)]
+        mins = [float(v) for v in pixels.min(axis=0)]
+        maxs = [float(v) for v in pixels.max(axis=0)]
+        hists = [
+            histogram(pixels[:, c], STATS_BINS, STATS_RANGES)[0]
+            for c in range(channels)
+        ]
+        histograms = stack(hists).astype(float32)
+
+    return FrameStats(tuple(frame.shape), samples, means, mins, maxs, histograms)
+
+
+def frame_stats_as_text(stats: FrameStats) -> str:
+    buffer = StringIO()
+    buffer.write(f"Shape: {list(stats.shape)}\n")
+    buffer.write(f"Means: {[round(m) for m in stats.means]}\n")
+    buffer.write(f"Min: {[round(m) for m in stats.mins]}\n")
+    buffer.write(f"Max: {[round(m) for m in stats.maxs]}")
+    return buffer.getvalue()
+
+
+class FrameStatsSampler:
+    """
+    Rate-limited `compute_frame_stats`.
+
+    The stats are recomputed when `interval_frames` frames were passed,
+    or when `interval` seconds have elapsed since the last update.
+    Zero disables the corresponding limit, and with both disabled
+    the stats are recomputed for every frame.
+    A change of the frame shape, the ROI or the `source` always triggers an update.
+    """
+
+    _stats: Optional[FrameStats]
+    _key: Optional[Tuple[Tuple[int, ...], Optional[RectI], Any]]
+
+    def __init__(
+        self,
+        stride=DEFAULT_STATS_STRIDE,
+        interval_frames=DEFAULT_STATS_INTERVAL_FRAMES,
+        interval=DEFAULT_STATS_INTERVAL,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if stride < 1:
+            raise ValueError("The 'stride' argument must be at least 1")
+        if interval_frames < 0:
+            raise ValueError("The 'interval_frames' argument must not be negative")
+        if interval < 0:
+            raise ValueError("The 'interval' argument must not be negative")
+
+        self._stride = stride
+        self._interval_frames = interval_frames
+        self._interval = interval
+        self._clock = clock
+        self._stats = None
+        self._key = None
+        self._skipped = 0
+        self._updated_at = 0.0
+        self._updates = 0
+
+    @property
+    def stats(self) -> Optional[FrameStats]:
+        return self._stats
+
+    @property
+    def updates(self) -> int:
+        return self._updates
+
+    def invalidate(self) -> None:
+        self._stats = None
+
+    def _due(self, now: float) -> bool:
+        if self._interval_frames == 0 and self._interval == 0:
+            return True
+        if self._interval_frames and self._skipped >= self._interval_frames:
+            return True
+        if self._interval and now - self._updated_at >= self._interval:
+            return True
+        return False
+
+    def update(
+        self,
+        frame: NDArray,
+        roi: Optional[RectI] = None,
+        source: Hashable = None,
+    ) -> FrameStats:
+        """
+        :param source: Identifies where the frame comes from, e.g. the layer.
+        """
+
+        now = self._clock()
+        key = tuple(frame.shape), roi, source
+        self._skipped += 1
+
+        if self._stats is None or key != self._key or self._due(now):
+            self._stats = compute_frame_stats(frame, roi, self._stride)
+            self._key = key
+            self._skipped = 0
+            self._updated_at = now
+            self._updates += 1
+
+        return self._stats
+
+
+class CvlFrameStats:
+    @staticmethod
+    def cvl_compute_frame_stats(
+        frame: NDArray,
+        roi: Optional[RectI] = None,
+        stride=DEFAULT_STATS_STRIDE,
+    ):
+        return compute_frame_stats(frame, roi, stride)
+
+    @staticmethod
+    def cvl_frame_stats_as_text(stats: FrameStats):
+        return frame_stats_as_text(stats)
+
+    @staticmethod
+    def cvl_create_frame_stats_sampler(
+        stride=DEFAULT_STATS_STRIDE,
+        interval_frames=DEFAULT_STATS_INTERVAL_FRAMES,
+        interval=DEFAULT_STATS_INTERVAL,
+    ):
+        return FrameStatsSampler(stride, interval_frames, interval)
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+import json
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from os import makedirs, path
+from typing import Any, Dict, Final, List, Optional, Tuple, Union
+
+from numpy import copyto, lib, load, may_share_memory, prod, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.frame_source import FrameSourceInterface
+from cvlayer.cv.video_capture import VideoCapture
+
+FRAME_STORE_DATA_FILENAME: Final[str] = "frames.npy"
+FRAME_STORE_META_FILENAME: Final[str] = "meta.json"
+
+
+@dataclass
+class FrameStoreMeta:
+    width: int
+    height: int
+    channels: int
+    frames: int
+    """The number of frames actually decoded."""
+
+    fps: float
+    source: str = ""
+
+    @property
+    def frame_shape(self) -> Tuple[int, ...]:
+        if self.channels == 1:
+            return self.height, self.width
+        else:
+            return self.height, self.width, self.channels
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        return cls(**data)
+
+
+def frame_store_data_path(directory: str) -> str:
+    return path.join(directory, FRAME_STORE_DATA_FILENAME)
+
+
+def frame_store_meta_path(directory: str) -> str:
+    return path.join(directory, FRAME_STORE_META_FILENAME)
+
+
+def has_frame_store(directory: str) -> bool:
+    # The metadata file is written last, so a store without it is incomplete.
+    data_path = frame_store_data_path(directory)
+    meta_path = frame_store_meta_path(directory)
+    return path.isfile(data_path) and path.isfile(meta_path)
+
+
+def read_frame_store_meta(directory: str, encoding="utf-8") -> FrameStoreMeta:
+    with open(frame_store_meta_path(directory), encoding=encoding) as f:
+        return FrameStoreMeta.from_dict(json.load(f))
+
+
+def write_frame_store_meta(
+    directory: str,
+    meta: FrameStoreMeta,
+    encoding="utf-8",
+) -> None:
+    with open(frame_store_meta_path(directory), "w", encoding=encoding) as f:
+        json.dump(meta.to_dict(), f, indent=2)
+
+
+def create_frame_store(
+    source: Union[str, FrameSourceInterface],
+    directory: str,
+    max_frames: Optional[int] = None,
+    overwrite=False,
+) -> FrameStoreMeta:
+    """
+    Decode the video once into a raw `uint8` frame array on disk.
+
+    The frames are decoded directly into the memory-mapped file,
+    so no intermediate frame buffers are allocated.
+    """
+
+    if has_frame_store(directory) and not overwrite:
+        raise FileExistsError(f"The frame store already exists: '{directory}'")
+
+    if isinstance(source, FrameSourceInterface):
+        capture = source
+        source_name = type(source).__name__
+    else:
+        capture = VideoCapture(source)
+        source_name = str(source)
+
+    try:
+        return _decode_frame_store(capture, directory, max_frames, source_name)
+    finally:
+        if not isinstance(source, FrameSourceInterface):
+            capture.release()
+
+
+def truncate_frame_store_data(filename: str, frames: int) -> None:
+    """
+    Shrink the data file to its first `frames` frames, in place.
+    The header has spare space for the frame count, so the data doesn't move.
+    """
+
+    with open(filename, "r+b") as f:
+        version = lib.format.read_magic(f)
+        if version == (1, 0):
+            read_header = lib.format.read_array_header_1_0
+            write_header = lib.format.write_array_header_1_0
+        elif version == (2, 0):
+            read_header = lib.format.read_array_header_2_0
+            write_header = lib.format.write_array_header_2_0
+        else:
+            raise ValueError(f"Unsupported data file version: {version}")
+
+        shape, fortran_order, dtype = read_header(f)
+        offset = f.tell()
+
+        header = {
+            "descr": lib.format.dtype_to_descr(dtype),
+            "fortran_order": fortran_order,
+            "shape": (frames, *shape[1:]),
+        }
+        buffer = BytesIO()
+        write_header(buffer, header)
+        if buffer.tell() != offset:
+            raise RuntimeError("The header of the data file would change its size")
+
+        f.seek(0)
+        f.write(buffer.getvalue())
+
+        frame_size = dtype.itemsize * int(prod(shape[1:]))
+        f.truncate(offset + frame_size * frames)
+
+
+def _decode_frame_store(
+    capture: FrameSourceInterface,
+    directory: str,
+    max_frames: Optional[int],
+    source_name: str,
+) -> FrameStoreMeta:
+    if not capture.opened:
+        raise RuntimeError("A frame source was created but not opened")
+
+    count = capture.frames
+    if max_frames is not None:
+        if max_frames < 1:
+            raise ValueError("The 'max_frames' argument must be at least 1")
+        count = min(count, max_frames) if count >= 1 else max_frames
+    if count < 1:
+        raise ValueError("Unknown number of frames. Use the 'max_frames' argument")
+
+    retval, first = capture.read()
+    if not retval:
+        raise EOFError("Failed to read the first frame")
+    if first.dtype != uint8:
+        raise ValueError(f"Unsupported frame dtype: {first.dtype}")
+    if len(first.shape) not in (2, 3):
+        raise ValueError(f"Unsupported frame shape: {first.shape}")
+
+    makedirs(directory, exist_ok=True)
+    data_path = frame_store_data_path(directory)
+    store = lib.format.open_memmap(
+        data_path,
+        mode="w+",
+        dtype=uint8,
+        shape=(count, *first.shape),
+    )
+
+    store[0] = first
+    decoded = 1
+    while decoded < count:
+        slot = store[decoded]
+        retval, frame = capture.read(slot)
+        if not retval:
+            break
+        if not may_share_memory(frame, slot):
+            copyto(slot, frame)
+        decoded += 1
+
+    store.flush()
+    del store
+
+    # The frame count of the container can be larger than the decodable frames.
+    if decoded < count:
+        truncate_frame_store_data(data_path, decoded)
+
+    height, width = first.shape[0:2]
+    channels = first.shape[2] if len(first.shape) == 3 else 1
+    meta = FrameStoreMeta(width, height, channels, decoded, capture.fps, source_name)
+    write_frame_store_meta(directory, meta)
+    return meta
+
+
+class FrameStore(FrameSourceInterface):
+    """
+    A read-only frame source backed by a memory-mapped raw frame array.
+
+    Frames are returned as zero-copy (and non-writable) views of the mapped file.
+    """
+
+    _array: Optional[NDArray[uint8]]
+
+    def __init__(self, directory: str):
+        if not has_frame_store(directory):
+            raise FileNotFoundError(f"Not found frame store: '{directory}'")
+
+        self._directory = directory
+        self._meta = read_frame_store_meta(directory)
+        self._array = load(frame_store_data_path(directory), mmap_mode="r")
+        self._pos = 0
+
+        assert self._array is not None
+        if self._array.shape[0] < self._meta.frames:
+            raise ValueError("The data file has fewer frames than the metadata")
+        if self._array.shape[1:] != self._meta.frame_shape:
+            raise ValueError("The data file shape does not match the metadata")
+
+    @classmethod
+    def from_video(
+        cls,
+        source: Union[str, FrameSourceInterface],
+        directory: str,
+        max_frames: Optional[int] = None,
+        overwrite=False,
+    ):
+        """
+        Open the frame store, decoding the video first only if it doesn't exist.
+        """
+
+        if overwrite or not has_frame_store(directory):
+            create_frame_store(source, directory, max_frames, overwrite)
+        return cls(directory)
+
+    def __len__(self) -> int:
+        return self._meta.frames
+
+    def __getitem__(self, index: int) -> NDArray[uint8]:
+        if not -self._meta.frames <= index < self._meta.frames:
+            raise IndexError(f"Frame index out of range: {index}")
+        return self.array[index % self._meta.frames]
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def meta(self) -> FrameStoreMeta:
+        return self._meta
+
+    @property
+    def array(self) -> NDArray[uint8]:
+        if self._array is None:
+            raise ValueError("The frame store has been released")
+        return self._array
+
+    @property
+    def opened(self) -> bool:
+        return self._array is not None
+
+    @property
+    def width(self) -> int:
+        return self._meta.width
+
+    @property
+    def height(self) -> int:
+        return self._meta.height
+
+    @property
+    def fps(self) -> float:
+        return self._meta.fps
+
+    @property
+    def frames(self) -> int:
+        return self._meta.frames
+
+    @property
+    def pos(self) -> int:
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: int) -> None:
+        self._pos = min(max(value, 0), self._meta.frames)
+
+    def grab(self) -> bool:
+        if self._array is None or self._pos >= self._meta.frames:
+            return False
+        self._pos += 1
+        return True
+
+    def read(self, image: Optional[NDArray] = None) -> Tuple[bool, NDArray]:
+        if self._array is None or self._pos >= self._meta.frames:
+            return False, image if image is not None else zeros((0,), dtype=uint8)
+
+        frame = self._array[self._pos]
+        self._pos += 1
+
+        if image is not None:
+            copyto(image, frame)
+            return True, image
+        else:
+            return True, frame
+
+    def release(self) -> None:
+        self._array = None
+
+
+class CvlFrameStore:
+    @staticmethod
+    def cvl_create_frame_store(
+        source: Union[str, FrameSourceInterface],
+        directory: str,
+        max_frames: Optional[int] = None,
+        overwrite=False,
+    ):
+        return create_frame_store(source, directory, max_frames, overwrite)
+
+    @staticmethod
+    def cvl_open_frame_store(directory: str):
+        return FrameStore(directory)
+
+
+def main(cmdline: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m cvlayer.cv.frame_store",
+        description="Decode a video once into a memory-mapped raw frame store.",
+    )
+    parser.add_argument("source", help="The video file or stream URL")
+    parser.add_argument("directory", help="The frame store directory")
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=None,
+        help="The maximum number of frames to decode",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        default=False,
+        help="Overwrite an existing frame store",
+    )
+    args = parser.parse_args(cmdline)
+
+    meta = create_frame_store(
+        args.source,
+        args.directory,
+        args.max_frames,
+        args.overwrite,
+    )
+    shape = "x".join(str(v) for v in meta.frame_shape)
+    print(f"{meta.frames} frames ({shape}) -> {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
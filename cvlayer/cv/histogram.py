@@ -3,7 +3,7 @@
 from typing import Final, List, Optional, Sequence, Tuple
 
 import cv2
-from numpy import full, uint8
+from numpy import arange, float64, full, uint8
 from numpy.typing import NDArray
 
 from cvlayer.cv.color import PIXEL_8BIT_MAX
@@ -26,7 +26,7 @@ from cvlayer.palette.basic import (
     WHITE,
     YELLOW,
 )
-from cvlayer.typing import PointF, RectI
+from cvlayer.typing import PointF, PointI, RectI
 
 RANGE_MAX: Final[int] = PIXEL_8BIT_MAX + 1
 DEFAULT_HIST_SIZE: Final[Sequence[int]] = (RANGE_MAX,)
@@ -82,12 +82,12 @@ def equalize_hist(src: NDArray) -> NDArray:
     return cv2.equalizeHist(src)
 
 
-def normalize_drawable_histogram(
+def normalize_drawable_histogram_xy(
     hist: NDArray,
     width: int,
     height: int,
     hist_size=RANGE_MAX,
-) -> List[PointF]:
+) -> Tuple[NDArray, NDArray]:
     normalized = hist.copy()
     cv2.normalize(
         src=hist,
@@ -96,13 +96,32 @@ def normalize_drawable_histogram(
         beta=float(height),
         norm_type=cv2.NORM_MINMAX,
     )
-    width_step = width / hist_size
-    result = list()
-    for i in range(hist_size):
-        x = i * width_step
-        y = float(normalized[i])
-        result.append((x, y))
-    return result
+    xs = arange(hist_size, dtype=float64) * (width / hist_size)
+    ys = normalized.ravel()[:hist_size].astype(float64)
+    return xs, ys
+
+
+def normalize_drawable_histogram(
+    hist: NDArray,
+    width: int,
+    height: int,
+    hist_size=RANGE_MAX,
+) -> List[PointF]:
+    xs, ys = normalize_drawable_histogram_xy(hist, width, height, hist_size)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def default_channel_colors(channels: int) -> Sequence[Color]:
+    if channels == 1:
+        return (RED,)
+    elif channels == 2:
+        return AQUA, YELLOW
+    elif channels == 3:
+        return BLUE, GREEN, RED
+    elif channels == 4:
+        return BLUE, GREEN, RED, FUCHSIA
+    else:
+        raise ValueError(f"Unsupported channels: {channels}")
 
 
 def draw_histogram_channel(
@@ -125,9 +144,7 @@ def draw_histogram_channel(
         if (x2 - x1) * (y2 - y1) != 0:
             analysis = analysis[y1:y2, x1:x2]
     hist = calc_hist([analysis], [index], hist_size=hist_size, ranges=ranges)
-    points = normalize_drawable_histogram(hist, width, height)
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
+    xs, ys = normalize_drawable_histogram_xy(hist, width, height)
 
     draw_plot_2d(
         canvas,
@@ -164,19 +181,7 @@ def draw_histogram_channels(
     else:
         raise ValueError(f"Unsupported analysis shape: {shape_size}")
 
-    if colors:
-        channels_color = colors
-    else:
-        if channels == 1:
-            channels_color = (RED,)
-        elif channels == 2:
-            channels_color = AQUA, YELLOW
-        elif channels == 3:
-            channels_color = BLUE, GREEN, RED
-        elif channels == 4:
-            channels_color = BLUE, GREEN, RED, FUCHSIA
-        else:
-            raise ValueError(f"Unsupported channels: {channels}")
+    channels_color = colors if colors else default_channel_colors(channels)
 
     for i in range(channels):
         draw_histogram_channel(
@@ -192,24 +197,16 @@ def draw_histogram_channels(
         )
 
 
-def draw_histogram_channels_with_decorate(
-    canvas: NDArray,
+def _make_decorated_box(
     roi: RectI,
-    analysis: NDArray,
-    analysis_roi: Optional[RectI] = None,
-    channels_max: Sequence[float] = (RANGE_MAX, RANGE_MAX, RANGE_MAX),
-    colors: Optional[Sequence[Color]] = None,
-    thickness=THICKNESS,
-    line=DEFAULT_LINE_TYPE,
     background_color=BACKGROUND_COLOR,
-    background_alpha=BACKGROUND_ALPHA,
     outline_color=OUTLINE_COLOR,
     padding=PADDING,
     padding_color=BLACK,
     guide_thickness=GUIDE_THICKNESS,
     draw_axis=False,
     draw_guide=True,
-) -> None:
+) -> Tuple[NDArray, RectI, PointI]:
     x1, y1, x2, y2 = roi
     box_left = min(x1, x2)
     box_right = max(x1, x2)
@@ -244,6 +241,38 @@ def draw_histogram_channels_with_decorate(
         left_center1 = plot_left - (padding // 2), left_center0[1]
         draw_line(box, left_center0, left_center1, outline_color, guide_thickness)
 
+    return box, plot_canvas_roi, (box_left, box_top)
+
+
+def draw_histogram_channels_with_decorate(
+    canvas: NDArray,
+    roi: RectI,
+    analysis: NDArray,
+    analysis_roi: Optional[RectI] = None,
+    channels_max: Sequence[float] = (RANGE_MAX, RANGE_MAX, RANGE_MAX),
+    colors: Optional[Sequence[Color]] = None,
+    thickness=THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    background_color=BACKGROUND_COLOR,
+    background_alpha=BACKGROUND_ALPHA,
+    outline_color=OUTLINE_COLOR,
+    padding=PADDING,
+    padding_color=BLACK,
+    guide_thickness=GUIDE_THICKNESS,
+    draw_axis=False,
+    draw_guide=True,
+) -> None:
+    box, plot_canvas_roi, box_pos = _make_decorated_box(
+        roi,
+        background_color,
+        outline_color,
+        padding,
+        padding_color,
+        guide_thickness,
+        draw_axis,
+        draw_guide,
+    )
+
     draw_histogram_channels(
         canvas=box,
         roi=plot_canvas_roi,
@@ -255,7 +284,103 @@ def draw_histogram_channels_with_decorate(
         line=line,
     )
 
-    draw_image_coord(canvas, box, box_left, box_top, background_alpha)
+    draw_image_coord(canvas, box, box_pos[0], box_pos[1], background_alpha)
+
+
+def draw_histograms(
+    canvas: NDArray,
+    roi: RectI,
+    histograms: Sequence[NDArray],
+    colors: Optional[Sequence[Color]] = None,
+    thickness=THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+) -> None:
+    """
+    Draw already computed histograms, e.g. the ones of `FrameStats`.
+    """
+
+    width = abs(roi[2] - roi[0])
+    height = abs(roi[3] - roi[1])
+    channels_color = colors if colors else default_channel_colors(len(histograms))
+    for hist, color in zip(histograms, channels_color):
+        xs, ys = normalize_drawable_histogram_xy(hist, width, height, len(hist))
+        draw_plot_2d(
+            canvas,
+            xs,
+            ys,
+            roi=roi,
+            color=color,
+            thickness=thickness,
+            line=line,
+            mode=PlotMode.LINE,
+        )
+
+
+def make_histograms_box(
+    roi: RectI,
+    histograms: Sequence[NDArray],
+    colors: Optional[Sequence[Color]] = None,
+    thickness=THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    background_color=BACKGROUND_COLOR,
+    outline_color=OUTLINE_COLOR,
+    padding=PADDING,
+    padding_color=BLACK,
+    guide_thickness=GUIDE_THICKNESS,
+    draw_axis=False,
+    draw_guide=True,
+) -> Tuple[NDArray, PointI]:
+    """
+    Render the decorated histograms box as a sprite.
+
+    :return: The box image and its top-left position.
+    """
+
+    box, plot_canvas_roi, box_pos = _make_decorated_box(
+        roi,
+        background_color,
+        outline_color,
+        padding,
+        padding_color,
+        guide_thickness,
+        draw_axis,
+        draw_guide,
+    )
+    draw_histograms(box, plot_canvas_roi, histograms, colors, thickness, line)
+    return box, box_pos
+
+
+def draw_histograms_with_decorate(
+    canvas: NDArray,
+    roi: RectI,
+    histograms: Sequence[NDArray],
+    colors: Optional[Sequence[Color]] = None,
+    thickness=THICKNESS,
+    line=DEFAULT_LINE_TYPE,
+    background_color=BACKGROUND_COLOR,
+    background_alpha=BACKGROUND_ALPHA,
+    outline_color=OUTLINE_COLOR,
+    padding=PADDING,
+    padding_color=BLACK,
+    guide_thickness=GUIDE_THICKNESS,
+    draw_axis=False,
+    draw_guide=True,
+) -> None:
+    box, box_pos = make_histograms_box(
+        roi,
+        histograms,
+        colors,
+        thickness,
+        line,
+        background_color,
+        outline_color,
+        padding,
+        padding_color,
+        guide_thickness,
+        draw_axis,
+        draw_guide,
+    )
+    draw_image_coord(canvas, box, box_pos[0], box_pos[1], background_alpha)
 
 
 class CvlHistogram:
@@ -298,6 +423,20 @@ class CvlHistogram:
     def cvl_equalize_hist(src: NDArray):
         return equalize_hist(src)
 
+    @staticmethod
+    def cvl_normalize_drawable_histogram_xy(
+        hist: NDArray,
+        width: int,
+        height: int,
+        hist_size=RANGE_MAX,
+    ):
+        return normalize_drawable_histogram_xy(
+            hist=hist,
+            width=width,
+            height=height,
+            hist_size=hist_size,
+        )
+
     @staticmethod
     def cvl_normalize_drawable_histogram(
         hist: NDArray,
@@ -393,3 +532,81 @@ class CvlHistogram:
             draw_axis=draw_axis,
             draw_guide=draw_guide,
         )
+
+    @staticmethod
+    def cvl_draw_histograms(
+        canvas: NDArray,
+        roi: RectI,
+        histograms: Sequence[NDArray],
+        colors: Optional[Sequence[Color]] = None,
+        thickness=THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+    ):
+        return draw_histograms(
+            canvas=canvas,
+            roi=roi,
+            histograms=histograms,
+            colors=colors,
+            thickness=thickness,
+            line=line,
+        )
+
+    @staticmethod
+    def cvl_draw_histograms_with_decorate(
+        canvas: NDArray,
+        roi: RectI,
+        histograms: Sequence[NDArray],
+        colors: Optional[Sequence[Color]] = None,
+        thickness=THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        background_color=BACKGROUND_COLOR,
+        background_alpha=BACKGROUND_ALPHA,
+        padding=PADDING,
+        padding_color=BLACK,
+        guide_thickness=GUIDE_THICKNESS,
+        draw_axis=False,
+        draw_guide=True,
+    ):
+        return draw_histograms_with_decorate(
+            canvas=canvas,
+            roi=roi,
+            histograms=histograms,
+            colors=colors,
+            thickness=thickness,
+            line=line,
+            background_color=background_color,
+            background_alpha=background_alpha,
+            padding=padding,
+            padding_color=padding_color,
+            guide_thickness=guide_thickness,
+            draw_axis=draw_axis,
+            draw_guide=draw_guide,
+        )
+
+    @staticmethod
+    def cvl_make_histograms_box(
+        roi: RectI,
+        histograms: Sequence[NDArray],
+        colors: Optional[Sequence[Color]] = None,
+        thickness=THICKNESS,
+        line=DEFAULT_LINE_TYPE,
+        background_color=BACKGROUND_COLOR,
+        padding=PADDING,
+        padding_color=BLACK,
+        guide_thickness=GUIDE_THICKNESS,
+        draw_axis=False,
+        draw_guide=True,
+    ):
+        return make_histograms_box(
+            roi=roi,
+            histograms=histograms,
+            colors=colors,
+            thickness=thickness,
+            line=line,
+            background_color=background_color,
+            padding=padding,
+            padding_color=padding_color,
+            guide_thickness=guide_thickness,
+            draw_axis=draw_axis,
+            draw_guide=draw_guide,
+        )
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from functools import lru_cache
+from os import path, stat
+from threading import Lock
+from typing import Final, NamedTuple, Optional, Tuple
+
+from numpy.typing import NDArray
+
+from cvlayer.cv.image_io import image_read
+
+DEFAULT_IMAGE_CACHE_BYTES: Final[int] = 256 * 1024 * 1024
+
+ImageCacheKey = Tuple[str, Optional[int]]
+
+
+class ImageCacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    image: NDArray
+
+
+class ImageCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ImageCache:
+    """
+    Size-bounded LRU cache of decoded images, keyed by path and read flags.
+
+    An entry is reloaded when the file's modification time or size changes.
+    Cached images are shared between callers, so they are returned read-only.
+    """
+
+    _entries: OrderedDict[ImageCacheKey, ImageCacheEntry]
+
+    def __init__(self, max_bytes=DEFAULT_IMAGE_CACHE_BYTES):
+        if max_bytes < 0:
+            raise ValueError("The 'max_bytes' argument must not be negative")
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def stats(self) -> ImageCacheStats:
+        with self._lock:
+            return ImageCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._nbytes,
+            )
+
+    def _pop(self, key: ImageCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.image.nbytes
+
+    def _shrink(self) -> None:
+        while self._nbytes > self._max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry.image.nbytes
+            self._evictions += 1
+
+    def read(self, filename: str, flags: Optional[int] = None) -> Optional[NDArray]:
+        """
+        :return: `None` if the file can't be read, as with `image_read`.
+        """
+
+        key = path.abspath(filename), flags
+        try:
+            st = stat(key[0])
+        except OSError:
+            with self._lock:
+                self._pop(key)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.image
+                self._pop(key)
+            self._misses += 1
+
+        # Decode outside the lock so other files can be served in the meantime.
+        image = image_read(key[0], flags)
+        if image is None:
+            return None
+
+        image.setflags(write=False)
+        if image.nbytes > self._max_bytes:
+            return image
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = ImageCacheEntry(st.st_mtime_ns, st.st_size, image)
+            self._nbytes += image.nbytes
+            self._shrink()
+        return image
+
+    def invalidate(self, filename: str) -> None:
+        filename = path.abspath(filename)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == filename]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+@lru_cache
+def default_image_cache() -> ImageCache:
+    return ImageCache()
+
+
+class CvlImageCache:
+    @staticmethod
+    def cvl_create_image_cache(max_bytes=DEFAULT_IMAGE_CACHE_BYTES):
+        return ImageCache(max_bytes)
+
+    @staticmethod
+    def cvl_default_image_cache():
+        return default_image_cache()
@@ -1,11 +1,30 @@
 # -*- coding: utf-8 -*-
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, unique
-from typing import Final, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import cv2
+from numpy import frombuffer, memmap, ndarray, uint8
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from cvlayer.cv.image_cache import ImageCache
+
 WINDOWS_BITMAP_SUFFIX: Final[Sequence[str]] = ".bmp", ".dib"
 JPEG_SUFFIX: Final[Sequence[str]] = ".jpeg", ".jpg", ".jpe"
 JPEG_2000_SUFFIX: Final[Sequence[str]] = (".jp2",)
@@ -17,6 +36,11 @@ TIFF_SUFFIX: Final[Sequence[str]] = ".tiff", ".tif"
 OPENEXR_SUFFIX: Final[Sequence[str]] = (".exr",)
 RADIANCE_HDR_SUFFIX: Final[Sequence[str]] = ".hdr", ".pic"
 
+DEFAULT_PREFETCH_SIZE: Final[int] = 8
+
+ImageBuffer = Union[bytes, bytearray, memoryview, NDArray]
+ImageCacheOption = Union[bool, "ImageCache"]
+
 
 @unique
 class ImWriteJpegSamplingFactor(Enum):
@@ -234,9 +258,7 @@ def image_write(
         return cv2.imwrite(filename, image)
 
 
-def image_write_jpeg(
-    filename: str,
-    image: NDArray,
+def jpeg_params(
     *,
     quality: Optional[int] = None,
     progressive: Optional[bool] = None,
@@ -245,8 +267,7 @@ def image_write_jpeg(
     luma_quality: Optional[int] = None,
     chroma_quality: Optional[int] = None,
     sampling_factor: Optional[ImWriteJpegSamplingFactor] = None,
-) -> bool:
-    assert any([filename.lower().endswith(suffix) for suffix in JPEG_SUFFIX])
+) -> List[int]:
     params = list()
     if quality is not None:
         assert 0 <= quality <= 100
@@ -266,18 +287,15 @@ def image_write_jpeg(
         params += [ImWriteFlags.JPEG_CHROMA_QUALITY.value, chroma_quality]
     if sampling_factor is not None:
         params += [ImWriteFlags.JPEG_SAMPLING_FACTOR.value, sampling_factor.value]
-    return image_write(filename, image, params)
+    return params
 
 
-def image_write_png(
-    filename: str,
-    image: NDArray,
+def png_params(
     *,
     compression: Optional[int] = None,
     strategy: Optional[ImWritePngStrategy] = None,
     binary_level: Optional[bool] = None,
-) -> bool:
-    assert any([filename.lower().endswith(suffix) for suffix in PNG_SUFFIX])
+) -> List[int]:
     params = list()
     if compression is not None:
         assert 0 <= compression <= 9
@@ -286,10 +304,171 @@ def image_write_png(
         params += [ImWriteFlags.PNG_STRATEGY.value, strategy.value]
     if binary_level is not None:
         params += [ImWriteFlags.PNG_BILEVEL.value, 1 if binary_level else 0]
+    return params
+
+
+def image_write_jpeg(
+    filename: str,
+    image: NDArray,
+    *,
+    quality: Optional[int] = None,
+    progressive: Optional[bool] = None,
+    optimize: Optional[bool] = None,
+    rst_interval: Optional[int] = None,
+    luma_quality: Optional[int] = None,
+    chroma_quality: Optional[int] = None,
+    sampling_factor: Optional[ImWriteJpegSamplingFactor] = None,
+) -> bool:
+    assert any([filename.lower().endswith(suffix) for suffix in JPEG_SUFFIX])
+    params = jpeg_params(
+        quality=quality,
+        progressive=progressive,
+        optimize=optimize,
+        rst_interval=rst_interval,
+        luma_quality=luma_quality,
+        chroma_quality=chroma_quality,
+        sampling_factor=sampling_factor,
+    )
+    return image_write(filename, image, params)
+
+
+def image_write_png(
+    filename: str,
+    image: NDArray,
+    *,
+    compression: Optional[int] = None,
+    strategy: Optional[ImWritePngStrategy] = None,
+    binary_level: Optional[bool] = None,
+) -> bool:
+    assert any([filename.lower().endswith(suffix) for suffix in PNG_SUFFIX])
+    params = png_params(
+        compression=compression,
+        strategy=strategy,
+        binary_level=binary_level,
+    )
     return image_write(filename, image, params)
 
 
-def image_read(filename: str, flags: Optional[int] = None) -> NDArray:
+def image_encode(
+    suffix: str,
+    image: NDArray,
+    params: Optional[Sequence[int]] = None,
+) -> NDArray:
+    """
+    Encode the image in memory. The format is selected by `suffix` (e.g. '.png').
+
+    :return: The encoded `uint8` buffer. Use `.tobytes()` or `memoryview()` on it.
+    """
+
+    if params:
+        retval, buffer = cv2.imencode(suffix, image, params)
+    else:
+        retval, buffer = cv2.imencode(suffix, image)
+    if not retval:
+        raise ValueError(f"Failed to encode the image as '{suffix}'")
+    return buffer
+
+
+def image_encode_jpeg(
+    image: NDArray,
+    *,
+    quality: Optional[int] = None,
+    progressive: Optional[bool] = None,
+    optimize: Optional[bool] = None,
+    rst_interval: Optional[int] = None,
+    luma_quality: Optional[int] = None,
+    chroma_quality: Optional[int] = None,
+    sampling_factor: Optional[ImWriteJpegSamplingFactor] = None,
+) -> NDArray:
+    params = jpeg_params(
+        quality=quality,
+        progressive=progressive,
+        optimize=optimize,
+        rst_interval=rst_interval,
+        luma_quality=luma_quality,
+        chroma_quality=chroma_quality,
+        sampling_factor=sampling_factor,
+    )
+    return image_encode(JPEG_SUFFIX[0], image, params)
+
+
+def image_encode_png(
+    image: NDArray,
+    *,
+    compression: Optional[int] = None,
+    strategy: Optional[ImWritePngStrategy] = None,
+    binary_level: Optional[bool] = None,
+) -> NDArray:
+    params = png_params(
+        compression=compression,
+        strategy=strategy,
+        binary_level=binary_level,
+    )
+    return image_encode(PNG_SUFFIX[0], image, params)
+
+
+def as_byte_buffer(buffer: ImageBuffer) -> NDArray[uint8]:
+    """
+    Wrap the buffer as a 1-D `uint8` array without copying.
+    """
+
+    if isinstance(buffer, ndarray):
+        if not buffer.flags.c_contiguous:
+            raise ValueError("The buffer array must be C-contiguous")
+        return buffer.reshape(-1).view(uint8)
+    else:
+        return frombuffer(buffer, dtype=uint8)
+
+
+def image_decode(buffer: ImageBuffer, flags: Optional[int] = None) -> NDArray:
+    """
+    Decode an encoded image from `bytes`, `bytearray`, `memoryview` or
+    a (memory-mapped) array, without a temporary file or an intermediate copy.
+    """
+
+    data = as_byte_buffer(buffer)
+    if flags is not None:
+        return cv2.imdecode(data, flags)
+    else:
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+def image_decode_file_range(
+    filename: str,
+    offset=0,
+    size: Optional[int] = None,
+    flags: Optional[int] = None,
+) -> NDArray:
+    """
+    Decode an image stored at `offset` in a larger file (e.g. a `.tar` blob).
+    Only the mapped pages of the requested range are read.
+    """
+
+    mapped = memmap(filename, dtype=uint8, mode="r")
+    end = len(mapped) if size is None else offset + size
+    if not 0 <= offset < end <= len(mapped):
+        raise ValueError(f"Invalid byte range [{offset}, {end}) for '{filename}'")
+    return image_decode(mapped[offset:end], flags)
+
+
+def image_read(
+    filename: str,
+    flags: Optional[int] = None,
+    cache: ImageCacheOption = False,
+) -> NDArray:
+    """
+    :param cache: `True` to read through the default image cache,
+        or the `ImageCache` to read through. Cached images are read-only.
+    """
+
+    if cache is not False:
+        # The cache module decodes through this function, so import it lazily.
+        from cvlayer.cv.image_cache import default_image_cache
+
+        image_cache = default_image_cache() if cache is True else cache
+        # `None` for unreadable files, like `cv2.imread`.
+        return cast(NDArray, image_cache.read(filename, flags))
+
     if flags is not None:
         return cv2.imread(filename, flags)
     else:
@@ -354,10 +533,120 @@ def image_read_with_kwargs(
     return image_read_with_modes(filename, modes)
 
 
+class ImageReadResult(NamedTuple):
+    filename: str
+    image: Optional[NDArray]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ImageWriteResult(NamedTuple):
+    filename: str
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def image_read_result(filename: str, flags: Optional[int] = None) -> ImageReadResult:
+    try:
+        image = image_read(filename, flags)
+    except Exception as e:
+        return ImageReadResult(filename, None, e)
+
+    # `cv2.imread` reports missing or undecodable files by returning `None`.
+    if image is None:
+        return ImageReadResult(filename, None, OSError(f"Failed to read: '{filename}'"))
+    return ImageReadResult(filename, image, None)
+
+
+def image_write_result(
+    filename: str,
+    image: NDArray,
+    params: Optional[Sequence[int]] = None,
+) -> ImageWriteResult:
+    try:
+        if not image_write(filename, image, params):
+            return ImageWriteResult(filename, OSError(f"Failed to write: '{filename}'"))
+    except Exception as e:
+        return ImageWriteResult(filename, e)
+    return ImageWriteResult(filename, None)
+
+
+def image_read_many(
+    filenames: Iterable[str],
+    flags: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[ImageReadResult]:
+    """
+    Read the files in a thread pool. The results are in the order of `filenames`,
+    and a failed file is reported in its result instead of aborting the batch.
+    """
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(image_read_result, f, flags) for f in filenames]
+        return [future.result() for future in futures]
+
+
+def image_read_prefetch(
+    filenames: Iterable[str],
+    flags: Optional[int] = None,
+    prefetch=DEFAULT_PREFETCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[ImageReadResult]:
+    """
+    Iterate over the read results in order,
+    decoding up to `prefetch` files ahead of the consumer.
+    """
+
+    if prefetch < 1:
+        raise ValueError("The 'prefetch' argument must be at least 1")
+
+    pending: Deque[Future[ImageReadResult]] = deque()
+    files = iter(filenames)
+    executor = ThreadPoolExecutor(max_workers)
+
+    try:
+        for filename in files:
+            pending.append(executor.submit(image_read_result, filename, flags))
+            if len(pending) >= prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def image_write_many(
+    items: Iterable[Tuple[str, NDArray]],
+    params: Optional[Sequence[int]] = None,
+    max_workers: Optional[int] = None,
+) -> List[ImageWriteResult]:
+    """
+    Encode and write `(filename, image)` pairs in a thread pool.
+    The results are in the order of `items`.
+    """
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(image_write_result, filename, image, params)
+            for filename, image in items
+        ]
+        return [future.result() for future in futures]
+
+
 class CvlImageIo:
     @staticmethod
-    def cvl_image_read(filename: str, flags: int) -> NDArray:
-        return image_read(filename, flags)
+    def cvl_image_read(
+        filename: str,
+        flags: Optional[int] = None,
+        cache: ImageCacheOption = False,
+    ) -> NDArray:
+        return image_read(filename, flags, cache)
 
     @staticmethod
     def cvl_image_write_jpeg(
@@ -454,3 +743,87 @@ class CvlImageIo:
             reduced_color_8=reduced_color_8,
             ignore_orientation=ignore_orientation,
         )
+
+    @staticmethod
+    def cvl_image_read_many(
+        filenames: Iterable[str],
+        flags: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ):
+        return image_read_many(filenames, flags, max_workers)
+
+    @staticmethod
+    def cvl_image_read_prefetch(
+        filenames: Iterable[str],
+        flags: Optional[int] = None,
+        prefetch=DEFAULT_PREFETCH_SIZE,
+        max_workers: Optional[int] = None,
+    ):
+        return image_read_prefetch(filenames, flags, prefetch, max_workers)
+
+    @staticmethod
+    def cvl_image_write_many(
+        items: Iterable[Tuple[str, NDArray]],
+        params: Optional[Sequence[int]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        return image_write_many(items, params, max_workers)
+
+    @staticmethod
+    def cvl_image_encode(
+        suffix: str,
+        image: NDArray,
+        params: Optional[Sequence[int]] = None,
+    ):
+        return image_encode(suffix, image, params)
+
+    @staticmethod
+    def cvl_image_encode_jpeg(
+        image: NDArray,
+        *,
+        quality: Optional[int] = None,
+        progressive: Optional[bool] = None,
+        optimize: Optional[bool] = None,
+        rst_interval: Optional[int] = None,
+        luma_quality: Optional[int] = None,
+        chroma_quality: Optional[int] = None,
+        sampling_factor: Optional[ImWriteJpegSamplingFactor] = None,
+    ):
+        return image_encode_jpeg(
+            image,
+            quality=quality,
+            progressive=progressive,
+            optimize=optimize,
+            rst_interval=rst_interval,
+            luma_quality=luma_quality,
+            chroma_quality=chroma_quality,
+            sampling_factor=sampling_factor,
+        )
+
+    @staticmethod
+    def cvl_image_encode_png(
+        image: NDArray,
+        *,
+        compression: Optional[int] = None,
+        strategy: Optional[ImWritePngStrategy] = None,
+        binary_level: Optional[bool] = None,
+    ):
+        return image_encode_png(
+            image,
+            compression=compression,
+            strategy=strategy,
+            binary_level=binary_level,
+        )
+
+    @staticmethod
+    def cvl_image_decode(buffer: ImageBuffer, flags: Optional[int] = None):
+        return image_decode(buffer, flags)
+
+    @staticmethod
+    def cvl_image_decode_file_range(
+        filename: str,
+        offset=0,
+        size: Optional[int] = None,
+        flags: Optional[int] = None,
+    ):
+        return image_decode_file_range(filename, offset, size, flags)
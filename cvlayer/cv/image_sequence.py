@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from glob import glob
+from os import listdir, path
+from re import Pattern
+from re import compile as re_compile
+from typing import Deque, Final, List, Optional, Sequence, Tuple, Union
+
+from numpy import copyto, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.frame_source import FrameSourceInterface
+from cvlayer.cv.image_io import (
+    JPEG_2000_SUFFIX,
+    JPEG_SUFFIX,
+    PNG_SUFFIX,
+    PORTABLE_IMAGE_SUFFIX,
+    TIFF_SUFFIX,
+    WEBP_SUFFIX,
+    WINDOWS_BITMAP_SUFFIX,
+    image_read,
+)
+
+IMAGE_SEQUENCE_SUFFIX: Final[Sequence[str]] = (
+    *WINDOWS_BITMAP_SUFFIX,
+    *JPEG_SUFFIX,
+    *JPEG_2000_SUFFIX,
+    *PNG_SUFFIX,
+    *WEBP_SUFFIX,
+    *PORTABLE_IMAGE_SUFFIX,
+    *TIFF_SUFFIX,
+)
+DEFAULT_IMAGE_SEQUENCE_FPS: Final[float] = 30.0
+DEFAULT_READ_AHEAD: Final[int] = 8
+
+NATURAL_SORT_PATTERN: Final[Pattern] = re_compile(r"(\d+)")
+
+
+def natural_sort_key(text: str) -> List[Union[int, str]]:
+    """
+    Sort key that compares digit runs numerically. e.g. 'img2' < 'img10'
+    """
+
+    parts = NATURAL_SORT_PATTERN.split(text)
+    return [int(p) if p.isdigit() else p.lower() for p in parts]
+
+
+def find_image_files(
+    source: str,
+    suffixes: Sequence[str] = IMAGE_SEQUENCE_SUFFIX,
+) -> List[str]:
+    """
+    Find image files in a directory, or with a glob pattern, in natural order.
+    """
+
+    if path.isdir(source):
+        files = [path.join(source, name) for name in listdir(source)]
+    else:
+        files = glob(source)
+
+    files = [f for f in files if path.isfile(f)]
+    files = [f for f in files if path.splitext(f)[1].lower() in suffixes]
+    return sorted(files, key=natural_sort_key)
+
+
+class ImageSequence(FrameSourceInterface):
+    """
+    A frame source that decodes still images in a thread pool.
+
+    The files are decoded in order, `read_ahead` frames ahead of the current
+    position. Seeking drops the pending decodes and restarts from the new position.
+
+    Every image must decode to the shape and dtype of the first one.
+    Otherwise `read()` raises `ValueError`, so a bad file is never mistaken
+    for the end of the sequence.
+    """
+
+    _pending: Deque[Tuple[int, Future]]
+
+    def __init__(
+        self,
+        source: Union[str, Sequence[str]],
+        fps=DEFAULT_IMAGE_SEQUENCE_FPS,
+        flags: Optional[int] = None,
+        read_ahead=DEFAULT_READ_AHEAD,
+        max_workers: Optional[int] = None,
+    ):
+        if isinstance(source, str):
+            self._files = find_image_files(source)
+        else:
+            self._files = list(source)
+
+        if not self._files:
+            raise FileNotFoundError(f"Not found image files: '{source}'")
+        if fps <= 0:
+            raise ValueError("The 'fps' argument must be greater than 0")
+        if read_ahead < 1:
+            raise ValueError("The 'read_ahead' argument must be at least 1")
+
+        self._fps = fps
+        self._flags = flags
+        self._read_ahead = read_ahead
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers)
+        self._pending = deque()
+        self._pos = 0
+
+        self._fill()
+        first = self._pending[0][1].result()
+        if first is None:
+            raise ValueError(f"Failed to decode the first image: '{self._files[0]}'")
+        self._width = first.shape[1]
+        self._height = first.shape[0]
+        self._shape = first.shape
+        self._dtype = first.dtype
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def files(self) -> List[str]:
+        return self._files
+
+    @property
+    def read_ahead(self) -> int:
+        return self._read_ahead
+
+    def _decode(self, index: int) -> Optional[NDArray]:
+        return image_read(self._files[index], self._flags)
+
+    def _fill(self) -> None:
+        if self._executor is None:
+            return
+
+        begin = self._pending[-1][0] + 1 if self._pending else self._pos
+        end = min(self._pos + self._read_ahead, len(self._files))
+        for index in range(begin, end):
+            self._pending.append((index, self._executor.submit(self._decode, index)))
+
+    def _cancel(self) -> None:
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+
+    def _pop(self) -> Optional[Future]:
+        if self._pending and self._pending[0][0] != self._pos:
+            self._cancel()
+        self._fill()
+        if not self._pending:
+            return None
+
+        index, future = self._pending.popleft()
+        assert index == self._pos
+        self._pos += 1
+        self._fill()
+        return future
+
+    def file_at(self, index: int) -> str:
+        return self._files[index]
+
+    @property
+    def opened(self) -> bool:
+        return self._executor is not None
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def frames(self) -> int:
+        return len(self._files)
+
+    @property
+    def pos(self) -> int:
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: int) -> None:
+        value = min(max(value, 0), len(self._files))
+        if value == self._pos:
+            return
+        self._cancel()
+        self._pos = value
+        self._fill()
+
+    def grab(self) -> bool:
+        future = self._pop()
+        if future is None:
+            return False
+        future.cancel()
+        return True
+
+    def read(self, image: Optional[NDArray] = None) -> Tuple[bool, NDArray]:
+        future = self._pop()
+        if future is None:
+            return False, image if image is not None else zeros((0,), dtype=uint8)
+
+        frame = future.result()
+        filename = self._files[self._pos - 1]
+        if frame is None:
+            raise ValueError(f"Failed to decode the image: '{filename}'")
+        if frame.shape != self._shape or frame.dtype != self._dtype:
+            raise ValueError(
+                f"The image '{filename}' has a different shape or dtype"
+                f" than the first image: {frame.shape} {frame.dtype}"
+            )
+
+        if image is not None:
+            copyto(image, frame)
+            return True, image
+        else:
+            return True, frame
+
+    def release(self) -> None:
+        if self._executor is None:
+            return
+        self._cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+
+class CvlImageSequence:
+    @staticmethod
+    def cvl_natural_sort_key(text: str):
+        return natural_sort_key(text)
+
+    @staticmethod
+    def cvl_find_image_files(
+        source: str,
+        suffixes: Sequence[str] = IMAGE_SEQUENCE_SUFFIX,
+    ):
+        return find_image_files(source, suffixes)
+
+    @staticmethod
+    def cvl_create_image_sequence(
+        source: Union[str, Sequence[str]],
+        fps=DEFAULT_IMAGE_SEQUENCE_FPS,
+        flags: Optional[int] = None,
+        read_ahead=DEFAULT_READ_AHEAD,
+        max_workers: Optional[int] = None,
+    ):
+        return ImageSequence(source, fps, flags, read_ahead, max_workers)
@@ -1,6 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from cvlayer.geometry.iou import calculate_iou
+from typing import Optional
+
+from numpy.typing import ArrayLike
+
+from cvlayer.geometry.iou import (
+    DEFAULT_NMS_IOU_THRESHOLD,
+    DEFAULT_SOFT_NMS_SCORE_THRESHOLD,
+    DEFAULT_SOFT_NMS_SIGMA,
+    calculate_iou,
+    calculate_iou_matrix,
+    calculate_iou_pairs,
+    non_maximum_suppression,
+    soft_non_maximum_suppression,
+)
 from cvlayer.typing import RectT
 
 
@@ -8,3 +21,32 @@ class CvlIou:
     @staticmethod
     def cvl_calculate_iou(rect1: RectT, rect2: RectT):
         return calculate_iou(rect1, rect2)
+
+    @staticmethod
+    def cvl_calculate_iou_pairs(rects1: ArrayLike, rects2: ArrayLike):
+        return calculate_iou_pairs(rects1, rects2)
+
+    @staticmethod
+    def cvl_calculate_iou_matrix(rects1: ArrayLike, rects2: ArrayLike):
+        return calculate_iou_matrix(rects1, rects2)
+
+    @staticmethod
+    def cvl_non_maximum_suppression(
+        rects: ArrayLike,
+        scores: ArrayLike,
+        iou_threshold=DEFAULT_NMS_IOU_THRESHOLD,
+        max_outputs: Optional[int] = None,
+    ):
+        return non_maximum_suppression(rects, scores, iou_threshold, max_outputs)
+
+    @staticmethod
+    def cvl_soft_non_maximum_suppression(
+        rects: ArrayLike,
+        scores: ArrayLike,
+        sigma=DEFAULT_SOFT_NMS_SIGMA,
+        score_threshold=DEFAULT_SOFT_NMS_SCORE_THRESHOLD,
+        iou_threshold: Optional[float] = None,
+    ):
+        return soft_non_maximum_suppression(
+            rects, scores, sigma, score_threshold, iou_threshold
+        )
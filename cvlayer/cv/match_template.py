@@ -6,6 +6,8 @@ from typing import NamedTuple, Optional
 import cv2
 from numpy.typing import NDArray
 
+from cvlayer.cv.image_io import ImageCacheOption, image_read
+
 
 @unique
 class MatchTemplateMethod(Enum):
@@ -51,6 +53,32 @@ def match_template(
     return MatchResult(x1, y1, x2, y2, match_val)
 
 
+def match_template_file(
+    src: NDArray,
+    template_filename: str,
+    method=MatchTemplateMethod.SQDIFF_NORMED,
+    mask_filename: Optional[str] = None,
+    flags: Optional[int] = None,
+    cache: ImageCacheOption = True,
+) -> MatchResult:
+    """
+    Match a template (and mask) read through the image cache,
+    so repeated matching doesn't decode the same files again.
+    """
+
+    template = image_read(template_filename, flags, cache)
+    if template is None:
+        raise FileNotFoundError(f"Failed to read template: '{template_filename}'")
+
+    mask: Optional[NDArray] = None
+    if mask_filename is not None:
+        mask = image_read(mask_filename, flags, cache)
+        if mask is None:
+            raise FileNotFoundError(f"Failed to read mask: '{mask_filename}'")
+
+    return match_template(src, template, method, mask)
+
+
 class CvlMatchTemplate:
     @staticmethod
     def cvl_match_template(
@@ -60,3 +88,16 @@ class CvlMatchTemplate:
         mask: Optional[NDArray] = None,
     ):
         return match_template(src, template, method, mask)
+
+    @staticmethod
+    def cvl_match_template_file(
+        src: NDArray,
+        template_filename: str,
+        method=MatchTemplateMethod.SQDIFF_NORMED,
+        mask_filename: Optional[str] = None,
+        flags: Optional[int] = None,
+        cache: ImageCacheOption = True,
+    ):
+        return match_template_file(
+            src, template_filename, method, mask_filename, flags, cache
+        )
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Condition, Thread
+from time import monotonic
+from typing import Final, Optional, Tuple
+
+import cv2
+from numpy import copyto, empty_like
+from numpy.typing import NDArray
+
+DEFAULT_MJPEG_HOST: Final[str] = "127.0.0.1"
+DEFAULT_MJPEG_PORT: Final[int] = 8080
+DEFAULT_MJPEG_QUALITY: Final[int] = 80
+DEFAULT_MJPEG_MIN_QUALITY: Final[int] = 30
+DEFAULT_MJPEG_QUALITY_STEP: Final[int] = 10
+DEFAULT_MJPEG_CLIENT_TIMEOUT: Final[float] = 10.0
+MJPEG_TIME_SMOOTHING: Final[float] = 0.9
+"""The weight of the previous average in the moving averages of the frame times."""
+
+MJPEG_BOUNDARY: Final[str] = "cvlayer-frame"
+
+MJPEG_STREAM_PATHS: Final[Tuple[str, ...]] = "/", "/stream.mjpg"
+MJPEG_SNAPSHOT_PATH: Final[str] = "/snapshot.jpg"
+
+
+def _smooth(average: float, value: float) -> float:
+    if not average:
+        return value
+    return value + (average - value) * MJPEG_TIME_SMOOTHING
+
+
+class MjpegServer:
+    """
+    Serve preview frames as an MJPEG stream over HTTP.
+
+    `submit()` never blocks on the clients. A frame is copied and encoded
+    only while at least one client is waiting for the next frame,
+    and it's encoded once on the encoder thread and shared by all clients.
+
+    A client that is slower than the stream gets the latest frame when it's ready,
+    so the frame rate follows the fastest client. Frames submitted while every
+    client is still writing are refused, which lowers the rate but not the quality.
+    A client lags when writing a frame takes longer on average than both
+    the frame interval and the encoding, so the socket is pushing back,
+    or when it skips frames that were encoded for faster clients.
+    Then the JPEG quality of the next frame is lowered by `quality_step`
+    down to `min_quality`, and it recovers by one level per frame without lag.
+
+    Streams are served at `/` and `/stream.mjpg`, the last frame at `/snapshot.jpg`.
+    """
+
+    _httpd: Optional[ThreadingHTTPServer]
+    _pending: Optional[NDArray]
+    _spare: Optional[NDArray]
+    _jpeg: Optional[bytes]
+
+    def __init__(
+        self,
+        host=DEFAULT_MJPEG_HOST,
+        port=DEFAULT_MJPEG_PORT,
+        quality=DEFAULT_MJPEG_QUALITY,
+        min_quality=DEFAULT_MJPEG_MIN_QUALITY,
+        quality_step=DEFAULT_MJPEG_QUALITY_STEP,
+        max_fps: Optional[float] = None,
+        client_timeout=DEFAULT_MJPEG_CLIENT_TIMEOUT,
+    ):
+        if not 0 <= min_quality <= quality <= 100:
+            raise ValueError("The quality must be in [min_quality, 100]")
+        if quality_step < 1:
+            raise ValueError("The 'quality_step' argument must be at least 1")
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError("The 'max_fps' argument must be positive")
+
+        self._host = host
+        self._port = port
+        self._max_quality = quality
+        self._min_quality = min_quality
+        self._quality_step = quality_step
+        self._interval = 1.0 / max_fps if max_fps else 0.0
+        self._client_timeout = client_timeout
+
+        self._cond = Condition()
+        self._httpd = None
+        self._server_thread: Optional[Thread] = None
+        self._encoder_thread: Optional[Thread] = None
+        self._running = False
+
+        self._pending = None
+        self._spare = None
+        self._last_submit = 0.0
+        self._last_offer = 0.0
+        self._offer_interval = 0.0
+
+        self._jpeg = None
+        self._sequence = 0
+        self._quality = quality
+        self._lagged = False
+        self._encode_time = 0.0
+
+        self._clients = 0
+        self._waiting = 0
+        self._encoded = 0
+        self._dropped = 0
+        self._refused = 0
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The bound address. The port is assigned by the system if it was `0`."""
+
+        if self._httpd is None:
+            return self._host, self._port
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/"
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def clients(self) -> int:
+        return self._clients
+
+    @property
+    def quality(self) -> int:
+        return self._quality
+
+    @property
+    def encoded(self) -> int:
+        """The number of frames encoded so far."""
+        return self._encoded
+
+    @property
+    def dropped(self) -> int:
+        """The number of encoded frames that a client skipped."""
+        return self._dropped
+
+    @property
+    def refused(self) -> int:
+        """The number of frames refused because all clients were still writing."""
+        return self._refused
+
+    @property
+    def frame_interval(self) -> float:
+        """
+        The average interval between the submitted frames in seconds,
+        or the `max_fps` interval if it's longer.
+        """
+
+        return max(self._interval, self._offer_interval)
+
+    def start(self) -> None:
+        if self._running:
+            return
+
+        self._httpd = ThreadingHTTPServer((self._host, self._port), self._handler())
+        self._httpd.daemon_threads = True
+        self._running = True
+
+        self._encoder_thread = Thread(
+            target=self._encode_loop, name="mjpeg-encoder", daemon=True
+        )
+        self._server_thread = Thread(
+            target=self._httpd.serve_forever, name="mjpeg-server", daemon=True
+        )
+        self._encoder_thread.start()
+        self._server_thread.start()
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        assert self._httpd is not None
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+        if self._server_thread is not None:
+            self._server_thread.join()
+        if self._encoder_thread is not None:
+            self._encoder_thread.join()
+
+        self._httpd = None
+        self._server_thread = None
+        self._encoder_thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def submit(self, frame: NDArray) -> bool:
+        """
+        Offer a frame to the clients. The frame is copied, so it can be reused.
+
+        :return: Whether the frame was accepted for encoding.
+        """
+
+        if not self._running or (self._clients == 0 and self._waiting == 0):
+            self._last_offer = 0.0
+            return False
+
+        now = monotonic()
+        if self._last_offer:
+            delta = now - self._last_offer
+            self._offer_interval = _smooth(self._offer_interval, delta)
+        self._last_offer = now
+
+        if self._interval and now - self._last_submit < self._interval:
+            return False
+
+        with self._cond:
+            if self._waiting == 0:
+                if self._clients > 0:
+                    self._refused += 1
+                return False
+
+            # An unconsumed pending frame is overwritten, so only the latest is encoded.
+            buffer = self._pending if self._pending is not None else self._spare
+            if (
+                buffer is None
+                or buffer.shape != frame.shape
+                or buffer.dtype != frame.dtype
+            ):
+                buffer = empty_like(frame)
+            copyto(buffer, frame)
+
+            self._pending = buffer
+            self._spare = None
+            self._last_submit = now
+            self._cond.notify_all()
+        return True
+
+    def _adapt_quality(self) -> int:
+        if self._lagged:
+            quality = self._quality - self._quality_step
+            self._quality = max(quality, self._min_quality)
+        elif self._quality < self._max_quality:
+            self._quality += 1
+        self._lagged = False
+        return self._quality
+
+    def _encode_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                frame = self._pending
+                self._pending = None
+                quality = self._adapt_quality()
+
+            assert frame is not None
+            params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+            begin = monotonic()
+            ok, encoded = cv2.imencode(".jpg", frame, params)
+            duration = monotonic() - begin
+
+            with self._cond:
+                # The buffer is given back for the next frame.
+                if self._pending is None:
+                    self._spare = frame
+                if ok:
+                    self._encode_time = duration
+                    self._jpeg = encoded.tobytes()
+                    self._sequence += 1
+                    self._encoded += 1
+                    self._cond.notify_all()
+
+    def _next_jpeg(self, last: int) -> Optional[Tuple[int, bytes]]:
+        with self._cond:
+            self._waiting += 1
+            try:
+                while self._running and self._sequence == last:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+
+            if not self._running or self._jpeg is None:
+                return None
+
+            if last and self._sequence - last > 1:
+                self._dropped += self._sequence - last - 1
+                self._lagged = True
+            return self._sequence, self._jpeg
+
+    def _stream(self, handler: BaseHTTPRequestHandler) -> None:
+        handler.send_response(200)
+        handler.send_header("Cache-Control", "no-cache, private")
+        handler.send_header("Pragma", "no-cache")
+        handler.send_header(
+            "Content-Type", f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}"
+        )
+        handler.end_headers()
+
+        with self._cond:
+            self._clients += 1
+            # A new client starts from the next frame, not the last one.
+            sequence = self._sequence
+        write_time = 0.0
+        try:
+            while True:
+                result = self._next_jpeg(sequence)
+                if result is None:
+                    break
+                sequence, jpeg = result
+                begin = monotonic()
+                handler.wfile.write(
+                    f"--{MJPEG_BOUNDARY}\r\n"
+                    "Content-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode("ascii")
+                )
+                handler.wfile.write(jpeg)
+                handler.wfile.write(b"\r\n")
+                handler.wfile.flush()
+
+                # The socket is pushing back if the client can't take the frames
+                # as fast as they come, and writing them is slower than encoding them.
+                write_time = _smooth(write_time, monotonic() - begin)
+                budget = max(self.frame_interval, self._encode_time)
+                if budget and write_time > budget:
+                    with self._cond:
+                        self._lagged = True
+        except (BrokenPipeError, ConnectionError, TimeoutError):
+            pass
+        finally:
+            with self._cond:
+                self._clients -= 1
+
+    def _snapshot(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._cond:
+            # Wait for a fresh frame, or fall back to the last one if the stream stalls.
+            self._waiting += 1
+            try:
+                last = self._sequence
+                self._cond.wait_for(
+                    lambda: not self._running or self._sequence != last,
+                    self._client_timeout,
+                )
+            finally:
+                self._waiting -= 1
+            jpeg = self._jpeg
+
+        if jpeg is None:
+            handler.send_error(503, "No frame has been encoded yet")
+            return
+
+        handler.send_response(200)
+        handler.send_header("Cache-Control", "no-cache, private")
+        handler.send_header("Content-Type", "image/jpeg")
+        handler.send_header("Content-Length", str(len(jpeg)))
+        handler.end_headers()
+        handler.wfile.write(jpeg)
+
+    def _handler(self):
+        server = self
+
+        class _MjpegRequestHandler(BaseHTTPRequestHandler):
+            timeout = server._client_timeout
+
+            def do_GET(self):  # noqa
+                path = self.path.split("?", 1)[0]
+                if path in MJPEG_STREAM_PATHS:
+                    server._stream(self)
+                elif path == MJPEG_SNAPSHOT_PATH:
+                    server._snapshot(self)
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):  # noqa
+                pass
+
+        return _MjpegRequestHandler
+
+
+class CvlMjpegServer:
+    @staticmethod
+    def cvl_create_mjpeg_server(
+        host=DEFAULT_MJPEG_HOST,
+        port=DEFAULT_MJPEG_PORT,
+        quality=DEFAULT_MJPEG_QUALITY,
+        max_fps: Optional[float] = None,
+    ):
+        return MjpegServer(host, port, quality, max_fps=max_fps)
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+from math import ceil, sqrt
+from typing import Any, Final, List, Optional, Sequence, Tuple
+
+import cv2
+from numpy import float32, float64, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.color import PIXEL_8BIT_MAX
+from cvlayer.cv.drawable.text.measure import get_text_size
+from cvlayer.palette.basic import BLACK, WHITE
+from cvlayer.typing import RectI, SizeI
+
+DEFAULT_MOSAIC_INTERPOLATION: Final[int] = cv2.INTER_AREA
+DEFAULT_MOSAIC_BACKGROUND_COLOR: Final[Tuple[int, int, int]] = BLACK
+DEFAULT_MOSAIC_LABEL_COLOR: Final[Tuple[int, int, int]] = WHITE
+DEFAULT_MOSAIC_LABEL_SCALE: Final[float] = 0.4
+DEFAULT_MOSAIC_LABEL_PADDING: Final[int] = 3
+
+
+def mosaic_grid(count: int, columns: Optional[int] = None) -> Tuple[int, int]:
+    """
+    :return: The `(columns, rows)` of a grid with at least `count` cells.
+    """
+
+    if count < 1:
+        return 1, 1
+    cols = columns if columns else ceil(sqrt(count))
+    cols = min(max(cols, 1), count)
+    rows = ceil(count / cols)
+    return cols, rows
+
+
+def mosaic_cells(
+    size: SizeI,
+    count: int,
+    columns: Optional[int] = None,
+) -> List[RectI]:
+    width, height = size
+    cols, rows = mosaic_grid(count, columns)
+    cell_width = width // cols
+    cell_height = height // rows
+
+    result = list()
+    for index in range(count):
+        x = (index % cols) * cell_width
+        y = (index // cols) * cell_height
+        result.append((x, y, x + cell_width, y + cell_height))
+    return result
+
+
+def fit_size(src: SizeI, dest: SizeI) -> SizeI:
+    """The largest size inside `dest` with the aspect ratio of `src`."""
+
+    sw, sh = src
+    dw, dh = dest
+    if sw * dh > sh * dw:
+        return dw, max(sh * dw // sw, 1)
+    else:
+        return max(sw * dh // sh, 1), dh
+
+
+class Mosaic:
+    """
+    A grid of thumbnails in a preallocated canvas.
+
+    Each frame is downscaled directly into its cell, with the aspect ratio kept.
+    Gray frames are converted to BGR, and float frames in `[0, 1]` to 8-bit.
+    A cell is redrawn only when its frame, label or `generation` changed.
+    """
+
+    _canvas: NDArray
+    _cells: List[RectI]
+    _keys: List[Optional[Tuple[Any, ...]]]
+
+    def __init__(
+        self,
+        size: SizeI,
+        columns: Optional[int] = None,
+        interpolation=DEFAULT_MOSAIC_INTERPOLATION,
+        background_color=DEFAULT_MOSAIC_BACKGROUND_COLOR,
+        label_color=DEFAULT_MOSAIC_LABEL_COLOR,
+        label_scale=DEFAULT_MOSAIC_LABEL_SCALE,
+    ):
+        width, height = size
+        if width < 1 or height < 1:
+            raise ValueError(f"Invalid mosaic size: {size}")
+
+        self._size = width, height
+        self._columns = columns
+        self._interpolation = interpolation
+        self._background_color = background_color
+        self._label_color = label_color
+        self._label_scale = label_scale
+        self._canvas = zeros((height, width, 3), dtype=uint8)
+        self._canvas[...] = background_color
+        self._cells = list()
+        self._keys = list()
+        self._redraws = 0
+
+    @property
+    def canvas(self) -> NDArray:
+        return self._canvas
+
+    @property
+    def size(self) -> SizeI:
+        return self._size
+
+    @property
+    def cells(self) -> List[RectI]:
+        return self._cells
+
+    @property
+    def redraws(self) -> int:
+        """The number of cells drawn so far."""
+        return self._redraws
+
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """Force the next `update()` to redraw the cell, or all cells."""
+
+        if index is None:
+            self._keys = [None] * len(self._keys)
+        elif 0 <= index < len(self._keys):
+            self._keys[index] = None
+
+    def _relayout(self, count: int) -> None:
+        self._cells = mosaic_cells(self._size, count, self._columns)
+        self._keys = [None] * count
+        self._canvas[...] = self._background_color
+
+    def _to_bgr8(self, thumbnail: NDArray, dest: NDArray) -> None:
+        if thumbnail.dtype in (float32, float64):
+            thumbnail = cv2.convertScaleAbs(thumbnail, alpha=PIXEL_8BIT_MAX)
+        elif thumbnail.dtype != uint8:
+            thumbnail = cv2.convertScaleAbs(thumbnail)
+
+        if len(thumbnail.shape) == 2 or thumbnail.shape[2] == 1:
+            cv2.cvtColor(thumbnail, cv2.COLOR_GRAY2BGR, dst=dest)
+        elif thumbnail.shape[2] == 4:
+            cv2.cvtColor(thumbnail, cv2.COLOR_BGRA2BGR, dst=dest)
+        else:
+            dest[...] = thumbnail
+
+    def _draw_cell(self, cell: RectI, frame: Optional[NDArray], label: str) -> None:
+        x1, y1, x2, y2 = cell
+        slot = self._canvas[y1:y2, x1:x2]
+        slot[...] = self._background_color
+
+        if frame is not None and frame.size > 0:
+            src_size = frame.shape[1], frame.shape[0]
+            tw, th = fit_size(src_size, (x2 - x1, y2 - y1))
+            ox = (x2 - x1 - tw) // 2
+            oy = (y2 - y1 - th) // 2
+            dest = slot[oy : oy + th, ox : ox + tw]
+            direct = frame.dtype == uint8 and len(frame.shape) == 3
+            if direct and frame.shape[2] == 3:
+                cv2.resize(frame, (tw, th), dst=dest, interpolation=self._interpolation)
+            else:
+                thumbnail = cv2.resize(
+                    frame, (tw, th), interpolation=self._interpolation
+                )
+                self._to_bgr8(thumbnail, dest)
+
+        if label:
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            (tw, th), baseline = get_text_size(label, font, self._label_scale, 1)
+            p = DEFAULT_MOSAIC_LABEL_PADDING
+            box = 0, 0, tw + p * 2, th + baseline + p * 2
+            cv2.rectangle(slot, box[:2], box[2:], self._background_color, cv2.FILLED)
+            org = p, p + th
+            cv2.putText(slot, label, org, font, self._label_scale, self._label_color, 1)
+
+    def update(
+        self,
+        frames: Sequence[Optional[NDArray]],
+        labels: Optional[Sequence[str]] = None,
+        generation: Any = None,
+    ) -> NDArray:
+        """
+        Draw the frames that changed into their cells.
+
+        A frame counts as unchanged if it's the same object as the last time,
+        and `generation` is equal. Pass a new `generation` (e.g. the frame index)
+        for frames whose buffers are updated in place.
+
+        :return: The mosaic canvas. It's reused, so it must not be modified.
+        """
+
+        count = len(frames)
+        if count != len(self._cells):
+            self._relayout(count)
+
+        for index, frame in enumerate(frames):
+            label = labels[index] if labels is not None else str()
+            key = frame, label, generation
+            last = self._keys[index]
+            if last is not None:
+                if last[0] is frame and last[1] == label and last[2] == generation:
+                    continue
+
+            self._draw_cell(self._cells[index], frame, label)
+            self._keys[index] = key
+            self._redraws += 1
+
+        return self._canvas
+
+
+class CvlMosaic:
+    @staticmethod
+    def cvl_mosaic_grid(count: int, columns: Optional[int] = None):
+        return mosaic_grid(count, columns)
+
+    @staticmethod
+    def cvl_mosaic_cells(size: SizeI, count: int, columns: Optional[int] = None):
+        return mosaic_cells(size, count, columns)
+
+    @staticmethod
+    def cvl_create_mosaic(
+        size: SizeI,
+        columns: Optional[int] = None,
+        interpolation=DEFAULT_MOSAIC_INTERPOLATION,
+    ):
+        return Mosaic(size, columns, interpolation)
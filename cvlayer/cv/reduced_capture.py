@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+from math import isclose
+from typing import Optional, Tuple
+
+import cv2
+from numpy import copyto, ndarray
+from numpy.typing import NDArray
+
+from cvlayer.cv.frame_source import FrameSourceInterface
+from cvlayer.cv.types.interpolation import INTER_AREA, normalize_interpolation
+from cvlayer.cv.video_capture import VideoCapture
+
+
+class ReducedCapture(FrameSourceInterface):
+    """
+    A frame source that delivers downscaled and/or grayscale frames.
+
+    Grayscale output is first requested from the backend.
+    Otherwise each decoded frame is downscaled first and then converted,
+    so the color conversion only touches the reduced pixels.
+    The full-size decode buffer and the intermediate buffer are reused,
+    so full-size frames never leave this class.
+
+    With `reuse_output`, the output buffer is reused as well,
+    so a frame is only valid until the next `read()`; copy it to keep it.
+    """
+
+    _decoded: Optional[NDArray]
+    _resized: Optional[NDArray]
+    _output: Optional[NDArray]
+
+    def __init__(
+        self,
+        source: FrameSourceInterface,
+        scale=1.0,
+        grayscale=False,
+        interpolation=INTER_AREA,
+        request_native=True,
+        reuse_output=True,
+    ):
+        if not 0.0 < scale <= 1.0:
+            raise ValueError("The 'scale' argument must be in the range (0, 1]")
+
+        self._source = source
+        self._scale = scale
+        self._grayscale = grayscale
+        self._interpolation = normalize_interpolation(interpolation)
+        self._native_grayscale = False
+
+        if grayscale and request_native and isinstance(source, VideoCapture):
+            self._native_grayscale = source.request_grayscale()
+
+        # Only a real decoder writes into a given buffer;
+        # other sources would copy their (possibly zero-copy) frames into it.
+        self._reuse_decoded = isinstance(source, VideoCapture)
+        self._reuse_output = reuse_output
+        self._decoded = None
+        self._resized = None
+        self._output = None
+
+        self._width = max(round(source.width * scale), 1)
+        self._height = max(round(source.height * scale), 1)
+
+    @property
+    def source(self) -> FrameSourceInterface:
+        return self._source
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    @property
+    def grayscale(self) -> bool:
+        return self._grayscale
+
+    @property
+    def native_grayscale(self) -> bool:
+        return self._native_grayscale
+
+    @property
+    def reuse_output(self) -> bool:
+        return self._reuse_output
+
+    @property
+    def opened(self) -> bool:
+        return self._source.opened
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def fps(self) -> float:
+        return self._source.fps
+
+    @property
+    def frames(self) -> int:
+        return self._source.frames
+
+    @property
+    def pos(self) -> int:
+        return self._source.pos
+
+    @pos.setter
+    def pos(self, value: int) -> None:
+        self._source.pos = value
+
+    def grab(self) -> bool:
+        return self._source.grab()
+
+    def _decode(self) -> Tuple[bool, NDArray]:
+        if not self._reuse_decoded:
+            return self._source.read()
+
+        retval, frame = self._source.read(self._decoded)
+        if retval:
+            self._decoded = frame
+        return retval, frame
+
+    def _resize(self, frame: NDArray, dst: Optional[NDArray]) -> NDArray:
+        size = self._width, self._height
+        return cv2.resize(frame, size, dst, interpolation=self._interpolation)
+
+    def reduce(self, frame: NDArray, image: Optional[NDArray] = None) -> NDArray:
+        """
+        Downscale and convert a full-size frame, writing into `image` if given.
+        Otherwise, with `reuse_output`, the result is written into the output buffer
+        of the last call, which is reallocated only when its shape or type changes.
+        """
+
+        resize = not isclose(self._scale, 1.0)
+        convert = self._grayscale and len(frame.shape) == 3
+
+        if image is None and self._reuse_output and (resize or convert):
+            # OpenCV writes into `dst` if it fits the result, and reallocates it if not.
+            result = self._reduce(frame, self._output, resize, convert)
+            self._output = result
+            return result
+        return self._reduce(frame, image, resize, convert)
+
+    def _reduce(
+        self,
+        frame: NDArray,
+        image: Optional[NDArray],
+        resize: bool,
+        convert: bool,
+    ) -> NDArray:
+        if resize and convert:
+            resized = self._resize(frame, self._resized)
+            self._resized = resized
+            return cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY, image)
+        elif resize:
+            return self._resize(frame, image)
+        elif convert:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, image)
+        elif image is not None:
+            copyto(image, frame)
+            return image
+        elif frame is self._decoded and not self._reuse_output:
+            # Never hand out the reused decode buffer.
+            return frame.copy()
+        else:
+            return frame
+
+    def read(self, image: Optional[NDArray] = None) -> Tuple[bool, NDArray]:
+        retval, frame = self._decode()
+        if not retval:
+            return False, image if image is not None else frame
+
+        result = self.reduce(frame, image)
+        assert isinstance(result, ndarray)
+        return True, result
+
+    def release(self) -> None:
+        self._source.release()
+        self._decoded = None
+        self._resized = None
+        self._output = None
+
+
+class CvlReducedCapture:
+    @staticmethod
+    def cvl_create_reduced_capture(
+        source: FrameSourceInterface,
+        scale=1.0,
+        grayscale=False,
+        interpolation=INTER_AREA,
+        request_native=True,
+        reuse_output=True,
+    ):
+        return ReducedCapture(
+            source, scale, grayscale, interpolation, request_native, reuse_output
+        )
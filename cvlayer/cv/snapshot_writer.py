@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import makedirs, path
+from queue import Empty, SimpleQueue
+from typing import Final, List, NamedTuple, Sequence, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from numpy.typing import NDArray
+
+from cvlayer.cv.image_io import (
+    JPEG_SUFFIX,
+    PNG_SUFFIX,
+    WEBP_SUFFIX,
+    image_encode,
+    image_write_result,
+)
+
+DEFAULT_SNAPSHOT_WORKERS: Final[int] = 4
+SNAPSHOT_ARCHIVE_SUFFIX: Final[str] = ".zip"
+
+COMPRESSED_IMAGE_SUFFIX: Final[Sequence[str]] = (
+    *JPEG_SUFFIX,
+    *PNG_SUFFIX,
+    *WEBP_SUFFIX,
+)
+
+
+class SnapshotResult(NamedTuple):
+    destination: str
+    files: List[str]
+    errors: List[Tuple[str, Exception]]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def freeze_image(image: NDArray) -> NDArray:
+    """
+    Keep a reference to read-only images, and copy only the writable ones,
+    so the caller can keep modifying its buffers while the snapshot is written.
+    """
+
+    return image.copy() if image.flags.writeable else image
+
+
+class SnapshotWriter:
+    """
+    Write named images in the background.
+
+    Each snapshot is encoded on a thread pool, either as separate files
+    in a directory or into a single zip archive. Finished snapshots are queued
+    so that the UI thread can report them with `poll()`.
+    """
+
+    _done: SimpleQueue[SnapshotResult]
+
+    def __init__(self, max_workers=DEFAULT_SNAPSHOT_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers, "snapshot-encoder")
+        self._coordinator = ThreadPoolExecutor(1, "snapshot-writer")
+        self._done = SimpleQueue()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """The number of submitted snapshots not yet returned by `poll()`."""
+        return self._pending
+
+    def _write_files(
+        self,
+        directory: str,
+        items: Sequence[Tuple[str, NDArray]],
+        ext: str,
+    ) -> SnapshotResult:
+        makedirs(directory, exist_ok=True)
+        filenames = [path.join(directory, f"{name}{ext}") for name, _ in items]
+        futures = [
+            self._pool.submit(image_write_result, filename, image)
+            for filename, (_, image) in zip(filenames, items)
+        ]
+
+        files = list()
+        errors = list()
+        for future in futures:
+            result = future.result()
+            if result.error is None:
+                files.append(result.filename)
+            else:
+                errors.append((result.filename, result.error))
+        return SnapshotResult(directory, files, errors)
+
+    def _write_archive(
+        self,
+        filename: str,
+        items: Sequence[Tuple[str, NDArray]],
+        ext: str,
+    ) -> SnapshotResult:
+        futures = [self._pool.submit(image_encode, ext, image) for _, image in items]
+
+        # Already compressed formats are stored as they are.
+        compression = ZIP_STORED if ext in COMPRESSED_IMAGE_SUFFIX else ZIP_DEFLATED
+
+        files = list()
+        errors = list()
+        with ZipFile(filename, "w", compression) as archive:
+            for (name, _), future in zip(items, futures):
+                member = f"{name}{ext}"
+                try:
+                    archive.writestr(member, future.result().tobytes())
+                    files.append(member)
+                except Exception as e:
+                    errors.append((member, e))
+        return SnapshotResult(filename, files, errors)
+
+    def _run(
+        self,
+        destination: str,
+        items: Sequence[Tuple[str, NDArray]],
+        ext: str,
+        archive: bool,
+        notify=True,
+    ) -> SnapshotResult:
+        try:
+            if archive:
+                result = self._write_archive(destination, items, ext)
+            else:
+                result = self._write_files(destination, items, ext)
+        except Exception as e:
+            result = SnapshotResult(destination, list(), [(destination, e)])
+        if notify:
+            self._done.put(result)
+        return result
+
+    def submit(
+        self,
+        destination: str,
+        items: Sequence[Tuple[str, NDArray]],
+        ext=PNG_SUFFIX[0],
+        archive=False,
+    ) -> Future[SnapshotResult]:
+        """
+        :param destination: The output directory, or the archive filename.
+        :param items: The `(name, image)` pairs. Names don't include the extension.
+        :param ext: The image file extension that selects the encoder.
+        :param archive: Write a single zip archive instead of separate files.
+        """
+
+        frozen = [(name, freeze_image(image)) for name, image in items]
+        self._pending += 1
+        return self._coordinator.submit(self._run, destination, frozen, ext, archive)
+
+    def write(
+        self,
+        destination: str,
+        items: Sequence[Tuple[str, NDArray]],
+        ext=PNG_SUFFIX[0],
+        archive=False,
+    ) -> SnapshotResult:
+        """
+        Write the snapshot and wait for it to finish. It is not reported by `poll()`.
+        """
+
+        return self._run(destination, items, ext, archive, notify=False)
+
+    def poll(self) -> List[SnapshotResult]:
+        """
+        :return: The snapshots finished since the last call.
+        """
+
+        results = list()
+        while True:
+            try:
+                results.append(self._done.get_nowait())
+            except Empty:
+                break
+        self._pending -= len(results)
+        return results
+
+    def shutdown(self, wait=True) -> None:
+        self._coordinator.shutdown(wait)
+        self._pool.shutdown(wait)
+
+
+class CvlSnapshotWriter:
+    @staticmethod
+    def cvl_create_snapshot_writer(max_workers=DEFAULT_SNAPSHOT_WORKERS):
+        return SnapshotWriter(max_workers)
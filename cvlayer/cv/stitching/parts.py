@@ -4,21 +4,23 @@ import os
 
 import cv2
 
+from cvlayer.cv.image_io import ImageCacheOption, image_read
+
 
 class StitcherPart:
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, cache: ImageCacheOption = False):
         self.filename = filename
-        self.original = self.read_image(filename)
+        self.original = self.read_image(filename, cache)
 
     @staticmethod
-    def read_image(filename: str):
+    def read_image(filename: str, cache: ImageCacheOption = False):
         if not os.path.isfile(filename):
             filename = cv2.samples.findFile(filename)
 
         if not os.path.isfile(filename):
             raise FileNotFoundError(f"Not found file: '{filename}'")
 
-        return cv2.imread(filename)
+        return image_read(filename, cache=cache)
 
     def clear(self) -> None:
         pass
@@ -7,6 +7,7 @@ import cv2
 import numpy as np
 from numpy.typing import NDArray
 
+from cvlayer.cv.image_io import ImageCacheOption
 from cvlayer.cv.stitching.parts import StitcherPart
 from cvlayer.cv.stitching.props import StitcherProps
 from cvlayer.cv.stitching.types import BLEND_FEATHER, BLEND_MULTIBAND
@@ -69,8 +70,12 @@ class Stitcher:
     def clear_images(self) -> None:
         self.parts.clear()
 
-    def add_image(self, filepath: str) -> StitcherPart:
-        result = StitcherPart(filepath)
+    def add_image(
+        self,
+        filepath: str,
+        cache: ImageCacheOption = False,
+    ) -> StitcherPart:
+        result = StitcherPart(filepath, cache)
         self.parts[filepath] = result
         return result
 
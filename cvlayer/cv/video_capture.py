@@ -6,6 +6,8 @@ from typing import Optional, Sequence, Tuple, Union
 import cv2
 from numpy.typing import NDArray
 
+from cvlayer.cv.frame_source import FrameSourceInterface
+
 
 @unique
 class VideoCaptureProperty(Enum):
@@ -105,7 +107,7 @@ def get_capture_index(index: int, domain: CaptureDomain) -> int:
     return index + domain.value
 
 
-class VideoCapture:
+class VideoCapture(FrameSourceInterface):
     def __init__(
         self,
         file: Optional[Union[int, str]] = None,
@@ -240,6 +242,19 @@ class VideoCapture:
     def pos(self, value: int) -> None:
         self.set_property(VideoCaptureProperty.POS_FRAMES, float(value))
 
+    def request_grayscale(self) -> bool:
+        """
+        Ask the backend to deliver single-channel frames.
+
+        Only some camera backends support `MONOCHROME`, so callers must still check
+        the frame channels. `CONVERT_RGB` is deliberately not used: with FFMPEG or
+        V4L it returns the raw codec buffer (e.g. YUV planes), not a gray image.
+
+        :return: `True` if the backend accepted the property.
+        """
+
+        return self.set_property(VideoCaptureProperty.MONOCHROME, 1)
+
     def get_backend_name(self) -> str:
         return self._capture.getBackendName()
 
@@ -7,22 +7,49 @@ from enum import Enum, auto, unique
 from io import StringIO
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, Logger
 from math import isclose
-from os import W_OK, access, getcwd, mkdir, path
-from typing import Any, Callable, Dict, Final, List, Optional, Sequence, Union
+from os import W_OK, access, getcwd, path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from numpy import float32, float64, full, uint8, zeros_like
+from numpy import float32, float64, full, may_share_memory, uint8, zeros_like
 from numpy.typing import NDArray
 
-from cvlayer.cv.basic import channels_max, channels_mean, channels_min
 from cvlayer.cv.color import PIXEL_8BIT_MAX
 from cvlayer.cv.cvt_color import cvt_color
 from cvlayer.cv.drawable.defaults import DEFAULT_FONT_FACE
+from cvlayer.cv.drawable.image import draw_image_coord
 from cvlayer.cv.drawable.rectangle import draw_rectangle
+from cvlayer.cv.drawable.rolling_plot import (
+    DEFAULT_ROLLING_PLOT_CAPACITY,
+    DEFAULT_ROLLING_PLOT_COLOR,
+    RollingPlot,
+)
 from cvlayer.cv.drawable.text.multiline.box import draw_multiline_text_box
+from cvlayer.cv.drawable.text.multiline.overlay import MultilineTextOverlay
 from cvlayer.cv.fourcc import FOURCC_MP4V
+from cvlayer.cv.frame_skipper import FrameSkipper
+from cvlayer.cv.frame_source import FrameSourceInterface
+from cvlayer.cv.frame_stats import (
+    DEFAULT_STATS_INTERVAL,
+    DEFAULT_STATS_INTERVAL_FRAMES,
+    DEFAULT_STATS_STRIDE,
+    FrameStats,
+    FrameStatsSampler,
+    compute_frame_stats,
+    frame_stats_as_text,
+)
+from cvlayer.cv.histogram import BACKGROUND_ALPHA as HISTOGRAM_BACKGROUND_ALPHA
 from cvlayer.cv.histogram import PADDING as HISTOGRAM_PADDING
-from cvlayer.cv.histogram import draw_histogram_channels_with_decorate
-from cvlayer.cv.image_io import image_write
+from cvlayer.cv.histogram import make_histograms_box
 from cvlayer.cv.image_resize import resize_ratio
 from cvlayer.cv.keymap import (
     KEYCODE_NULL,
@@ -31,8 +58,15 @@ from cvlayer.cv.keymap import (
     has_highgui_arrow_keys,
     highgui_keys,
 )
+from cvlayer.cv.mjpeg_server import DEFAULT_MJPEG_HOST, MjpegServer
+from cvlayer.cv.mosaic import Mosaic
 from cvlayer.cv.mouse import EventFlags, MouseEvent
-from cvlayer.cv.roi import normalize_image_roi
+from cvlayer.cv.reduced_capture import ReducedCapture
+from cvlayer.cv.snapshot_writer import (
+    SNAPSHOT_ARCHIVE_SUFFIX,
+    SnapshotResult,
+    SnapshotWriter,
+)
 from cvlayer.cv.types.color import Color, ColorLike, normalize_color
 from cvlayer.cv.types.cvt_color_code import CvtColorCode
 from cvlayer.cv.types.interpolation import DEFAULT_INTERPOLATION
@@ -45,6 +79,7 @@ from cvlayer.keymap.create import create_callable_keymap
 from cvlayer.layer.base import LayerBase
 from cvlayer.layer.manager.cvmanager import CvManager
 from cvlayer.layer.manager.interface import LayerManagerInterface
+from cvlayer.layer.manager.recorder import DEFAULT_RECORD_CHUNK_SIZE, PipelineRecorder
 from cvlayer.palette.basic import GREEN, RED, WHITE, YELLOW
 from cvlayer.palette.flat import CLOUDS_50, MIDNIGHT_BLUE_900
 from cvlayer.typing import PointF, PointI, RectI, SizeI, override
@@ -59,6 +94,7 @@ DEFAULT_ROI_THICKNESS: Final[int] = 1
 DEFAULT_TOAST_ANCHOR: Final[PointF] = 1.0, 1.0
 DEFAULT_TOAST_COLOR: Final[Color] = WHITE
 DEFAULT_TOAST_DURATION: Final[float] = 2.0
+DEFAULT_ROLLING_PLOT_SIZE: Final[SizeI] = 256, 64
 
 
 @unique
@@ -74,6 +110,7 @@ class KeyDefine:
     play: Sequence[str] = field(default_factory=list)
     help: Sequence[str] = field(default_factory=list)
     manpage: Sequence[str] = field(default_factory=list)
+    mosaic: Sequence[str] = field(default_factory=list)
     snapshot: Sequence[str] = field(default_factory=list)
     wait_down: Sequence[str] = field(default_factory=list)
     wait_up: Sequence[str] = field(default_factory=list)
@@ -100,6 +137,7 @@ class KeyDefine:
             play=[" "],
             help=["H", "h"],
             manpage=["/", "?"],
+            mosaic=["M", "m"],
             snapshot=["`", "\n"],
             wait_down=["<", ","],
             wait_up=[">", "."],
@@ -137,26 +175,20 @@ class FrameEventCallable:
 
 
 def analyze_frame_as_text(frame: NDArray, roi: Optional[RectI] = None) -> str:
-    if roi is not None:
-        x1, y1, x2, y2 = normalize_image_roi(frame, roi)
-        if (x2 - x1) * (y2 - y1) != 0:
-            frame = frame[y1:y2, x1:x2]
-
-    buffer = StringIO()
-    buffer.write(f"Shape: {list(frame.shape)}\n")
-    buffer.write(f"Means: {[round(m) for m in channels_mean(frame)]}\n")
-    buffer.write(f"Min: {[round(m) for m in channels_min(frame)]}\n")
-    buffer.write(f"Max: {[round(m) for m in channels_max(frame)]}")
-    return buffer.getvalue()
+    return frame_stats_as_text(compute_frame_stats(frame, roi))
 
 
 class CvWindow(LayerManagerInterface, Window):
+    _capture: FrameSourceInterface
     _writer: Optional[VideoWriter]
+    _preview_server: Optional[MjpegServer]
+    _frame_skipper: Optional[FrameSkipper]
     _frame_events: Dict[int, List[FrameEventCallable]]
+    _rolling_plots: Dict[str, RollingPlot]
 
     def __init__(
         self,
-        input: str,  # noqa
+        input: Union[str, FrameSourceInterface],  # noqa
         output: Optional[str] = None,
         font=DEFAULT_FONT_FACE,
         font_scale=1.0,
@@ -167,6 +199,7 @@ class CvWindow(LayerManagerInterface, Window):
         play=False,
         headless=False,
         show_manual=False,
+        show_mosaic=False,
         show_toast=True,
         verbose=0,
         keymap: Optional[KeyDefine] = None,
@@ -182,6 +215,8 @@ class CvWindow(LayerManagerInterface, Window):
         logging_step=1,
         snapshot_base: Optional[str] = None,
         snapshot_ext: Optional[str] = None,
+        snapshot_async=True,
+        snapshot_archive=False,
         help_offset: Optional[PointI] = None,
         help_anchor: Optional[PointF] = None,
         plot_size: Optional[SizeI] = None,
@@ -195,6 +230,20 @@ class CvWindow(LayerManagerInterface, Window):
         toast_duration=DEFAULT_TOAST_DURATION,
         manager: Optional[CvManager] = None,
         use_deepcopy=False,
+        record: Optional[str] = None,
+        record_chunk_size=DEFAULT_RECORD_CHUNK_SIZE,
+        capture_scale=1.0,
+        capture_grayscale=False,
+        stats_stride=DEFAULT_STATS_STRIDE,
+        stats_interval_frames=DEFAULT_STATS_INTERVAL_FRAMES,
+        stats_interval=DEFAULT_STATS_INTERVAL,
+        rolling_plot_size: Optional[SizeI] = None,
+        mosaic_columns: Optional[int] = None,
+        preview_host=DEFAULT_MJPEG_HOST,
+        preview_port: Optional[int] = None,
+        preview_max_fps: Optional[float] = None,
+        realtime=False,
+        realtime_latency: Optional[float] = None,
     ):
         super().__init__(window_title, window_flags, suppress_init=headless)
 
@@ -213,14 +262,27 @@ class CvWindow(LayerManagerInterface, Window):
         self._play = play
         self._headless = headless
         self._show_manual = show_manual
+        self._show_mosaic = show_mosaic
+        self._mosaic_columns = mosaic_columns
+        self._mosaic: Optional[Mosaic] = None
         self._show_toast = show_toast
         self._verbose = verbose
         self._snapshot_base = snapshot_base if snapshot_base else getcwd()
         self._snapshot_ext = snapshot_ext if snapshot_ext else ".png"
+        self._snapshot_async = snapshot_async
+        self._snapshot_archive = snapshot_archive
+        self._snapshot_writer = SnapshotWriter()
         self._help_offset = help_offset if help_offset else DEFAULT_HELP_OFFSET
         self._help_anchor = help_anchor if help_anchor else DEFAULT_HELP_ANCHOR
         self._plot_size = plot_size if plot_size else DEFAULT_PLOT_SIZE
         self._plot_padding = plot_padding
+        self._frame_stats = FrameStatsSampler(
+            stats_stride, stats_interval_frames, stats_interval
+        )
+        self._rolling_plots = dict()
+        self._rolling_plot_size = (
+            rolling_plot_size if rolling_plot_size else DEFAULT_ROLLING_PLOT_SIZE
+        )
         self._roi_color = roi_color
         self._roi_thickness = roi_thickness
         self._roi_draw = roi_draw
@@ -230,9 +292,14 @@ class CvWindow(LayerManagerInterface, Window):
         self._toast_color = toast_color
         self._toast_begin = datetime.now()
         self._use_deepcopy = use_deepcopy
+        self._help_overlay = MultilineTextOverlay()
+        self._toast_overlay = MultilineTextOverlay()
+        self._histogram_sprite: Optional[Tuple[FrameStats, RectI, NDArray]] = None
 
         self._manager = manager if manager else CvManager(logger=logger)
         self._manager.set_roi(roi)
+        if record:
+            self._manager.set_recorder(PipelineRecorder(record, record_chunk_size))
 
         if not self._headless and window_size is not None:
             win_width, win_height = window_size
@@ -246,7 +313,14 @@ class CvWindow(LayerManagerInterface, Window):
                 raise ValueError(f"Invalid window position: {window_position}")
             self.move(win_x, win_y)
 
-        self._capture = VideoCapture(self._input)
+        if isinstance(self._input, FrameSourceInterface):
+            self._capture = self._input
+        else:
+            self._capture = VideoCapture(self._input)
+        if capture_grayscale or not isclose(capture_scale, 1.0):
+            self._capture = ReducedCapture(
+                self._capture, capture_scale, capture_grayscale
+            )
         if not self._capture.opened:
             raise RuntimeError("A Video Capture was created but not opened")
         if self._capture.width < 1:
@@ -287,6 +361,19 @@ class CvWindow(LayerManagerInterface, Window):
         else:
             self._writer = None
 
+        if preview_port is not None:
+            self._preview_server = MjpegServer(
+                preview_host, preview_port, max_fps=preview_max_fps
+            )
+        else:
+            self._preview_server = None
+
+        if realtime:
+            fps = self._capture.fps
+            self._frame_skipper = FrameSkipper(fps, realtime_latency)
+        else:
+            self._frame_skipper = None
+
         keymap = keymap if keymap else KeyDefine.defaults()
         assert keymap is not None
         keymap_attrs = get_public_instance_attributes(keymap)
@@ -396,6 +483,44 @@ class CvWindow(LayerManagerInterface, Window):
         else:
             self._frame_events[index] = [FrameEventCallable(event, counter)]
 
+    @property
+    def rolling_plots(self) -> Dict[str, RollingPlot]:
+        return self._rolling_plots
+
+    def add_rolling_plot(
+        self,
+        name: str,
+        capacity=DEFAULT_ROLLING_PLOT_CAPACITY,
+        color: Optional[ColorLike] = None,
+        min_y: Optional[float] = None,
+        max_y: Optional[float] = None,
+    ) -> RollingPlot:
+        """
+        Add a plot that is stacked in the bottom-left corner of the preview.
+        Plots are shown in the INFO and DEBUG help modes.
+        """
+
+        if name in self._rolling_plots:
+            raise KeyError(f"Already exists rolling plot: '{name}'")
+
+        plot_color = color if color is not None else DEFAULT_ROLLING_PLOT_COLOR
+        plot = RollingPlot(capacity, name, plot_color, min_y=min_y, max_y=max_y)
+        self._rolling_plots[name] = plot
+        return plot
+
+    def remove_rolling_plot(self, name: str) -> None:
+        self._rolling_plots.pop(name)
+
+    def update_rolling_plot(self, name: str, value: float) -> None:
+        """
+        Append a value to the named plot. The plot is added on first use.
+        """
+
+        plot = self._rolling_plots.get(name)
+        if plot is None:
+            plot = self.add_rolling_plot(name)
+        plot.append(value)
+
     def clear_toast(self) -> None:
         self._toast_text = str()
 
@@ -446,6 +571,10 @@ class CvWindow(LayerManagerInterface, Window):
         assert 0 < keycode
         self.flip_manual_page()
 
+    def on_keydown_mosaic(self, keycode: int) -> None:
+        assert 0 < keycode
+        self.flip_mosaic()
+
     def on_keydown_snapshot(self, keycode: int) -> None:
         assert 0 < keycode
         self.snapshot()
@@ -523,6 +652,10 @@ class CvWindow(LayerManagerInterface, Window):
     def on_create(self) -> None:
         self._manager.on_create()
 
+        if self._preview_server is not None:
+            self._preview_server.start()
+            self.logger.info(f"Preview stream: {self._preview_server.url}")
+
     def on_destroy(self) -> None:
         self._manager.on_destroy()
 
@@ -530,6 +663,15 @@ class CvWindow(LayerManagerInterface, Window):
             assert self._writer.opened
             self._writer.release()
 
+        if self._preview_server is not None:
+            self._preview_server.stop()
+
+        self._snapshot_writer.shutdown(wait=True)
+        self._report_snapshots()
+
+        if self._manager.recorder is not None:
+            self._manager.recorder.close()
+
     def on_frame(self, image: NDArray) -> Optional[NDArray]:
         self._manager.run(image, self._use_deepcopy)
         return None
@@ -641,6 +783,11 @@ class CvWindow(LayerManagerInterface, Window):
         popup_state = "Show" if self._show_manual else "Hide"
         self.logger.info(f"{popup_state} man page")
 
+    def flip_mosaic(self) -> None:
+        self._show_mosaic = not self._show_mosaic
+        mosaic_state = "Show" if self._show_mosaic else "Hide"
+        self.logger.info(f"{mosaic_state} layers mosaic")
+
     def snapshot(
         self,
         directory: Optional[str] = None,
@@ -664,23 +811,44 @@ class CvWindow(LayerManagerInterface, Window):
 
         now = datetime.now().strftime("%Y%m%d_%H%M%S")
         prefix = path.join(base, f"{self._capture.pos}-{now}")
-
-        if not path.isdir(prefix):
-            mkdir(prefix)
-            self.logger.debug(f"Make directory: '{prefix}'")
-
-        self.logger.debug(f"Saving all layer snapshots as '{prefix}' directory ...")
         ext = image_extension if image_extension else self._snapshot_ext
 
+        items = list()
         for index, layer in enumerate(self._manager.values()):
             assert isinstance(layer, LayerBase)
-            filename = f"layer{index}-{layer.name}{ext}"
-            image_write(path.join(prefix, filename), layer.frame)
+            items.append((f"layer{index}-{layer.name}", layer.frame))
+        items.append(("original", self._original_frame))
+        items.append(("preview", self._preview_frame))
 
-        image_write(path.join(prefix, f"original{ext}"), self._original_frame)
-        image_write(path.join(prefix, f"preview{ext}"), self._preview_frame)
+        if self._snapshot_archive:
+            prefix += SNAPSHOT_ARCHIVE_SUFFIX
 
-        self.toast_info(f"Write snapshots: '{prefix}'")
+        if self._snapshot_async:
+            self.logger.debug(f"Queue the snapshots as '{prefix}' ...")
+            self._snapshot_writer.submit(prefix, items, ext, self._snapshot_archive)
+            self.toast_info(f"Writing snapshots: '{prefix}' ...")
+        else:
+            self.logger.debug(f"Saving all layer snapshots as '{prefix}' ...")
+            result = self._snapshot_writer.write(
+                prefix, items, ext, self._snapshot_archive
+            )
+            self._toast_snapshot_result(result)
+
+    def _toast_snapshot_result(self, result: SnapshotResult) -> None:
+        if result.ok:
+            self.toast_info(f"Write snapshots: '{result.destination}'")
+        else:
+            for filename, error in result.errors:
+                self.logger.error(f"Failed to write snapshot '{filename}': {error}")
+            count = len(result.errors)
+            self.toast_error(
+                f"Failed to write {count} snapshots: '{result.destination}'"
+            )
+
+    def _report_snapshots(self) -> None:
+        # Called from the UI thread, so the toast state is never touched by workers.
+        for result in self._snapshot_writer.poll():
+            self._toast_snapshot_result(result)
 
     def do_wait_up(self) -> None:
         self._window_wait += 1
@@ -757,6 +925,7 @@ class CvWindow(LayerManagerInterface, Window):
 
         self._manager.current_layer.increase_at_cursor()
         self.logger.info(self._manager.as_current_param_info_text())
+        self._invalidate_mosaic()
 
     def do_param_down(self) -> None:
         if self._manager.is_cursor_at_last:
@@ -764,6 +933,7 @@ class CvWindow(LayerManagerInterface, Window):
 
         self._manager.current_layer.decrease_at_cursor()
         self.logger.info(self._manager.as_current_param_info_text())
+        self._invalidate_mosaic()
 
     def do_process(self, frame: NDArray) -> Optional[NDArray]:
         begin = datetime.now()
@@ -771,7 +941,9 @@ class CvWindow(LayerManagerInterface, Window):
             if self._use_deepcopy:
                 frame = frame.copy()
             self._manager.update_first_frame_and_data(frame)
-            return self.on_frame(frame)
+            result = self.on_frame(frame)
+            self._manager.record(self._capture.pos - 1)
+            return result
         except BaseException as e:
             self.logger.exception(e)
             return None
@@ -787,6 +959,11 @@ class CvWindow(LayerManagerInterface, Window):
         buffer = StringIO()
         buffer.write(f"Frame {self._capture.pos}/{self._capture.frames}\n")
         buffer.write(f"FPS: {fps:.1f} (duration={duration:.3f}s)\n")
+        if self._frame_skipper is not None:
+            dropped = self._frame_skipper.dropped
+            ratio = self._frame_skipper.drop_ratio
+            backlog = self._frame_skipper.backlog
+            buffer.write(f"Dropped: {dropped} ({ratio:.1%}, backlog={backlog:.3f}s)\n")
         buffer.write(f"Layer index: {cursor}/{number_of_layers}\n")
         buffer.write(f"Process duration: {self._process_duration:.3f}s\n")
         buffer.write(f"Layers total duration: {self._manager.total_duration:.3f}s\n")
@@ -816,12 +993,35 @@ class CvWindow(LayerManagerInterface, Window):
         )
         return manpage_frame
 
+    def _invalidate_mosaic(self) -> None:
+        # Layers may update their frame buffers in place when a parameter changes.
+        if self._mosaic is not None:
+            self._mosaic.invalidate()
+
+    def create_mosaic(self) -> NDArray:
+        if self._mosaic is None:
+            height, width = self._empty_frame.shape[0], self._empty_frame.shape[1]
+            self._mosaic = Mosaic((width, height), self._mosaic_columns)
+
+        frames = list()
+        labels = list()
+        for index, layer in enumerate(self._manager.values()):
+            assert isinstance(layer, LayerBase)
+            frames.append(layer.frame)
+            labels.append(f"{index}: {layer.name}" if layer.name else str(index))
+
+        # The frame position tells the frames updated in place since the last time.
+        return self._mosaic.update(frames, labels, self._capture.pos)
+
     def _select_preview_source(self, result_frame: Optional[NDArray]) -> NDArray:
         if self._show_manual:
             ref_frame = result_frame if result_frame is not None else self._empty_frame
             manpage_size = ref_frame.shape[0], ref_frame.shape[1]
             return self.create_manpage(manpage_size)
 
+        if self._show_mosaic:
+            return self.create_mosaic()
+
         if self._manager.is_cursor_at_last:
             if result_frame is not None:
                 return result_frame
@@ -866,7 +1066,7 @@ class CvWindow(LayerManagerInterface, Window):
         self,
         frame: NDArray,
         help_roi: RectI,
-        analyze_frame: NDArray,
+        stats: FrameStats,
     ) -> RectI:
         hx1, hy1, hx2, hy2 = help_roi
         hx1 = hx1 if self._help_anchor[0] < 0.5 else hx2 - self._plot_size[0]
@@ -874,17 +1074,32 @@ class CvWindow(LayerManagerInterface, Window):
         hx2 = hx1 + self._plot_size[0] + (self._plot_padding * 2)
         hy2 = hy1 + self._plot_size[1] + (self._plot_padding * 2)
         hist_roi = hx1, hy1, hx2, hy2
-        draw_histogram_channels_with_decorate(
-            frame,
-            hist_roi,
-            analyze_frame,
-            self.roi,
-            padding=self._plot_padding,
-        )
+
+        # The stats are rate-limited, so the box is rendered only when they change.
+        sprite = self._histogram_sprite
+        if sprite is None or sprite[0] is not stats or sprite[1] != hist_roi:
+            box, _ = make_histograms_box(
+                hist_roi,
+                list(stats.histograms),
+                padding=self._plot_padding,
+            )
+            sprite = stats, hist_roi, box
+            self._histogram_sprite = sprite
+
+        draw_image_coord(frame, sprite[2], hx1, hy1, HISTOGRAM_BACKGROUND_ALPHA)
         return hist_roi
 
+    def _draw_rolling_plots(self, frame: NDArray) -> None:
+        width, height = self._rolling_plot_size
+        bottom = frame.shape[0]
+        for plot in reversed(self._rolling_plots.values()):
+            if bottom - height < 0:
+                break
+            plot.draw(frame, (0, bottom - height, width, bottom))
+            bottom -= height
+
     def _draw_toast(self, frame: NDArray):
-        return draw_multiline_text_box(
+        return self._toast_overlay.draw(
             frame,
             text=self._toast_text,
             pos=(0, 0),
@@ -894,19 +1109,32 @@ class CvWindow(LayerManagerInterface, Window):
             anchor=self._toast_anchor,
         )
 
-    def _draw_information(self, frame: NDArray, analyze_frame: NDArray) -> NDArray:
+    def _begin_canvas(self, frame: NDArray, analyze_frame: NDArray) -> NDArray:
         # [IMPORTANT] Do not use `self._use_deepcopy` property.
-        canvas = frame.copy()
+        # Copy only when the frame is still a layer's own buffer;
+        # the coloring and resizing steps usually produce a private one.
+        if may_share_memory(frame, analyze_frame):
+            return frame.copy()
+        else:
+            return frame
+
+    def _draw_information(self, frame: NDArray, analyze_frame: NDArray) -> NDArray:
+        canvas = self._begin_canvas(frame, analyze_frame)
 
         if self._roi_draw and self.roi is not None:
             draw_rectangle(canvas, self.roi, self._roi_color, self._roi_thickness)
 
+        stats: Optional[FrameStats] = None
         buffer = StringIO()
         buffer.write(self.as_information_text())
         if self._help_mode == HelpMode.DEBUG:
-            buffer.write("\n" + analyze_frame_as_text(analyze_frame, self.roi))
+            # The stats are shared by the text and the histogram plot.
+            # Switching the previewed layer must not show the stats of the last one.
+            source = self._show_mosaic, self._manager.cursor
+            stats = self._frame_stats.update(analyze_frame, self.roi, source)
+            buffer.write("\n" + frame_stats_as_text(stats))
 
-        _, help_roi = draw_multiline_text_box(
+        _, help_roi = self._help_overlay.draw(
             image=canvas,
             text=buffer.getvalue(),
             pos=self._help_offset,
@@ -915,8 +1143,11 @@ class CvWindow(LayerManagerInterface, Window):
             anchor=self._help_anchor,
         )
 
-        if self._help_mode == HelpMode.DEBUG:
-            self._draw_histogram(canvas, help_roi, analyze_frame)
+        if stats is not None:
+            self._draw_histogram(canvas, help_roi, stats)
+
+        if self._rolling_plots:
+            self._draw_rolling_plots(canvas)
 
         if self._show_toast and self._toast_text:
             toast_duration = (datetime.now() - self._toast_begin).total_seconds()
@@ -927,10 +1158,10 @@ class CvWindow(LayerManagerInterface, Window):
 
     def _previewing(self, frame: NDArray, analyze_frame: NDArray) -> NDArray:
         if self._show_manual:
-            return frame.copy()
+            return self._begin_canvas(frame, analyze_frame)
 
         if self._help_mode == HelpMode.HIDE:
-            return frame.copy()
+            return self._begin_canvas(frame, analyze_frame)
 
         return self._draw_information(frame, analyze_frame)
 
@@ -939,7 +1170,15 @@ class CvWindow(LayerManagerInterface, Window):
             raise EOFError("Input video is not opened")
 
         if self._play:
+            if self._frame_skipper is not None:
+                self._frame_skipper.skip(self._capture.grab)
             self._original_frame = self.read_next_frame()
+        elif self._frame_skipper is not None:
+            # Paused time is not a backlog.
+            self._frame_skipper.reset()
+
+        if self._snapshot_writer.pending:
+            self._report_snapshots()
 
         events = self._frame_events.get(self._capture.pos)
         if events is not None:
@@ -956,6 +1195,9 @@ class CvWindow(LayerManagerInterface, Window):
             assert self._writer.opened
             self._writer.write(self._preview_frame)
 
+        if self._preview_server is not None:
+            self._preview_server.submit(self._preview_frame)
+
         if self._headless:
             return
 
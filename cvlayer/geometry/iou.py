@@ -1,7 +1,30 @@
 # -*- coding: utf-8 -*-
 
+from typing import Final, Optional, Tuple
+
+from numpy import (
+    add,
+    argsort,
+    asarray,
+    delete,
+    divide,
+    exp,
+    flatnonzero,
+    float64,
+    int64,
+    maximum,
+    minimum,
+    where,
+    zeros,
+)
+from numpy.typing import ArrayLike, NDArray
+
 from cvlayer.typing import RectT
 
+DEFAULT_NMS_IOU_THRESHOLD: Final[float] = 0.5
+DEFAULT_SOFT_NMS_SIGMA: Final[float] = 0.5
+DEFAULT_SOFT_NMS_SCORE_THRESHOLD: Final[float] = 0.001
+
 
 def calculate_iou(rect1: RectT, rect2: RectT) -> float:
     """
@@ -33,3 +56,158 @@ def calculate_iou(rect1: RectT, rect2: RectT) -> float:
 
     # Calculate IoU
     return intersection_area / union_area
+
+
+def _as_rects(rects: ArrayLike) -> NDArray[float64]:
+    return asarray(rects, dtype=float64).reshape(-1, 4)
+
+
+def _areas(rects: NDArray) -> NDArray:
+    return (rects[:, 2] - rects[:, 0]) * (rects[:, 3] - rects[:, 1])
+
+
+def calculate_iou_pairs(rects1: ArrayLike, rects2: ArrayLike) -> NDArray[float64]:
+    """
+    The Intersection over Union of each pair of rows,
+    for two `(N, 4)` arrays of `(x1, y1, x2, y2)` rectangles.
+    """
+
+    r1 = _as_rects(rects1)
+    r2 = _as_rects(rects2)
+
+    width = minimum(r1[:, 2], r2[:, 2]) - maximum(r1[:, 0], r2[:, 0])
+    height = minimum(r1[:, 3], r2[:, 3]) - maximum(r1[:, 1], r2[:, 1])
+    intersection_area = width.clip(min=0) * height.clip(min=0)
+
+    union_area = _areas(r1) + _areas(r2) - intersection_area
+
+    result = zeros(len(r1), dtype=float64)
+    divide(intersection_area, union_area, out=result, where=union_area > 0)
+    return result
+
+
+def calculate_iou_matrix(rects1: ArrayLike, rects2: ArrayLike) -> NDArray[float64]:
+    """
+    The Intersection over Union of every pair of rectangles,
+    as an `(N, M)` matrix for `(N, 4)` and `(M, 4)` arrays of `(x1, y1, x2, y2)`.
+    """
+
+    r1 = _as_rects(rects1)
+    r2 = _as_rects(rects2)
+    x1a, y1a, x2a, y2a = (r1[:, i].reshape(-1, 1) for i in range(4))
+    x1b, y1b, x2b, y2b = (r2[:, i].reshape(1, -1) for i in range(4))
+
+    # The (N, M) buffers are reused to keep the memory traffic low.
+    width = minimum(x2a, x2b)
+    buffer = maximum(x1a, x1b)
+    width -= buffer
+    height = minimum(y2a, y2b, out=buffer)
+    height -= maximum(y1a, y1b)
+    intersection_area = maximum(width, 0, out=width)
+    intersection_area *= maximum(height, 0, out=height)
+
+    union_area = add((x2a - x1a) * (y2a - y1a), (x2b - x1b) * (y2b - y1b), out=height)
+    union_area -= intersection_area
+
+    # Without a union, there's no intersection either, so the result stays 0.
+    result = intersection_area
+    divide(intersection_area, union_area, out=result, where=union_area > 0)
+    return result
+
+
+def _iou_one_to_many(
+    rect: NDArray[float64],
+    area: float,
+    rects: NDArray[float64],
+    areas: NDArray[float64],
+) -> NDArray[float64]:
+    width = minimum(rect[2], rects[:, 2]) - maximum(rect[0], rects[:, 0])
+    height = minimum(rect[3], rects[:, 3]) - maximum(rect[1], rects[:, 1])
+    intersection_area = width.clip(min=0) * height.clip(min=0)
+    union_area = area + areas - intersection_area
+    result = zeros(len(rects), dtype=float64)
+    divide(intersection_area, union_area, out=result, where=union_area > 0)
+    return result
+
+
+def non_maximum_suppression(
+    rects: ArrayLike,
+    scores: ArrayLike,
+    iou_threshold=DEFAULT_NMS_IOU_THRESHOLD,
+    max_outputs: Optional[int] = None,
+) -> NDArray[int64]:
+    """
+    Greedy Non-Maximum Suppression.
+
+    The highest scoring rectangle is kept, and the rectangles that overlap it
+    by more than `iou_threshold` are removed, until no rectangle is left.
+
+    :return: The indices of the kept rectangles, in descending order of score.
+    """
+
+    _rects = _as_rects(rects)
+    _scores = asarray(scores, dtype=float64).reshape(-1)
+    if len(_rects) != len(_scores):
+        raise ValueError("The scores do not match the rectangles")
+
+    areas = _areas(_rects)
+    order = argsort(-_scores, kind="stable")
+    keep = list()
+    while len(order) > 0:
+        best = int(order[0])
+        keep.append(best)
+        if max_outputs is not None and len(keep) >= max_outputs:
+            break
+        rest = order[1:]
+        ious = _iou_one_to_many(_rects[best], areas[best], _rects[rest], areas[rest])
+        order = rest[ious <= iou_threshold]
+    return asarray(keep, dtype=int64)
+
+
+def soft_non_maximum_suppression(
+    rects: ArrayLike,
+    scores: ArrayLike,
+    sigma=DEFAULT_SOFT_NMS_SIGMA,
+    score_threshold=DEFAULT_SOFT_NMS_SCORE_THRESHOLD,
+    iou_threshold: Optional[float] = None,
+) -> Tuple[NDArray[int64], NDArray[float64]]:
+    """
+    Soft Non-Maximum Suppression.
+
+    Instead of removing the overlapping rectangles, their scores are decayed.
+    With `iou_threshold`, the decay is linear, `score * (1 - iou)`,
+    for the overlaps above the threshold. Otherwise it's gaussian,
+    `score * exp(-iou^2 / sigma)`. Rectangles whose score falls below
+    `score_threshold` are removed.
+
+    :return: The indices of the kept rectangles and their decayed scores,
+        in descending order of score.
+    """
+
+    _rects = _as_rects(rects)
+    _scores = asarray(scores, dtype=float64).reshape(-1).copy()
+    if len(_rects) != len(_scores):
+        raise ValueError("The scores do not match the rectangles")
+    if iou_threshold is None and sigma <= 0:
+        raise ValueError("The 'sigma' argument must be positive")
+
+    areas = _areas(_rects)
+    remaining = flatnonzero(_scores >= score_threshold)
+    keep = list()
+    kept_scores = list()
+    while len(remaining) > 0:
+        best_at = int(_scores[remaining].argmax())
+        best = int(remaining[best_at])
+        keep.append(best)
+        kept_scores.append(float(_scores[best]))
+
+        rest = delete(remaining, best_at)
+        ious = _iou_one_to_many(_rects[best], areas[best], _rects[rest], areas[rest])
+        if iou_threshold is None:
+            decay = exp(-(ious * ious) / sigma)
+        else:
+            decay = where(ious > iou_threshold, 1.0 - ious, 1.0)
+        _scores[rest] *= decay
+        remaining = rest[_scores[rest] >= score_threshold]
+
+    return asarray(keep, dtype=int64), asarray(kept_scores, dtype=float64)
@@ -11,6 +11,7 @@ from numpy.typing import NDArray
 from cvlayer.cv.mouse import EventFlags, MouseEvent
 from cvlayer.layer.base import LayerBase, SkipError
 from cvlayer.layer.manager.interface import LayerManagerInterface
+from cvlayer.layer.manager.recorder import PipelineRecorder
 from cvlayer.typing import RectI, override
 
 LAST_LAYER_INDEX: Final[int] = -1
@@ -20,6 +21,7 @@ DEFAULT_LOGGER_NAME: Final[str] = "cvlayer.cvmanager"
 class CvManager(LayerManagerInterface):
     _layers: List[LayerBase]
     _name2index: Dict[str, int]
+    _recorder: Optional[PipelineRecorder]
 
     def __init__(
         self,
@@ -45,6 +47,7 @@ class CvManager(LayerManagerInterface):
 
         self._pseudo_first = LayerBase("__pseudo_first__", None)
         self._roi = roi
+        self._recorder = None
 
     def __getitem__(self, key: Any) -> LayerBase:
         return self.layer(key)
@@ -76,6 +79,22 @@ class CvManager(LayerManagerInterface):
     def roi(self):
         return self._roi
 
+    @property
+    def recorder(self):
+        return self._recorder
+
+    def set_recorder(self, recorder: Optional[PipelineRecorder]) -> None:
+        self._recorder = recorder
+
+    def record(self, frame_index: Optional[int] = None) -> bool:
+        """
+        Record the current frame and data of all layers, if a recorder is set.
+        """
+
+        if self._recorder is None:
+            return False
+        return self._recorder.record(self._layers, frame_index)
+
     @property
     def cursor(self):
         return self._cursor
@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+
+import json
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
+from os import makedirs, path, remove, replace
+from re import sub
+from typing import Any, Deque, Dict, Final, List, NamedTuple, Optional, Sequence
+
+from numpy import array, generic, load, ndarray, savez_compressed, stack
+from numpy.typing import NDArray
+
+from cvlayer.layer.base import LayerBase
+
+DEFAULT_RECORD_CHUNK_SIZE: Final[int] = 32
+DEFAULT_RECORD_CACHE_CHUNKS: Final[int] = 4
+DEFAULT_RECORD_MAX_PENDING: Final[int] = 4
+RECORD_META_FILENAME: Final[str] = "record.json"
+RECORD_INDEX_FILENAME: Final[str] = "chunks.jsonl"
+
+
+def record_json_default(value: Any) -> Any:
+    if isinstance(value, ndarray):
+        return value.tolist()
+    if isinstance(value, generic):
+        return value.item()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return repr(value)
+
+
+def serialize_record_data(data: Any) -> str:
+    """
+    Serialize the layer data as JSON. Arrays become nested lists,
+    and values that JSON can't represent are stored as their `repr()`.
+    """
+
+    return json.dumps(data, default=record_json_default)
+
+
+@dataclass
+class RecordChunk:
+    filename: str
+    indices: List[int]
+
+
+@dataclass
+class RecordLayerMeta:
+    name: str
+    directory: str
+    chunks: List[RecordChunk] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        chunks = [RecordChunk(**c) for c in data["chunks"]]
+        return cls(data["name"], data["directory"], chunks)
+
+
+class _LayerBuffer:
+    indices: List[int]
+    frames: List[NDArray]
+    data: List[str]
+
+    def __init__(self):
+        self.indices = list()
+        self.frames = list()
+        self.data = list()
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def compatible(self, frame: NDArray) -> bool:
+        if not self.frames:
+            return True
+        first = self.frames[0]
+        return first.shape == frame.shape and first.dtype == frame.dtype
+
+    def clear(self) -> None:
+        self.indices.clear()
+        self.frames.clear()
+        self.data.clear()
+
+
+class _IndexRanges:
+    """
+    A set of integers stored as sorted `[start, stop)` ranges.
+    Consecutive frame indices share a single range.
+    """
+
+    starts: List[int]
+    stops: List[int]
+
+    def __init__(self):
+        self.starts = list()
+        self.stops = list()
+
+    def __contains__(self, index: int) -> bool:
+        i = bisect_right(self.starts, index) - 1
+        return 0 <= i and index < self.stops[i]
+
+    def add(self, index: int) -> bool:
+        """
+        :return: `False` if the index was already in the set.
+        """
+
+        i = bisect_right(self.starts, index) - 1
+        if 0 <= i and index < self.stops[i]:
+            return False
+
+        follows = 0 <= i and self.stops[i] == index
+        precedes = i + 1 < len(self.starts) and self.starts[i + 1] == index + 1
+        if follows and precedes:
+            self.stops[i] = self.stops[i + 1]
+            del self.starts[i + 1]
+            del self.stops[i + 1]
+        elif follows:
+            self.stops[i] = index + 1
+        elif precedes:
+            self.starts[i + 1] = index
+        else:
+            self.starts.insert(i + 1, index)
+            self.stops.insert(i + 1, index + 1)
+        return True
+
+
+def write_record_chunk(
+    filepath: str,
+    indices: List[int],
+    frames: List[NDArray],
+    data: List[str],
+) -> None:
+    savez_compressed(
+        filepath,
+        indices=array(indices),
+        frames=stack(frames),
+        data=array(data, dtype=str),
+    )
+
+
+def read_record_index(directory: str) -> Dict[str, Any]:
+    """
+    Rebuild the metadata of a record from its chunk index,
+    e.g. when the recorder was not closed.
+    """
+
+    layers: Dict[str, RecordLayerMeta] = OrderedDict()
+    with open(path.join(directory, RECORD_INDEX_FILENAME), encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break  # The last line may be cut short.
+            name = entry["layer"]
+            layer = layers.get(name)
+            if layer is None:
+                layer = RecordLayerMeta(name, entry["directory"])
+                layers[name] = layer
+            layer.chunks.append(RecordChunk(entry["filename"], entry["indices"]))
+    return {"layers": [asdict(m) for m in layers.values()]}
+
+
+def write_record_meta(directory: str, meta: Dict[str, Any]) -> None:
+    meta_path = path.join(directory, RECORD_META_FILENAME)
+    temp_path = meta_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    replace(temp_path, meta_path)
+
+
+class PipelineRecorder:
+    """
+    Stream every layer's frame and data into compressed chunk files.
+
+    Each layer gets its own directory of `.npz` chunks.
+    A chunk holds up to `chunk_size` frames stacked along a frame-index axis.
+    A chunk is also closed early when the frame shape or dtype changes.
+
+    Chunks are compressed and written on a background thread. When more than
+    `max_pending` chunks are waiting, `record()` blocks until the oldest is written.
+    Each written chunk appends one line to the chunk index, and the metadata
+    is written once by `close()`. A record that was not closed can still be read
+    from its chunk index.
+
+    Layers are told apart by identity, not by name. A layer whose name is
+    already recorded is stored as `name#1`, `name#2` and so on.
+    """
+
+    _layers: Dict[int, RecordLayerMeta]
+    _buffers: Dict[int, _LayerBuffer]
+    _pending: Deque[Future[None]]
+
+    def __init__(
+        self,
+        directory: str,
+        chunk_size=DEFAULT_RECORD_CHUNK_SIZE,
+        record_data=True,
+        overwrite=False,
+        max_pending=DEFAULT_RECORD_MAX_PENDING,
+    ):
+        if chunk_size < 1:
+            raise ValueError("The 'chunk_size' argument must be at least 1")
+        if max_pending < 1:
+            raise ValueError("The 'max_pending' argument must be at least 1")
+
+        meta_path = path.join(directory, RECORD_META_FILENAME)
+        index_path = path.join(directory, RECORD_INDEX_FILENAME)
+        exists = path.exists(meta_path) or path.exists(index_path)
+        if exists and not overwrite:
+            raise FileExistsError(f"The record already exists: '{directory}'")
+
+        makedirs(directory, exist_ok=True)
+        if path.exists(meta_path):
+            remove(meta_path)
+        self._directory = directory
+        self._chunk_size = chunk_size
+        self._record_data = record_data
+        self._max_pending = max_pending
+        self._layers = OrderedDict()
+        self._buffers = dict()
+        self._recorded = _IndexRanges()
+        self._next_index = 0
+        self._closed = False
+        self._writer = ThreadPoolExecutor(1, "record-writer")
+        self._pending = deque()
+        self._index = open(index_path, "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _unique_name(self, name: str) -> str:
+        names = {m.name for m in self._layers.values()}
+        result = name
+        count = 0
+        while result in names:
+            count += 1
+            result = f"{name}#{count}"
+        return result
+
+    def _layer_meta(self, layer: LayerBase) -> RecordLayerMeta:
+        key = id(layer)
+        meta = self._layers.get(key)
+        if meta is None:
+            name = self._unique_name(layer.name)
+            safe_name = sub(r"[^\w.-]", "_", name)
+            meta = RecordLayerMeta(name, f"layer{len(self._layers)}-{safe_name}")
+            makedirs(path.join(self._directory, meta.directory), exist_ok=True)
+            self._layers[key] = meta
+            self._buffers[key] = _LayerBuffer()
+        return meta
+
+    def _wait_pending(self, limit: int) -> None:
+        while len(self._pending) > limit:
+            # Raise the errors of the writer thread here.
+            self._pending.popleft().result()
+
+    def _flush_layer(self, key: int) -> None:
+        buffer = self._buffers[key]
+        if not buffer:
+            return
+
+        meta = self._layers[key]
+        filename = path.join(meta.directory, f"{len(meta.chunks):06d}.npz")
+        chunk = RecordChunk(filename, buffer.indices.copy())
+        meta.chunks.append(chunk)
+
+        # The writer thread owns the buffered lists from now on.
+        future = self._writer.submit(self._write_chunk, meta, chunk, buffer)
+        self._pending.append(future)
+        self._buffers[key] = _LayerBuffer()
+        self._wait_pending(self._max_pending)
+
+    def _write_chunk(
+        self,
+        meta: RecordLayerMeta,
+        chunk: RecordChunk,
+        buffer: _LayerBuffer,
+    ) -> None:
+        filepath = path.join(self._directory, chunk.filename)
+        write_record_chunk(filepath, buffer.indices, buffer.frames, buffer.data)
+
+        # The index lists the chunk only once the chunk file exists.
+        entry = {
+            "layer": meta.name,
+            "directory": meta.directory,
+            "filename": chunk.filename,
+            "indices": chunk.indices,
+        }
+        self._index.write(json.dumps(entry) + "\n")
+        self._index.flush()
+
+    def _meta(self) -> Dict[str, Any]:
+        return {
+            "chunk_size": self._chunk_size,
+            "layers": [asdict(m) for m in self._layers.values()],
+        }
+
+    def record(
+        self,
+        layers: Sequence[LayerBase],
+        frame_index: Optional[int] = None,
+    ) -> bool:
+        """
+        Record the current frame and data of every layer.
+
+        :param frame_index: Defaults to a counter of the recorded frames.
+        :return: `False` if the frame index was already recorded.
+        """
+
+        if self._closed:
+            raise ValueError("The recorder has been closed")
+
+        index = frame_index if frame_index is not None else self._next_index
+        if not self._recorded.add(index):
+            return False
+
+        self._next_index = index + 1
+
+        for layer in layers:
+            frame = layer.frame
+            if frame is None:
+                continue
+
+            key = id(layer)
+            self._layer_meta(layer)
+            if not self._buffers[key].compatible(frame):
+                self._flush_layer(key)
+
+            buffer = self._buffers[key]
+
+            # Layers may reuse their buffers, so keep a private copy until flushed.
+            buffer.indices.append(index)
+            buffer.frames.append(frame.copy())
+            data = serialize_record_data(layer.data) if self._record_data else "null"
+            buffer.data.append(data)
+
+            if len(buffer) >= self._chunk_size:
+                self._flush_layer(key)
+
+        return True
+
+    def flush(self, wait=False) -> None:
+        """
+        Submit the buffered frames of every layer.
+
+        :param wait: Wait until all chunks are written.
+        """
+
+        for key in self._buffers:
+            self._flush_layer(key)
+        if wait:
+            self._wait_pending(0)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush(wait=True)
+            write_record_meta(self._directory, self._meta())
+        finally:
+            self._writer.shutdown()
+            self._index.close()
+
+
+class RecordedFrame(NamedTuple):
+    frame: NDArray
+    data: Any
+
+
+class PipelineRecordReader:
+    """
+    Random access to a pipeline record by `(layer, frame_index)`.
+    Recently used chunks are kept decompressed in memory.
+    """
+
+    _layers: Dict[str, RecordLayerMeta]
+    _cache: OrderedDict[str, Dict[str, NDArray]]
+
+    def __init__(self, directory: str, cache_chunks=DEFAULT_RECORD_CACHE_CHUNKS):
+        meta_path = path.join(directory, RECORD_META_FILENAME)
+        if path.isfile(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        elif path.isfile(path.join(directory, RECORD_INDEX_FILENAME)):
+            meta = read_record_index(directory)
+        else:
+            raise FileNotFoundError(f"Not found record: '{directory}'")
+
+        self._directory = directory
+        self._layers = OrderedDict()
+        for layer in meta["layers"]:
+            layer_meta = RecordLayerMeta.from_dict(layer)
+            self._layers[layer_meta.name] = layer_meta
+
+        self._cache_chunks = cache_chunks
+        self._cache = OrderedDict()
+
+    def __getitem__(self, key) -> RecordedFrame:
+        layer, frame_index = key
+        return self.read(layer, frame_index)
+
+    @property
+    def layers(self) -> List[str]:
+        return list(self._layers.keys())
+
+    def frame_indices(self, layer: str) -> List[int]:
+        result = list()
+        for chunk in self._layers[layer].chunks:
+            result += chunk.indices
+        return sorted(result)
+
+    def _find_chunk(self, layer: str, frame_index: int) -> RecordChunk:
+        chunks = self._layers[layer].chunks
+        # Frame indices normally increase, so try a binary search first.
+        firsts = [c.indices[0] for c in chunks]
+        candidate = bisect_right(firsts, frame_index) - 1
+        if 0 <= candidate and frame_index in chunks[candidate].indices:
+            return chunks[candidate]
+        for chunk in chunks:
+            if frame_index in chunk.indices:
+                return chunk
+        raise KeyError(f"Not recorded frame {frame_index} of layer '{layer}'")
+
+    def _load_chunk(self, chunk: RecordChunk) -> Dict[str, NDArray]:
+        arrays = self._cache.get(chunk.filename)
+        if arrays is not None:
+            self._cache.move_to_end(chunk.filename)
+            return arrays
+
+        with load(path.join(self._directory, chunk.filename)) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+
+        self._cache[chunk.filename] = arrays
+        while len(self._cache) > self._cache_chunks:
+            self._cache.popitem(last=False)
+        return arrays
+
+    def read(self, layer: str, frame_index: int) -> RecordedFrame:
+        chunk = self._find_chunk(layer, frame_index)
+        arrays = self._load_chunk(chunk)
+        position = chunk.indices.index(frame_index)
+        data = json.loads(str(arrays["data"][position]))
+        return RecordedFrame(arrays["frames"][position], data)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import allclose, uint8, zeros
+
+from cvlayer.cv.contour.component import (
+    connected_components,
+    connected_components_with_stats,
+)
+
+
+class ComponentTestCase(TestCase):
+    def setUp(self):
+        image = zeros((40, 60), dtype=uint8)
+        image[2:4, 2:12] = 255  # 10x2, area 20
+        image[10:30, 10:15] = 255  # 5x20, area 100
+        image[20:25, 30:35] = 255  # 5x5, area 25
+        image[35, 50] = 255  # 1x1, area 1
+        self.image = image
+        self.result = connected_components_with_stats(image)
+
+    def test_connectivity(self):
+        self.assertEqual(5, connected_components(self.image, 4).number_of_labels)
+        with self.assertRaises(ValueError):
+            connected_components(self.image, 6)
+        with self.assertRaises(ValueError):
+            connected_components_with_stats(self.image, 6)
+
+    def test_columns(self):
+        result = self.result
+        self.assertEqual(5, result.number_of_labels)
+        self.assertEqual([20, 100, 25, 1], result.area[1:].tolist())
+        self.assertEqual([2, 2, 12, 4], result.bboxes[1].tolist())
+        self.assertEqual(5.0, result.aspect_ratio[1])
+        self.assertEqual(0.25, result.aspect_ratio[2])
+
+        statistics = result.to_statistics()
+        self.assertEqual([s.area for s in statistics], result.area.tolist())
+
+    def test_select(self):
+        result = self.result
+        self.assertEqual([1, 2, 3, 4], result.select().tolist())
+        self.assertEqual([1, 2, 3], result.select(area_min=2).tolist())
+        self.assertEqual([2], result.select(height_min=10).tolist())
+        self.assertEqual([1, 3, 4], result.select(aspect_ratio_min=1).tolist())
+        self.assertEqual(
+            [3], result.select(area_min=2, area_max=50, aspect_ratio_max=1.5).tolist()
+        )
+
+    def test_relabel(self):
+        result = self.result
+        relabeled = result.relabel([3, 1])
+        self.assertEqual(3, relabeled.number_of_labels)
+        self.assertEqual(result.labels.dtype, relabeled.labels.dtype)
+        self.assertEqual([25, 20], relabeled.area[1:].tolist())
+        self.assertEqual(1, relabeled.labels[22, 32])
+        self.assertEqual(2, relabeled.labels[3, 5])
+        self.assertEqual(0, relabeled.labels[15, 12])
+
+        # The background statistics are the same as a new labeling.
+        mask = (relabeled.labels > 0).astype(uint8)
+        _, _, stats, centroids = cv2.connectedComponentsWithStats(mask)
+        self.assertEqual(stats[0].tolist(), relabeled.stats[0].tolist())
+        self.assertTrue(allclose(centroids[0], relabeled.centroids[0]))
+
+        with self.assertRaises(ValueError):
+            result.relabel([0])
+
+    def test_component_mask(self):
+        result = self.result
+        mask = result.component_mask(2)
+        self.assertEqual((20, 5), mask.shape)
+        self.assertTrue((mask == 255).all())
+
+        items = list(result.iter_component_masks([3, 4], mask_value=1))
+        self.assertEqual([3, 4], [label for label, _, _ in items])
+        self.assertEqual((30, 20, 35, 25), items[0][1])
+        self.assertEqual(25, int(items[0][2].sum()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import array, int32, logical_and, logical_or, uint8, zeros
+
+from cvlayer.cv.contour.analysis import bitwise_intersection_contours
+from cvlayer.cv.contour.find_largest import find_contours_filter_area_largest
+from cvlayer.cv.contour.roi_mask import RoiMask
+
+
+def full_mask(contour, size, thickness=cv2.FILLED, line=cv2.LINE_8):
+    mask = zeros((size[1], size[0]), dtype=uint8)
+    return cv2.drawContours(mask, [contour], 0, 255, thickness, line)
+
+
+class RoiMaskTestCase(TestCase):
+    def setUp(self):
+        self.size = 200, 120
+        self.c1 = array([[[20, 20]], [[90, 30]], [[70, 100]], [[15, 80]]], int32)
+        self.c2 = array([[[60, 50]], [[150, 40]], [[140, 110]], [[50, 90]]], int32)
+        self.c3 = array([[[170, 5]], [[195, 5]], [[195, 30]]], int32)
+
+    def test_from_contour(self):
+        mask = RoiMask.from_contour(self.c1, self.size)
+        self.assertEqual((15, 20, 91, 101), mask.bbox)
+        self.assertEqual((81, 76), mask.mask.shape)
+
+        expected = full_mask(self.c1, self.size)
+        self.assertTrue((expected == mask.to_full()).all())
+        self.assertEqual(cv2.countNonZero(expected), mask.area)
+
+        outline = RoiMask.from_contour(self.c1, self.size, thickness=3)
+        expected = full_mask(self.c1, self.size, 3)
+        self.assertTrue((expected == outline.to_full()).all())
+
+    def test_from_contour_antialiased(self):
+        for thickness in (cv2.FILLED, 1, 4):
+            mask = RoiMask.from_contour(
+                self.c1, self.size, thickness=thickness, line=cv2.LINE_AA
+            )
+            expected = full_mask(self.c1, self.size, thickness, cv2.LINE_AA)
+            self.assertTrue((expected == mask.to_full()).all(), thickness)
+
+    def test_clipped(self):
+        contour = array([[[-10, -10]], [[30, -10]], [[30, 30]], [[-10, 30]]], int32)
+        mask = RoiMask.from_contour(contour, self.size)
+        self.assertEqual((0, 0, 31, 31), mask.bbox)
+        self.assertTrue((full_mask(contour, self.size) == mask.to_full()).all())
+
+    def test_operations(self):
+        m1 = RoiMask.from_contour(self.c1, self.size)
+        m2 = RoiMask.from_contour(self.c2, self.size)
+        f1 = full_mask(self.c1, self.size) != 0
+        f2 = full_mask(self.c2, self.size) != 0
+
+        intersection = int(logical_and(f1, f2).sum())
+        union = int(logical_or(f1, f2).sum())
+        self.assertEqual(intersection, m1.intersection_area(m2))
+        self.assertEqual(intersection, m1.intersection(m2).area)
+        self.assertEqual(union, m1.union_area(m2))
+        self.assertTrue((logical_or(f1, f2) == (m1.union(m2).to_full() != 0)).all())
+        self.assertAlmostEqual(intersection / union, m1.iou(m2))
+
+        m3 = RoiMask.from_contour(self.c3, self.size)
+        self.assertTrue(m1.intersection(m3).is_empty)
+        self.assertEqual(0.0, m1.iou(m3))
+        self.assertIs(m1, m1.union(RoiMask.empty()))
+
+        with self.assertRaises(ValueError):
+            RoiMask.from_contour(self.c1).to_full()
+
+    def test_bitwise_intersection_contours(self):
+        width, height = self.size
+        result = bitwise_intersection_contours(width, height, self.c1, self.c2)
+        f1 = full_mask(self.c1, self.size, 1) != 0
+        f2 = full_mask(self.c2, self.size, 1) != 0
+        self.assertEqual((height, width), result.shape)
+        self.assertTrue((logical_and(f1, f2) == result).all())
+
+    def test_largest_contour(self):
+        image = full_mask(self.c2, self.size)
+        result = find_contours_filter_area_largest(image)
+        self.assertEqual((50, 40, 151, 111), result.roi_mask.bbox)
+        self.assertTrue((image == result.mask).all())
+
+
+if __name__ == "__main__":
+    main()
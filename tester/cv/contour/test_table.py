@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import allclose, array, int32, uint8, zeros
+from numpy.random import default_rng
+
+from cvlayer.cv.contour.analysis import bounding_rect
+from cvlayer.cv.contour.find import find_contours
+from cvlayer.cv.contour.most_point import (
+    find_bottommost_point,
+    find_leftmost_point,
+    find_rightmost_point,
+    find_topmost_point,
+)
+from cvlayer.cv.contour.table import ContourTable, contour_areas
+from cvlayer.cv.types.retrieval import Retrieval
+
+
+class TableTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(0)
+        self.image = ((rng.random((120, 160)) > 0.6) * 255).astype(uint8)
+        self.result = find_contours(self.image, Retrieval.TREE)
+        self.contours = self.result.contours
+        self.table = ContourTable.from_find_result(self.result)
+
+    def test_columns(self):
+        contours = self.contours
+        table = self.table
+        self.assertEqual(len(contours), len(table))
+
+        areas = [cv2.contourArea(c, True) for c in contours]
+        perimeters = [cv2.arcLength(c, True) for c in contours]
+        self.assertTrue(allclose(areas, table.signed_area))
+        self.assertTrue(allclose(perimeters, table.perimeter))
+        self.assertTrue(allclose(contour_areas(contours), table.area))
+
+        for i, contour in enumerate(contours):
+            self.assertEqual(bounding_rect(contour), tuple(table.bbox[i]))
+            self.assertEqual(find_leftmost_point(contour), tuple(table.leftmost[i]))
+            self.assertEqual(find_rightmost_point(contour), tuple(table.rightmost[i]))
+            self.assertEqual(find_topmost_point(contour), tuple(table.topmost[i]))
+            self.assertEqual(find_bottommost_point(contour), tuple(table.bottommost[i]))
+
+            m = cv2.moments(contour)
+            if m["m00"] != 0:
+                center = m["m10"] / m["m00"], m["m01"] / m["m00"]
+                self.assertTrue(allclose(center, table.centroid[i]))
+
+        self.assertTrue((self.result.hierarchy[0] == table.hierarchy).all())
+
+    def test_degenerate_centroid(self):
+        line = array([[[10, 5]], [[20, 5]]], dtype=int32)
+        table = ContourTable([line])
+        self.assertEqual(0.0, table.area[0])
+        self.assertEqual((15.0, 5.0), tuple(table.centroid[0]))
+        self.assertEqual(-1, table.parent[0])
+
+    def test_filter_sort_top_k(self):
+        table = self.table
+        filtered = table.filter_area(area_min=5)
+        self.assertTrue((filtered.area >= 5).all())
+        self.assertTrue((table.area[filtered.indices] == filtered.area).all())
+        self.assertIs(self.contours[filtered.indices[0]], filtered.contour(0))
+
+        ordered = table.sort()
+        self.assertTrue((ordered.area[:-1] >= ordered.area[1:]).all())
+
+        top = table.top_k(5)
+        self.assertEqual(ordered.indices[:5].tolist(), top.indices.tolist())
+        self.assertEqual(int(ordered.indices[0]), table.largest())
+        self.assertEqual(0, len(table.top_k(0)))
+
+        with self.assertRaises(ValueError):
+            table.sort("bbox")
+
+    def test_empty(self):
+        table = ContourTable(find_contours(zeros((8, 8), dtype=uint8)).contours)
+        self.assertEqual(0, len(table))
+        self.assertIsNone(table.largest())
+        self.assertEqual(0, len(contour_areas([])))
+
+
+if __name__ == "__main__":
+    main()
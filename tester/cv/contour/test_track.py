@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from numpy import array, concatenate, float64, int32
+from numpy.random import default_rng
+
+from cvlayer.cv.contour.track import (
+    BlobTracker,
+    bbox_neighbor_pairs,
+    grid_neighbor_pairs,
+)
+from cvlayer.geometry.iou import calculate_iou_pairs
+
+
+def boxes(centers, size=10):
+    half = size / 2
+    return [(x - half, y - half, x + half, y + half) for x, y in centers]
+
+
+class TrackTestCase(TestCase):
+    def test_grid_neighbor_pairs(self):
+        rng = default_rng(0)
+        points1 = rng.random((50, 2)) * 100 - 50
+        points2 = rng.random((60, 2)) * 100 - 50
+        cell = 10.0
+
+        firsts, seconds = grid_neighbor_pairs(points1, points2, cell)
+        pairs = set(zip(firsts.tolist(), seconds.tolist()))
+        self.assertEqual(len(firsts), len(pairs))
+
+        for i, p1 in enumerate(points1):
+            for j, p2 in enumerate(points2):
+                if (abs(p1 - p2) < cell).all():
+                    self.assertIn((i, j), pairs)
+
+    def test_bbox_neighbor_pairs(self):
+        rng = default_rng(0)
+        corners1 = rng.random((50, 2)) * 200
+        corners2 = rng.random((60, 2)) * 200
+        bboxes1 = concatenate([corners1, corners1 + rng.random((50, 2)) * 80 + 1], 1)
+        bboxes2 = concatenate([corners2, corners2 + rng.random((60, 2)) * 5 + 1], 1)
+
+        firsts, seconds = bbox_neighbor_pairs(bboxes1, bboxes2)
+        pairs = set(zip(firsts.tolist(), seconds.tolist()))
+        self.assertEqual(len(firsts), len(pairs))
+
+        for i, b1 in enumerate(bboxes1):
+            for j, b2 in enumerate(bboxes2):
+                if calculate_iou_pairs(b1[None], b2[None])[0] > 0:
+                    self.assertIn((i, j), pairs)
+
+    def test_large_and_small_boxes(self):
+        centers = [(x * 20 + 10, y * 20 + 10) for x in range(50) for y in range(50)]
+        bboxes = boxes(centers) + [(0, 0, 1000, 1000)]
+        tracker = BlobTracker(min_hits=1)
+        first = tracker.update(bboxes).ids
+
+        firsts, _ = bbox_neighbor_pairs(tracker.bboxes, tracker.bboxes)
+        # The large box pairs with every small box, the small ones only nearby.
+        self.assertLess(len(firsts), len(bboxes) * 12)
+
+        moved = [(x + 1, y) for x, y in centers]
+        second = tracker.update(boxes(moved) + [(1, 0, 1001, 1000)]).ids
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_persistent_ids(self):
+        tracker = BlobTracker(min_hits=2, max_misses=1)
+        centers = [(20, 20), (60, 20), (100, 100)]
+
+        first = tracker.update(boxes(centers))
+        self.assertEqual([0, 1, 2], first.ids.tolist())
+        self.assertEqual([False] * 3, first.confirmed.tolist())
+
+        # Moved a little, in a different order.
+        moved = [(102, 101), (21, 20), (61, 22)]
+        second = tracker.update(boxes(moved))
+        self.assertEqual([2, 0, 1], second.ids.tolist())
+        self.assertEqual([True] * 3, second.confirmed.tolist())
+
+        # A confirmed track survives `max_misses` frames.
+        third = tracker.update(boxes(moved[:2]))
+        self.assertEqual([2, 0], third.ids.tolist())
+        self.assertEqual(3, len(tracker))
+        fourth = tracker.update(boxes(moved[:2] + [(62, 22)]))
+        self.assertEqual([2, 0, 1], fourth.ids.tolist())
+
+        tracker.update(boxes(moved[:2]))
+        tracker.update(boxes(moved[:2]))
+        self.assertEqual([2, 0], tracker.ids.tolist())
+
+    def test_tentative_track_death(self):
+        tracker = BlobTracker(min_hits=3)
+        tracker.update(boxes([(20, 20), (80, 80)]))
+        tracker.update(boxes([(20, 20)]))
+        self.assertEqual([0], tracker.ids.tolist())
+
+        # A new detection is a new track.
+        result = tracker.update(boxes([(20, 20), (80, 80)]))
+        self.assertEqual([0, 2], result.ids.tolist())
+        self.assertEqual([True, False], result.confirmed.tolist())
+
+    def test_distance_metric(self):
+        tracker = BlobTracker("distance", max_distance=15, min_hits=1)
+        tracker.update(boxes([(20, 20), (80, 80)], size=2))
+        result = tracker.update(boxes([(30, 20), (80, 100)], size=2))
+        self.assertEqual([0, 2], result.ids.tolist())
+
+    def test_update_contours(self):
+        square = array([[[10, 10]], [[30, 10]], [[30, 30]], [[10, 30]]], dtype=int32)
+        tracker = BlobTracker(min_hits=1)
+        tracker.update_contours([square])
+        result = tracker.update_contours([square + 2])
+        self.assertEqual([0], result.ids.tolist())
+        self.assertEqual(float64, tracker.centroids.dtype)
+        self.assertEqual((22.0, 22.0), tuple(tracker.centroids[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import array, array_equal, uint8, zeros
+from numpy.random import default_rng
+
+from cvlayer.cv.drawable.batch import (
+    draw_crosshairs_batch,
+    draw_lines_batch,
+    draw_markers_batch,
+    draw_rectangles_batch,
+    group_colors,
+)
+from cvlayer.cv.drawable.crosshair import draw_crosshair
+from cvlayer.cv.types.color import normalize_color
+from cvlayer.cv.types.marker import MarkerType
+from cvlayer.cv.types.thickness import FILLED
+
+
+class DrawableBatchTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(0)
+        xy = rng.integers(-10, 200, (100, 2))
+        self.boxes = array([(x, y, x + 15, y + 10) for x, y in xy])
+        self.points = rng.random((100, 2)) * 200
+        self.color = 0, 200, 100
+
+    def canvas(self):
+        return zeros((200, 200, 3), dtype=uint8)
+
+    def test_group_colors(self):
+        colors = [(0, 0, 255), (0, 255, 0), (0, 0, 255)]
+        groups = group_colors(colors, 3)
+        self.assertEqual((0.0, 0.0, 255.0), groups[0][0])
+        self.assertEqual([0, 2], groups[0][1].tolist())
+        self.assertEqual([1], groups[1][1].tolist())
+
+        self.assertEqual(1, len(group_colors((1, 2, 3), 5)))
+        with self.assertRaises(ValueError):
+            group_colors(colors, 4)
+
+    def test_rectangles(self):
+        for thickness in (1, 3, FILLED):
+            expected = self.canvas()
+            for x1, y1, x2, y2 in self.boxes.tolist():
+                cv2.rectangle(expected, (x1, y1), (x2, y2), self.color, thickness)
+
+            result = draw_rectangles_batch(
+                self.canvas(), self.boxes, self.color, thickness, cv2.LINE_8
+            )
+            self.assertTrue(array_equal(expected, result))
+
+    def test_lines_with_item_colors(self):
+        lines = self.boxes[:3]
+        colors = [(0, 0, 255), (0, 255, 0), (255, 0, 0)]
+        expected = self.canvas()
+        for (x1, y1, x2, y2), color in zip(lines.tolist(), colors):
+            cv2.line(expected, (x1, y1), (x2, y2), color, 2, cv2.LINE_8)
+
+        result = draw_lines_batch(self.canvas(), lines, colors, 2, cv2.LINE_8)
+        self.assertTrue(array_equal(expected, result))
+
+    def test_rectangles_with_named_colors(self):
+        boxes = self.boxes[:3]
+        colors = ["red", "blue", "red"]
+        expected = self.canvas()
+        for (x1, y1, x2, y2), name in zip(boxes.tolist(), colors):
+            color = normalize_color(name)
+            cv2.rectangle(expected, (x1, y1), (x2, y2), color, 1, cv2.LINE_8)
+
+        result = draw_rectangles_batch(self.canvas(), boxes, colors, 1, cv2.LINE_8)
+        self.assertTrue(array_equal(expected, result))
+        self.assertEqual(2, len(group_colors(colors, 3)))
+
+        # A single named color still applies to every item.
+        self.assertEqual(1, len(group_colors("red", 3)))
+
+    def test_markers(self):
+        for marker in MarkerType:
+            expected = self.canvas()
+            for x, y in self.points.astype(int).tolist():
+                cv2.drawMarker(expected, (x, y), self.color, marker.value, 9, 1)
+
+            result = draw_markers_batch(
+                self.canvas(), self.points, self.color, marker, 9, 1, cv2.LINE_8
+            )
+            self.assertTrue(array_equal(expected, result), marker.name)
+
+    def test_crosshairs(self):
+        expected = self.canvas()
+        for x, y in self.points.astype(int).tolist():
+            draw_crosshair(expected, (x, y), color=self.color, line=cv2.LINE_8)
+
+        result = draw_crosshairs_batch(
+            self.canvas(), self.points, self.color, line=cv2.LINE_8
+        )
+        self.assertTrue(array_equal(expected, result))
+
+    def test_markers_and_crosshairs_with_named_colors(self):
+        points = [(30, 30), (100, 100), (170, 60)]
+        colors = ["red", "blue", "green"]
+        expected = self.canvas()
+        for (x, y), name in zip(points, colors):
+            cv2.drawMarker(expected, (x, y), normalize_color(name), 0, 9, 1)
+        result = draw_markers_batch(self.canvas(), points, colors, 0, 9, 1, cv2.LINE_8)
+        self.assertTrue(array_equal(expected, result))
+
+        expected = self.canvas()
+        for (x, y), name in zip(points, colors):
+            color = normalize_color(name)
+            draw_crosshair(expected, (x, y), color=color, line=cv2.LINE_8)
+        result = draw_crosshairs_batch(self.canvas(), points, colors, line=cv2.LINE_8)
+        self.assertTrue(array_equal(expected, result))
+
+
+if __name__ == "__main__":
+    main()
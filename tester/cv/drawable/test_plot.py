@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import arange, array_equal, float64, zeros, zeros_like
+from numpy.random import default_rng
+
+from cvlayer.cv.drawable.plot import (
+    PlotMode,
+    draw_absolute_plot_lines,
+    draw_absolute_plot_x_bars,
+    draw_plot_2d,
+)
+from cvlayer.cv.types.thickness import FILLED
+
+
+class DrawablePlotTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(0)
+        self.points = [(x * 5.5, y) for x, y in enumerate(rng.random(40) * 90)]
+
+    def test_lines_same_as_segments(self):
+        expected = zeros((100, 240, 3), dtype="uint8")
+        for p1, p2 in zip(self.points[:-1], self.points[1:]):
+            p1i = int(p1[0]), int(p1[1])
+            p2i = int(p2[0]), int(p2[1])
+            cv2.line(expected, p1i, p2i, (0, 255, 0), 2, cv2.LINE_8)
+
+        canvas = zeros_like(expected)
+        draw_absolute_plot_lines(
+            canvas, *self.points, color=(0, 255, 0), thickness=2, line=cv2.LINE_8
+        )
+        self.assertTrue(array_equal(expected, canvas))
+
+    def test_bars_same_as_rectangles(self):
+        for thickness in (1, FILLED):
+            expected = zeros((100, 240, 3), dtype="uint8")
+            for x, y in self.points:
+                p1 = int(x - 3), int(y)
+                p2 = int(x + 3), 99
+                cv2.rectangle(expected, p1, p2, (255, 0, 0), thickness, cv2.LINE_8)
+
+            canvas = zeros_like(expected)
+            draw_absolute_plot_x_bars(
+                canvas,
+                *self.points,
+                bottom=99,
+                radius=3,
+                color=(255, 0, 0),
+                thickness=thickness,
+                line=cv2.LINE_8,
+            )
+            self.assertTrue(array_equal(expected, canvas))
+
+    def test_plot_2d_arrays(self):
+        xs = arange(10, dtype=float64)
+        ys = xs * 2
+        canvas1 = zeros((50, 50, 3), dtype="uint8")
+        canvas2 = zeros((50, 50, 3), dtype="uint8")
+        for mode in PlotMode:
+            draw_plot_2d(canvas1, xs, ys, mode=mode, radius=1, color=(0, 0, 255))
+            draw_plot_2d(
+                canvas2,
+                xs.tolist(),
+                ys.tolist(),
+                mode=mode,
+                radius=1,
+                color=(0, 0, 255),
+            )
+        self.assertTrue(canvas1.any())
+        self.assertTrue(array_equal(canvas1, canvas2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from numpy import array_equal, nan, uint8, zeros
+
+from cvlayer.cv.drawable.rolling_plot import RollingPlot
+
+
+class DrawableRollingPlotTestCase(TestCase):
+    def test_ring_buffer(self):
+        plot = RollingPlot(capacity=4)
+        plot.extend([1, 2, 3])
+        self.assertTrue(array_equal([1, 2, 3], plot.values))
+
+        plot.extend([4, 5, 6])
+        self.assertEqual(4, len(plot))
+        self.assertEqual(6.0, plot.last)
+        self.assertTrue(array_equal([3, 4, 5, 6], plot.values))
+
+    def test_range(self):
+        plot = RollingPlot(capacity=3)
+        plot.extend([5, 1, 3])
+        self.assertEqual((1.0, 5.0), plot.range)
+
+        # The maximum was overwritten, so the range is recomputed.
+        plot.append(2)
+        self.assertEqual((1.0, 3.0), plot.range)
+
+        plot.append(nan)
+        self.assertEqual((2.0, 3.0), plot.range)
+
+        plot.max_y = 10
+        self.assertEqual((2.0, 10.0), plot.range)
+
+    def test_draw(self):
+        canvas = zeros((60, 120, 3), dtype=uint8)
+        plot = RollingPlot(capacity=16, label="fps", background_alpha=1.0)
+        plot.draw(canvas, (10, 10, 110, 50))
+
+        plot.extend(range(20))
+        plot.draw(canvas, (10, 10, 110, 50))
+        self.assertTrue(canvas[10:50, 10:110].any())
+        self.assertFalse(canvas[:10].any())
+        self.assertFalse(canvas[50:].any())
+
+
+if __name__ == "__main__":
+    main()
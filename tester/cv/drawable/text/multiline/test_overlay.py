@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from numpy import abs as np_abs
+from numpy import all as np_all
+from numpy import int16
+
+from cvlayer.cv.drawable.text.multiline.box import draw_multiline_text_box
+from cvlayer.cv.drawable.text.multiline.overlay import MultilineTextOverlay
+from cvlayer.cv.image_make import make_image_filled
+from cvlayer.cv.types.line_type import LineType
+from cvlayer.palette.basic import RED
+
+
+class DrawableTextMultilineOverlayTestCase(TestCase):
+    def setUp(self):
+        self.bg = make_image_filled(300, 200, RED)
+        self.text = "DrawableTestCase\n1234567890\n!@#$%^&*()"
+
+    def test_same_as_box(self):
+        overlay = MultilineTextOverlay()
+        for anchor in ((0, 0), (0.5, 0.5), (1, 1)):
+            img1 = self.bg.copy()
+            _, roi1 = draw_multiline_text_box(
+                img1, self.text, (0, 0), line=LineType.B8, anchor=anchor
+            )
+            img2 = self.bg.copy()
+            _, roi2 = overlay.draw(
+                img2, self.text, (0, 0), line=LineType.B8, anchor=anchor
+            )
+            self.assertEqual(roi1, roi2)
+            diff = np_abs(img1.astype(int16) - img2.astype(int16))
+            self.assertLessEqual(int(diff.max()), 1)
+
+    def test_antialiased(self):
+        img1 = self.bg.copy()
+        _, roi1 = draw_multiline_text_box(img1, self.text, (0, 0))
+        img2 = self.bg.copy()
+        _, roi2 = MultilineTextOverlay().draw(img2, self.text, (0, 0))
+        self.assertEqual(roi1, roi2)
+        diff = np_abs(img1.astype(int16) - img2.astype(int16))
+        self.assertLess(float(diff.mean()), 1.0)
+
+        x1, y1, x2, y2 = roi2
+        self.assertTrue(np_all(img2[y2:, :] == self.bg[y2:, :]))
+        self.assertTrue(np_all(img2[:, x2:] == self.bg[:, x2:]))
+
+    def test_line_cache(self):
+        overlay = MultilineTextOverlay()
+        overlay.draw(self.bg.copy(), "A\nB", (0, 0))
+        self.assertEqual(2, overlay.line_misses)
+
+        overlay.draw(self.bg.copy(), "A\nC", (0, 0))
+        self.assertEqual(3, overlay.line_misses)
+        self.assertEqual(1, overlay.line_hits)
+
+        # The unchanged text reuses the composed box.
+        overlay.draw(self.bg.copy(), "A\nC", (0, 0))
+        self.assertEqual(3, overlay.line_misses)
+        self.assertEqual(1, overlay.line_hits)
+
+
+if __name__ == "__main__":
+    main()
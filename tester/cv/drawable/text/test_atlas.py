@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import abs as np_abs
+from numpy import array_equal, int16, uint8
+from numpy.random import default_rng
+
+from cvlayer.cv.drawable.defaults import MULTILINE_LINE_SPACING
+from cvlayer.cv.drawable.text.atlas import GlyphAtlas, shared_glyph_atlas
+from cvlayer.cv.drawable.text.measure import get_text_size
+from cvlayer.cv.drawable.text.multiline.lines import draw_multiline_text_lines
+from cvlayer.cv.drawable.text.multiline.measure import (
+    measure_multiline_text_box_size,
+)
+from cvlayer.cv.drawable.text.outline import draw_outline_text
+from cvlayer.cv.types.line_type import LINE_8, LINE_AA
+
+
+class DrawableTextAtlasTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(0)
+        self.bg = rng.integers(0, 256, (120, 400, 3)).astype(uint8)
+        self.texts = ["FPS: 29.97", "Frame 12345 / 99999", "Hello, World! ()[]{}"]
+        self.color = 10, 200, 250
+
+    def put_text(self, image, text, org, scale, thickness, line):
+        return cv2.putText(image, text, org, 0, scale, self.color, thickness, line)
+
+    def test_same_as_put_text(self):
+        for scale in (0.4, 0.55, 1.0):
+            for thickness in (1, 2):
+                atlas = GlyphAtlas(0, scale, thickness, LINE_8)
+                for text in self.texts:
+                    org = 13, 60
+                    expected = self.put_text(
+                        self.bg.copy(), text, org, scale, thickness, LINE_8
+                    )
+                    result, roi = atlas.draw(self.bg.copy(), text, org, self.color)
+                    self.assertIsNotNone(roi)
+                    self.assertTrue(array_equal(expected, result), text)
+
+    def test_antialiased(self):
+        atlas = GlyphAtlas(0, 0.7, 2, LINE_AA)
+        for text in self.texts:
+            expected = self.put_text(self.bg.copy(), text, (10, 60), 0.7, 2, LINE_AA)
+            result, _ = atlas.draw(self.bg.copy(), text, (10, 60), self.color)
+            diff = np_abs(expected.astype(int16) - result.astype(int16))
+            self.assertLessEqual(int(diff.max()), 12)
+
+    def test_cache(self):
+        atlas = GlyphAtlas(0, 0.5, 1, LINE_8)
+        atlas.draw(self.bg.copy(), "1234", (10, 60))
+        misses = atlas.misses
+        atlas.draw(self.bg.copy(), "4321", (10, 60))
+        self.assertEqual(misses, atlas.misses)
+        self.assertEqual(4, atlas.hits)
+
+    def test_fallback(self):
+        atlas = GlyphAtlas(0, 1.0, 2, LINE_8)
+        text = self.texts[0]
+        expected = self.put_text(self.bg.copy(), text, (-5, 10), 1.0, 2, LINE_8)
+        result, roi = atlas.draw(self.bg.copy(), text, (-5, 10), self.color)
+        self.assertIsNone(roi)
+        self.assertTrue(array_equal(expected, result))
+
+    def test_outline_text(self):
+        outline = 255, 255, 255
+        for line in (LINE_8, LINE_AA):
+            text = self.texts[1]
+            expected = self.bg.copy()
+            cv2.putText(expected, text, (10, 60), 0, 0.6, outline, 5, line)
+            self.put_text(expected, text, (10, 60), 0.6, 1, line)
+
+            result = draw_outline_text(
+                self.bg.copy(), text, (10, 60), 0, 0.6, self.color, outline, 1, 4, line
+            )
+            self.assertTrue(array_equal(expected, result), line)
+
+        # The fill and the outline are drawn from their own shared atlases.
+        fill_atlas = shared_glyph_atlas(0, 0.6, 1, LINE_8)
+        outline_atlas = shared_glyph_atlas(0, 0.6, 5, LINE_8)
+        self.assertIsNot(fill_atlas, outline_atlas)
+        self.assertLess(0, fill_atlas.hits + fill_atlas.misses)
+        self.assertLess(0, outline_atlas.hits + outline_atlas.misses)
+
+    def test_default_line_type(self):
+        black = 0, 0, 0
+        for text in self.texts:
+            expected = self.bg.copy()
+            cv2.putText(expected, text, (10, 60), 0, 0.6, black, 3, LINE_AA)
+            self.put_text(expected, text, (10, 60), 0.6, 1, LINE_AA)
+            result = draw_outline_text(
+                self.bg.copy(), text, (10, 60), 0, 0.6, self.color, black, 1, 2
+            )
+            self.assertTrue(array_equal(expected, result), text)
+
+        text = "\n".join(self.texts)
+        size = measure_multiline_text_box_size(text, 0, 0.5, 1)
+        expected = self.bg.copy()
+        y = 5
+        for line in size.lines:
+            y += line.size[1]
+            self.put_text(expected, line.text, (10, y), 0.5, 1, LINE_AA)
+            y += line.baseline + MULTILINE_LINE_SPACING
+        result = draw_multiline_text_lines(
+            self.bg.copy(), size.lines, (10, 5), 0, 0.5, self.color, 1
+        )
+        self.assertTrue(array_equal(expected, result))
+
+    def test_get_text_size(self):
+        (width, height), baseline = cv2.getTextSize("Text", 0, 0.5, 1)
+        self.assertEqual(((width, height), baseline), get_text_size("Text", 0, 0.5, 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+from os import path
+from tempfile import TemporaryDirectory
+from typing import List, Optional, Sequence, Tuple
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from numpy import full, uint8, zeros
+from numpy.typing import NDArray
+
+from cvlayer.cv.capture_group import CaptureGroup, FrameSynchronizer, SyncDropPolicy
+from cvlayer.cv.fourcc import FOURCC_MJPG
+from cvlayer.cv.video_capture import VideoCapture
+from cvlayer.cv.video_writer import VideoWriter
+
+
+class FrameSynchronizerTestCase(TestCase):
+    def setUp(self):
+        self.image = zeros((2, 2), dtype=uint8)
+
+    def test_aligned(self):
+        sync = FrameSynchronizer(2, tolerance=0.005)
+        sync.push(0, 1.000, self.image)
+        self.assertIsNone(sync.pop())
+        sync.push(1, 1.003, self.image)
+
+        frame_set = sync.pop()
+        assert frame_set is not None
+        self.assertEqual([0, 1], [f.source for f in frame_set.frames])
+        self.assertAlmostEqual(0.003, frame_set.spread)
+        self.assertAlmostEqual(1.003, frame_set.timestamp)
+        self.assertIsNone(sync.pop())
+
+    def test_drop_stale(self):
+        sync = FrameSynchronizer(2, tolerance=0.005)
+        sync.push(0, 1.000, self.image)
+        sync.push(0, 1.033, self.image)
+        sync.push(1, 1.035, self.image)
+
+        frame_set = sync.pop()
+        assert frame_set is not None
+        self.assertAlmostEqual(1.033, frame_set.frames[0].timestamp)
+        self.assertEqual([1, 0], sync.dropped)
+
+    def test_overflow_policy(self):
+        oldest = FrameSynchronizer(2, max_queue=2, policy=SyncDropPolicy.OLDEST)
+        newest = FrameSynchronizer(2, max_queue=2, policy=SyncDropPolicy.NEWEST)
+        for ts in (1.0, 2.0, 3.0):
+            oldest.push(0, ts, self.image)
+            newest.push(0, ts, self.image)
+
+        oldest.push(1, 3.0, self.image)
+        newest.push(1, 2.0, self.image)
+
+        oldest_set = oldest.pop()
+        newest_set = newest.pop()
+        assert oldest_set is not None
+        assert newest_set is not None
+        self.assertEqual(3.0, oldest_set.frames[0].timestamp)
+        self.assertEqual(2.0, newest_set.frames[0].timestamp)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCapture(VideoCapture):
+    """A live source with `frames` frames, where each grab takes `delay` seconds."""
+
+    def __init__(self, clock: FakeClock, frames: int, delay=0.0):
+        super().__init__()
+        self.clock = clock
+        self.remaining = frames
+        self.delay = delay
+        self.grabbed = False
+
+    @property
+    def opened(self) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        self.clock.now += self.delay
+        self.grabbed = self.remaining > 0
+        if self.grabbed:
+            self.remaining -= 1
+        return self.grabbed
+
+    def retrieve(
+        self,
+        image: Optional[NDArray] = None,
+        flag: Optional[int] = None,
+    ) -> Tuple[bool, NDArray]:
+        return self.grabbed, zeros((2, 2), dtype=uint8)
+
+
+def fake_wait_any(
+    streams: Sequence[VideoCapture],
+    timeout_nano: Optional[int] = None,
+) -> Tuple[bool, List[int]]:
+    ready = [i for i, stream in enumerate(streams) if stream.grab()]
+    return bool(ready), ready
+
+
+class CaptureGroupTestCase(TestCase):
+    def test_fallback_timestamps(self):
+        clock = FakeClock()
+        captures = [FakeCapture(clock, 5, 0.02), FakeCapture(clock, 5, 0.02)]
+        group = CaptureGroup(captures, tolerance=0.01, clock=clock)
+        group._use_wait_any = False
+
+        # The second stream is always grabbed 20ms after the first.
+        self.assertIsNone(group.read())
+        self.assertLess(0, sum(group.synchronizer.dropped))
+
+    def test_wait_any_eof(self):
+        clock = FakeClock()
+        captures = [FakeCapture(clock, 3), FakeCapture(clock, 5)]
+        group = CaptureGroup(captures, clock=clock)
+
+        with patch.object(VideoCapture, "wait_any", fake_wait_any):
+            sets = list()
+            while (frame_set := group.read()) is not None:
+                sets.append(frame_set)
+
+        self.assertTrue(group.use_wait_any)
+        self.assertTrue(group.eof)
+        self.assertEqual(3, len(sets))
+
+    def test_wait_any_all_ended(self):
+        clock = FakeClock()
+        captures = [FakeCapture(clock, 0), FakeCapture(clock, 0)]
+        group = CaptureGroup(captures, clock=clock)
+
+        with patch.object(VideoCapture, "wait_any", fake_wait_any):
+            self.assertIsNone(group.read())
+        self.assertTrue(group.eof)
+
+    def _write_video(self, filename: str, frames: int, value: int) -> None:
+        writer = VideoWriter(filename, (32, 24), 10, FOURCC_MJPG)
+        for _ in range(frames):
+            writer.write(full((24, 32, 3), value, dtype=uint8))
+        writer.release()
+
+    def test_read_files(self):
+        with TemporaryDirectory() as tmpdir:
+            first = path.join(tmpdir, "first.avi")
+            second = path.join(tmpdir, "second.avi")
+            self._write_video(first, 3, 50)
+            self._write_video(second, 4, 200)
+
+            group = CaptureGroup([VideoCapture(first), VideoCapture(second)])
+            sets = list()
+            while (frame_set := group.read()) is not None:
+                sets.append(frame_set)
+            group.release()
+
+            # File captures don't support `waitAny`.
+            self.assertFalse(group.use_wait_any)
+            self.assertEqual(3, len(sets))
+            self.assertEqual(2, len(sets[0].images))
+            self.assertTrue(abs(int(sets[0].images[1][0, 0, 0]) - 200) < 8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+from multiprocessing import Process
+from queue import Empty
+from unittest import TestCase, main
+
+from numpy import uint8, zeros
+
+from cvlayer.cv.frame_ring import (
+    SharedFrameRing,
+    process_frame_ring,
+    write_frame_ring,
+)
+
+
+def _invert(frame, data):
+    return 255 - frame, data
+
+
+def _fail(frame, data):
+    raise RuntimeError("Processing failed")
+
+
+class _WrongShapeSource:
+    def read(self, image=None):
+        return True, zeros((4, 4, 3), dtype=uint8)
+
+
+def _worker(input_ring: SharedFrameRing, output_ring: SharedFrameRing) -> None:
+    process_frame_ring(input_ring, output_ring, _invert)
+    input_ring.close()
+    output_ring.close()
+
+
+class FrameRingTestCase(TestCase):
+    def setUp(self):
+        self.shape = 8, 16, 3
+
+    def test_commit_read_release(self):
+        with SharedFrameRing(self.shape, slots=2, readers=2) as ring:
+            slot = ring.acquire()
+            ring.slot_view(slot)[:] = 7
+            ring.commit(slot, 100)
+            self.assertEqual(2, ring.refcount(slot))
+
+            for reader in range(2):
+                item = ring.read(reader)
+                assert item is not None
+                self.assertEqual(slot, item.slot)
+                self.assertEqual(100, item.sequence)
+                self.assertEqual(7, item.image[0, 0, 0])
+                self.assertFalse(item.image.flags.writeable)
+                del item
+                ring.release(slot)
+
+            self.assertEqual(0, ring.refcount(slot))
+            with self.assertRaises(ValueError):
+                ring.release(slot)
+
+    def test_backpressure(self):
+        with SharedFrameRing(self.shape, slots=2) as ring:
+            first = ring.acquire()
+            ring.acquire()
+            with self.assertRaises(Empty):
+                ring.acquire(timeout=0.05)
+            ring.abort(first)
+            self.assertEqual(first, ring.acquire(timeout=1.0))
+
+    def test_worker_process(self):
+        frames = 5
+        with SharedFrameRing(self.shape, slots=2) as inputs:
+            with SharedFrameRing(self.shape, slots=2) as outputs:
+                worker = Process(target=_worker, args=(inputs, outputs))
+                worker.start()
+
+                results = dict()
+                sent = 0
+                while True:
+                    if sent < frames:
+                        slot = inputs.acquire()
+                        inputs.slot_view(slot)[:] = sent
+                        inputs.commit(slot, sent)
+                        sent += 1
+                        if sent == frames:
+                            inputs.finish()
+
+                    try:
+                        item = outputs.read(timeout=0.0 if sent < frames else 5.0)
+                    except Empty:
+                        continue
+                    if item is None:
+                        break
+                    results[item.sequence] = int(item.image[0, 0, 0])
+                    outputs.release(item.slot)
+                    del item
+
+                worker.join(5.0)
+                self.assertEqual(0, worker.exitcode)
+
+        self.assertEqual({i: 255 - i for i in range(frames)}, results)
+
+    def test_process_error_finishes_output(self):
+        with SharedFrameRing(self.shape, slots=2) as inputs:
+            with SharedFrameRing(self.shape, slots=2) as outputs:
+                slot = inputs.acquire()
+                inputs.commit(slot, 0)
+                with self.assertRaises(RuntimeError):
+                    process_frame_ring(inputs, outputs, _fail)
+                self.assertEqual(0, inputs.refcount(slot))
+                self.assertIsNone(outputs.read(timeout=1.0))
+
+    def test_shape_mismatch_finishes_output(self):
+        with SharedFrameRing(self.shape, slots=2) as inputs:
+            with SharedFrameRing((4, 4, 3), slots=2) as outputs:
+                slot = inputs.acquire()
+                inputs.commit(slot, 0)
+                with self.assertRaises(ValueError):
+                    process_frame_ring(inputs, outputs, _invert)
+                self.assertIsNone(outputs.read(timeout=1.0))
+
+    def test_write_shape_mismatch_aborts_slot(self):
+        with SharedFrameRing(self.shape, slots=1) as ring:
+            with self.assertRaises(ValueError):
+                write_frame_ring(ring, _WrongShapeSource(), 0)  # type: ignore
+            # The slot is free again, so a blocking writer can't deadlock.
+            ring.abort(ring.acquire(timeout=1.0))
+
+
+if __name__ == "__main__":
+    main()
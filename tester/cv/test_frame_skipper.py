@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvlayer.cv.frame_skipper import FrameSkipper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSource:
+    """A live source that queues a frame every `interval` seconds."""
+
+    def __init__(self, clock: FakeClock, interval: float):
+        self.clock = clock
+        self.interval = interval
+        self.consumed = 0
+
+    @property
+    def produced(self) -> int:
+        return int(self.clock.now / self.interval + 1e-9)
+
+    def grab(self) -> bool:
+        if self.consumed >= self.produced:
+            # Wait for the next frame.
+            self.clock.now = (self.consumed + 1) * self.interval
+        self.consumed += 1
+        return True
+
+
+class FrameSkipperTestCase(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.source = FakeSource(self.clock, 0.1)
+
+    def run_frames(self, skipper: FrameSkipper, frames: int, duration: float) -> int:
+        max_queued = 0
+        for _ in range(frames):
+            skipper.skip(self.source.grab)
+            self.source.grab()  # The frame that is read.
+            queued = self.source.produced - self.source.consumed
+            max_queued = max(max_queued, queued)
+            self.clock.now += duration
+        return max_queued
+
+    def test_keep_up(self):
+        skipper = FrameSkipper(10, clock=self.clock)
+        self.assertEqual(0, self.run_frames(skipper, 20, 0.05))
+        self.assertEqual(0, skipper.dropped)
+        self.assertEqual(20, skipper.processed)
+        self.assertLess(skipper.backlog, skipper.interval)
+
+    def test_slow_processing(self):
+        skipper = FrameSkipper(10, clock=self.clock)
+        max_queued = self.run_frames(skipper, 20, 0.3)
+        self.assertLess(0, skipper.dropped)
+        self.assertAlmostEqual(2 / 3, skipper.drop_ratio, delta=0.1)
+
+        # The frame read is never more than a frame behind the source.
+        self.assertLessEqual(max_queued, 1)
+
+    def test_latency_target(self):
+        skipper = FrameSkipper(10, latency_target=0.5, clock=self.clock)
+        self.run_frames(skipper, 3, 0.2)
+        self.assertEqual(0, skipper.dropped)
+        self.run_frames(skipper, 20, 0.2)
+        self.assertLess(0, skipper.dropped)
+        self.assertLessEqual(skipper.backlog, 0.5 + 0.1)
+
+    def test_reset(self):
+        skipper = FrameSkipper(10, clock=self.clock)
+        skipper.skip(self.source.grab)
+        self.clock.now += 5.0
+        skipper.reset()
+        self.assertEqual(0, skipper.pending())
+        self.assertEqual(0.0, skipper.backlog)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FrameSkipper(0)
+        with self.assertRaises(ValueError):
+            FrameSkipper(10, latency_target=-1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import allclose, float32, uint8
+from numpy.random import default_rng
+
+from cvlayer.cv.frame_stats import FrameStatsSampler, compute_frame_stats
+
+
+class FrameStatsTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(0)
+        self.frame = rng.integers(0, 256, (61, 83, 3), dtype=uint8)
+
+    def test_full_frame(self):
+        stats = compute_frame_stats(self.frame)
+        self.assertEqual((61, 83, 3), stats.shape)
+        self.assertEqual(61 * 83, stats.samples)
+        self.assertEqual((3, 256), stats.histograms.shape)
+
+        for c in range(3):
+            channel = self.frame[:, :, c]
+            hist = cv2.calcHist([channel], [0], None, [256], [0, 256]).ravel()
+            self.assertTrue(allclose(hist, stats.histograms[c]))
+            self.assertAlmostEqual(float(channel.mean()), stats.means[c])
+            self.assertEqual(int(channel.min()), stats.mins[c])
+            self.assertEqual(int(channel.max()), stats.maxs[c])
+
+    def test_stride_and_roi(self):
+        roi = 10, 5, 70, 50
+        stats = compute_frame_stats(self.frame, roi, stride=4)
+        sampled = self.frame[5:50, 10:70][0:44:4, 0:60:4]
+        self.assertEqual((45, 60, 3), stats.shape)
+        self.assertEqual(sampled.shape[0] * sampled.shape[1], stats.samples)
+        self.assertAlmostEqual(float(sampled[:, :, 1].mean()), stats.means[1])
+
+        gray = self.frame[:, :, 0].astype(float32) / 255
+        stats = compute_frame_stats(gray, stride=3)
+        self.assertEqual((1, 256), stats.histograms.shape)
+        self.assertAlmostEqual(float(gray[::3, ::3].max()), stats.maxs[0])
+
+    def test_sampler_interval(self):
+        now = [0.0]
+        sampler = FrameStatsSampler(
+            interval_frames=3, interval=1.0, clock=lambda: now[0]
+        )
+        for _ in range(3):
+            sampler.update(self.frame)
+        self.assertEqual(1, sampler.updates)
+
+        sampler.update(self.frame)
+        self.assertEqual(2, sampler.updates)
+
+        now[0] = 1.5
+        sampler.update(self.frame)
+        self.assertEqual(3, sampler.updates)
+
+        # The ROI change always updates the stats.
+        sampler.update(self.frame, (0, 0, 10, 10))
+        self.assertEqual(4, sampler.updates)
+
+        # So does a frame from another source, e.g. another layer.
+        sampler.update(self.frame, (0, 0, 10, 10), source=1)
+        self.assertEqual(5, sampler.updates)
+        sampler.update(self.frame, (0, 0, 10, 10), source=1)
+        self.assertEqual(5, sampler.updates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from numpy import all as np_all
+from numpy import full, load, uint8
+
+from cvlayer.cv.fourcc import FOURCC_MJPG
+from cvlayer.cv.frame_store import (
+    FrameStore,
+    create_frame_store,
+    frame_store_data_path,
+)
+from cvlayer.cv.frame_store import main as frame_store_main
+from cvlayer.cv.video_capture import VideoCapture, VideoCaptureProperty
+from cvlayer.cv.video_writer import VideoWriter
+
+
+class _OvercountCapture(VideoCapture):
+    def get_property(self, prop):
+        value = super().get_property(prop)
+        if prop == VideoCaptureProperty.FRAME_COUNT:
+            return value + 4
+        return value
+
+
+class FrameStoreTestCase(TestCase):
+    def setUp(self):
+        self.width = 64
+        self.height = 48
+        self.frames = 6
+
+    def _write_video(self, filename: str) -> None:
+        writer = VideoWriter(filename, (self.width, self.height), 10, FOURCC_MJPG)
+        self.assertTrue(writer.opened)
+        for i in range(self.frames):
+            shape = self.height, self.width, 3
+            writer.write(full(shape, i * 40, dtype=uint8))
+        writer.release()
+
+    def test_create_and_read(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            directory = path.join(tmpdir, "store")
+            meta = create_frame_store(video, directory)
+            self.assertEqual(self.frames, meta.frames)
+            self.assertEqual(self.width, meta.width)
+            self.assertEqual(self.height, meta.height)
+            self.assertEqual(3, meta.channels)
+
+            with self.assertRaises(FileExistsError):
+                create_frame_store(video, directory)
+
+            capture = VideoCapture(video)
+            expected = [capture.read()[1] for _ in range(self.frames)]
+            capture.release()
+
+            store = FrameStore(directory)
+            self.assertTrue(store.opened)
+            self.assertEqual(self.frames, len(store))
+            self.assertTrue(np_all(expected[3] == store[3]))
+            self.assertFalse(store[3].flags.writeable)
+
+            store.pos = self.frames - 2
+            self.assertTrue(store.grab())
+            retval, frame = store.read()
+            self.assertTrue(retval)
+            self.assertTrue(np_all(expected[-1] == frame))
+            self.assertFalse(store.read()[0])
+
+            store.release()
+            self.assertFalse(store.opened)
+
+    def test_short_source(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            directory = path.join(tmpdir, "store")
+            capture = _OvercountCapture(video)
+            meta = create_frame_store(capture, directory)
+            capture.release()
+            self.assertEqual(self.frames, meta.frames)
+
+            # The frames that were never decoded are cut from the data file.
+            data = load(frame_store_data_path(directory), mmap_mode="r")
+            self.assertEqual(self.frames, data.shape[0])
+            del data
+
+            store = FrameStore(directory)
+            self.assertEqual(self.frames, len(store))
+            self.assertEqual(self.frames, len(store.array))
+            self.assertTrue(np_all(store[-1] == (self.frames - 1) * 40))
+            store.release()
+
+    def test_command_line(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            directory = path.join(tmpdir, "store")
+            output = StringIO()
+            with redirect_stdout(output):
+                args = [video, directory, "--max-frames", "4"]
+                self.assertEqual(0, frame_store_main(args))
+            self.assertIn("4 frames", output.getvalue())
+
+            store = FrameStore(directory)
+            self.assertEqual(4, len(store))
+            store.release()
+
+
+if __name__ == "__main__":
+    main()
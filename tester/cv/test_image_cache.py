@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+from os import path, stat, utime
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from numpy import all as np_all
+from numpy import full, uint8
+
+from cvlayer.cv.image_cache import ImageCache, default_image_cache
+from cvlayer.cv.image_io import image_read, image_write
+
+
+class ImageCacheTestCase(TestCase):
+    def test_hit_and_miss(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = path.join(tmpdir, "img.png")
+            image_write(filename, full((10, 10, 3), 1, dtype=uint8))
+
+            cache = ImageCache()
+            img1 = cache.read(filename)
+            img2 = cache.read(filename)
+            assert img1 is not None
+            self.assertIs(img1, img2)
+            self.assertFalse(img1.flags.writeable)
+
+            stats = cache.stats
+            self.assertEqual(1, stats.hits)
+            self.assertEqual(1, stats.misses)
+            self.assertEqual(img1.nbytes, stats.nbytes)
+
+            self.assertIsNone(cache.read(path.join(tmpdir, "missing.png")))
+
+    def test_mtime_invalidation(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = path.join(tmpdir, "img.png")
+            image_write(filename, full((10, 10, 3), 1, dtype=uint8))
+
+            cache = ImageCache()
+            self.assertEqual(1, cache.read(filename)[0, 0, 0])
+
+            image_write(filename, full((10, 10, 3), 2, dtype=uint8))
+            st = stat(filename)
+            utime(filename, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            img = cache.read(filename)
+            assert img is not None
+            self.assertTrue(np_all(img == 2))
+            self.assertEqual(1, len(cache))
+
+    def test_eviction(self):
+        with TemporaryDirectory() as tmpdir:
+            names = [path.join(tmpdir, f"img{i}.png") for i in range(3)]
+            for name in names:
+                image_write(name, full((10, 10, 3), 1, dtype=uint8))
+
+            cache = ImageCache(max_bytes=2 * 10 * 10 * 3)
+            cache.read(names[0])
+            cache.read(names[1])
+            cache.read(names[0])
+            cache.read(names[2])
+
+            self.assertEqual(2, len(cache))
+            self.assertEqual(1, cache.stats.evictions)
+
+            # The least recently used entry was evicted.
+            cache.read(names[0])
+            self.assertEqual(2, cache.stats.hits)
+
+    def test_image_read_option(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = path.join(tmpdir, "img.png")
+            image_write(filename, full((10, 10, 3), 1, dtype=uint8))
+
+            # Without the option, every read decodes a new writable image.
+            uncached = image_read(filename)
+            self.assertIsNot(uncached, image_read(filename))
+            self.assertTrue(uncached.flags.writeable)
+
+            cache = ImageCache()
+            img1 = image_read(filename, cache=cache)
+            img2 = image_read(filename, cache=cache)
+            self.assertIs(img1, img2)
+            self.assertEqual(1, cache.stats.hits)
+            self.assertIsNone(image_read(path.join(tmpdir, "x.png"), cache=cache))
+
+            shared = image_read(filename, cache=True)
+            self.assertIs(shared, image_read(filename, cache=True))
+            default_image_cache().invalidate(filename)
+
+
+if __name__ == "__main__":
+    main()
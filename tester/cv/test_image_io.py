@@ -6,7 +6,17 @@ from unittest import TestCase, main
 
 from numpy import all as np_all
 
-from cvlayer.cv.image_io import image_read, image_write
+from cvlayer.cv.image_io import (
+    image_decode,
+    image_decode_file_range,
+    image_encode_jpeg,
+    image_encode_png,
+    image_read,
+    image_read_many,
+    image_read_prefetch,
+    image_write,
+    image_write_many,
+)
 from cvlayer.cv.image_make import make_image_random
 
 
@@ -22,6 +32,62 @@ class ImageIoTestCase(TestCase):
             img2 = image_read(filename)
             self.assertTrue(np_all(img2 == img1))
 
+    def test_batch_io(self):
+        with TemporaryDirectory() as tmpdir:
+            images = [make_image_random(10, 10) for _ in range(5)]
+            names = [path.join(tmpdir, f"img{i}.png") for i in range(5)]
+            items = list(zip(names, images))
+            items.append((path.join(tmpdir, "unknown.suffix"), images[0]))
+
+            written = image_write_many(items, max_workers=2)
+            self.assertEqual([True] * 5 + [False], [r.ok for r in written])
+            self.assertIsNotNone(written[-1].error)
+
+            missing = path.join(tmpdir, "missing.png")
+            filenames = names[:2] + [missing] + names[2:]
+
+            results = image_read_many(filenames, max_workers=2)
+            self.assertEqual(filenames, [r.filename for r in results])
+            self.assertFalse(results[2].ok)
+            self.assertIsNone(results[2].image)
+
+            loaded = [r.image for r in results if r.ok]
+            self.assertEqual(5, len(loaded))
+            for image, expected in zip(loaded, images):
+                self.assertTrue(np_all(image == expected))
+
+            prefetched = list(image_read_prefetch(filenames, prefetch=2))
+            self.assertEqual(filenames, [r.filename for r in prefetched])
+            self.assertEqual([r.ok for r in results], [r.ok for r in prefetched])
+
+    def test_encode_decode(self):
+        img1 = make_image_random(10, 10)
+        encoded = image_encode_png(img1, compression=1)
+
+        self.assertTrue(np_all(image_decode(encoded) == img1))
+        self.assertTrue(np_all(image_decode(encoded.tobytes()) == img1))
+        self.assertTrue(np_all(image_decode(memoryview(encoded)) == img1))
+
+        jpeg = image_encode_jpeg(img1, quality=90)
+        self.assertEqual(img1.shape, image_decode(jpeg).shape)
+
+    def test_decode_file_range(self):
+        with TemporaryDirectory() as tmpdir:
+            img1 = make_image_random(10, 10)
+            encoded = image_encode_png(img1).tobytes()
+
+            filename = path.join(tmpdir, "blob.bin")
+            with open(filename, "wb") as f:
+                f.write(b"header")
+                f.write(encoded)
+                f.write(b"trailer")
+
+            img2 = image_decode_file_range(filename, 6, len(encoded))
+            self.assertTrue(np_all(img2 == img1))
+
+            with self.assertRaises(ValueError):
+                image_decode_file_range(filename, 6, 1 << 20)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from numpy import full, uint8, zeros
+
+from cvlayer.cv.image_io import image_write
+from cvlayer.cv.image_sequence import (
+    ImageSequence,
+    find_image_files,
+    natural_sort_key,
+)
+
+
+class ImageSequenceTestCase(TestCase):
+    def setUp(self):
+        self.width = 32
+        self.height = 24
+        self.frames = 12
+
+    def _write_images(self, directory: str) -> None:
+        for i in range(self.frames):
+            image = full((self.height, self.width, 3), i * 10, dtype=uint8)
+            image_write(path.join(directory, f"img{i}.png"), image)
+
+    def test_natural_sort_key(self):
+        names = ["img10.png", "img2.png", "img1.png"]
+        expected = ["img1.png", "img2.png", "img10.png"]
+        self.assertEqual(expected, sorted(names, key=natural_sort_key))
+
+    def test_find_image_files(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write_images(tmpdir)
+            with open(path.join(tmpdir, "readme.txt"), "w") as f:
+                f.write("ignored")
+
+            files = find_image_files(tmpdir)
+            self.assertEqual(self.frames, len(files))
+            self.assertTrue(files[2].endswith("img2.png"))
+            self.assertTrue(files[10].endswith("img10.png"))
+
+            pattern = find_image_files(path.join(tmpdir, "img1*.png"))
+            self.assertEqual(3, len(pattern))
+
+    def test_read_in_order(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write_images(tmpdir)
+            sequence = ImageSequence(tmpdir, read_ahead=4, max_workers=2)
+            self.assertTrue(sequence.opened)
+            self.assertEqual(self.width, sequence.width)
+            self.assertEqual(self.height, sequence.height)
+            self.assertEqual(self.frames, sequence.frames)
+
+            for i in range(self.frames):
+                retval, frame = sequence.read()
+                self.assertTrue(retval)
+                self.assertEqual(i * 10, frame[0, 0, 0])
+
+            retval, _ = sequence.read()
+            self.assertFalse(retval)
+            sequence.release()
+            self.assertFalse(sequence.opened)
+
+    def test_bad_images(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write_images(tmpdir)
+            with open(path.join(tmpdir, "img3.png"), "wb") as f:
+                f.write(b"broken")
+            small = zeros((self.height // 2, self.width // 2, 3), dtype=uint8)
+            image_write(path.join(tmpdir, "img5.png"), small)
+
+            sequence = ImageSequence(tmpdir, read_ahead=4)
+            sequence.pos = 3
+            with self.assertRaises(ValueError):
+                sequence.read()
+
+            # The position has moved past the bad file, so reading can go on.
+            self.assertTrue(sequence.read()[0])
+            with self.assertRaises(ValueError):
+                sequence.read()
+            retval, frame = sequence.read()
+            self.assertTrue(retval)
+            self.assertEqual(60, frame[0, 0, 0])
+            sequence.release()
+
+    def test_seek_and_grab(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write_images(tmpdir)
+            sequence = ImageSequence(tmpdir, read_ahead=3)
+
+            sequence.pos = 7
+            retval, frame = sequence.read()
+            self.assertTrue(retval)
+            self.assertEqual(70, frame[0, 0, 0])
+
+            self.assertTrue(sequence.grab())
+            self.assertEqual(9, sequence.pos)
+
+            sequence.pos = 1
+            buffer = zeros((self.height, self.width, 3), dtype=uint8)
+            retval, frame = sequence.read(buffer)
+            self.assertTrue(retval)
+            self.assertIs(buffer, frame)
+            self.assertEqual(10, frame[0, 0, 0])
+            sequence.release()
+
+    def test_empty_directory(self):
+        with TemporaryDirectory() as tmpdir:
+            with self.assertRaises(FileNotFoundError):
+                ImageSequence(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+from http.client import HTTPConnection
+from socket import SO_RCVBUF, SOL_SOCKET, socket
+from threading import Thread
+from time import monotonic, sleep
+from unittest import TestCase, main
+
+import cv2
+from numpy import frombuffer, full, uint8
+from numpy.random import default_rng
+
+from cvlayer.cv.mjpeg_server import MJPEG_BOUNDARY, MjpegServer
+
+
+def wait_for(predicate, timeout=5.0) -> bool:
+    end = monotonic() + timeout
+    while monotonic() < end:
+        if predicate():
+            return True
+        sleep(0.005)
+    return False
+
+
+class MjpegServerTestCase(TestCase):
+    def setUp(self):
+        self.frame = full((24, 32, 3), 128, dtype=uint8)
+        self.server = MjpegServer(port=0)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def connect(self, path: str):
+        host, port = self.server.address
+        connection = HTTPConnection(host, port, timeout=5)
+        connection.request("GET", path)
+        return connection, connection.getresponse()
+
+    def test_no_clients(self):
+        self.assertFalse(self.server.submit(self.frame))
+        self.assertEqual(0, self.server.encoded)
+
+    def test_stream(self):
+        connection, response = self.connect("/")
+        try:
+            self.assertEqual(200, response.status)
+            content_type = response.getheader("Content-Type")
+            self.assertIn(MJPEG_BOUNDARY, content_type)
+
+            self.assertTrue(wait_for(lambda: self.server.submit(self.frame)))
+            self.assertEqual(f"--{MJPEG_BOUNDARY}\r\n", response.readline().decode())
+            self.assertEqual(
+                "Content-Type: image/jpeg\r\n", response.readline().decode()
+            )
+            length = response.readline().decode().split(":")[1]
+            self.assertEqual(b"\r\n", response.readline())
+
+            jpeg = response.read(int(length))
+            image = cv2.imdecode(frombuffer(jpeg, dtype=uint8), cv2.IMREAD_COLOR)
+            self.assertEqual(self.frame.shape, image.shape)
+            self.assertEqual(1, self.server.encoded)
+            self.assertEqual(1, self.server.clients)
+        finally:
+            connection.close()
+
+    def test_snapshot(self):
+        connection, response = self.connect("/unknown")
+        self.assertEqual(404, response.status)
+        connection.close()
+
+        host, port = self.server.address
+        connection = HTTPConnection(host, port, timeout=5)
+        connection.request("GET", "/snapshot.jpg")
+        self.assertTrue(wait_for(lambda: self.server.submit(self.frame)))
+        response = connection.getresponse()
+        self.assertEqual(200, response.status)
+        self.assertEqual("image/jpeg", response.getheader("Content-Type"))
+        self.assertEqual(
+            int(response.getheader("Content-Length")), len(response.read())
+        )
+        connection.close()
+
+    def test_single_slow_client(self):
+        # Noise doesn't compress, so the client can't take the frames in time.
+        frame = default_rng(0).integers(0, 256, (240, 320, 3)).astype(uint8)
+        client = socket()
+        client.setsockopt(SOL_SOCKET, SO_RCVBUF, 4096)
+
+        def read():
+            try:
+                while client.recv(1 << 14):
+                    sleep(0.01)
+            except OSError:
+                pass
+
+        try:
+            client.connect(self.server.address)
+            client.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            Thread(target=read, daemon=True).start()
+
+            def lowered() -> bool:
+                self.server.submit(frame)
+                return self.server.quality < 80
+
+            self.assertTrue(wait_for(lowered))
+            self.assertEqual(0, self.server.dropped)
+        finally:
+            client.close()
+
+    def test_fast_client(self):
+        frame = default_rng(0).integers(0, 256, (240, 320, 3)).astype(uint8)
+        connection, response = self.connect("/")
+
+        def read():
+            try:
+                while response.read(1 << 16):
+                    pass
+            except (OSError, ValueError):
+                pass
+
+        Thread(target=read, daemon=True).start()
+        try:
+            # Frames come faster than the client can take them,
+            # but it drains the socket, so the quality stays up.
+            end = monotonic() + 1.0
+            while monotonic() < end:
+                self.server.submit(frame)
+                sleep(0.0005)
+
+            self.assertLess(0, self.server.encoded)
+            self.assertLessEqual(70, self.server.quality)
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import cv2
+from numpy import array_equal, float32, full, uint8
+
+from cvlayer.cv.mosaic import Mosaic, fit_size, mosaic_cells, mosaic_grid
+
+
+class MosaicTestCase(TestCase):
+    def test_grid(self):
+        self.assertEqual((1, 1), mosaic_grid(0))
+        self.assertEqual((1, 1), mosaic_grid(1))
+        self.assertEqual((2, 2), mosaic_grid(3))
+        self.assertEqual((3, 2), mosaic_grid(5))
+        self.assertEqual((4, 2), mosaic_grid(8, 4))
+        self.assertEqual((2, 1), mosaic_grid(2, 4))
+
+    def test_cells(self):
+        cells = mosaic_cells((100, 60), 3)
+        self.assertEqual([(0, 0, 50, 30), (50, 0, 100, 30), (0, 30, 50, 60)], cells)
+
+    def test_fit_size(self):
+        self.assertEqual((40, 20), fit_size((200, 100), (40, 40)))
+        self.assertEqual((20, 40), fit_size((100, 200), (40, 40)))
+        self.assertEqual((40, 30), fit_size((400, 300), (40, 30)))
+
+    def test_update(self):
+        mosaic = Mosaic((80, 60))
+        frame = full((60, 80, 3), 200, dtype=uint8)
+        canvas = mosaic.update([frame, frame], generation=0)
+        self.assertEqual(2, mosaic.redraws)
+        self.assertEqual((60, 80, 3), canvas.shape)
+
+        expected = cv2.resize(frame, (40, 30), interpolation=cv2.INTER_AREA)
+        self.assertTrue(array_equal(expected, canvas[15:45, 0:40]))
+        self.assertEqual(0, int(canvas[0, 0, 0]))
+
+        # The same frames of the same generation are not redrawn.
+        self.assertTrue(canvas is mosaic.update([frame, frame], generation=0))
+        self.assertEqual(2, mosaic.redraws)
+
+        mosaic.update([frame, frame], generation=1)
+        self.assertEqual(4, mosaic.redraws)
+
+        mosaic.update([frame, frame.copy()], generation=1)
+        self.assertEqual(5, mosaic.redraws)
+
+        mosaic.invalidate(0)
+        mosaic.update([frame, None], generation=1)
+        self.assertEqual(7, mosaic.redraws)
+        self.assertEqual(0, int(canvas[15:45, 40:80].max()))
+
+    def test_convert(self):
+        mosaic = Mosaic((40, 20))
+        gray = full((20, 20), 100, dtype=uint8)
+        real = full((20, 20), 0.5, dtype=float32)
+        canvas = mosaic.update([gray, real])
+
+        self.assertTrue(
+            array_equal(full((20, 20, 3), 100, dtype=uint8), canvas[:, :20])
+        )
+        self.assertTrue(
+            array_equal(full((20, 20, 3), 128, dtype=uint8), canvas[:, 20:])
+        )
+
+    def test_labels(self):
+        mosaic = Mosaic((80, 60))
+        frame = full((60, 80, 3), 200, dtype=uint8)
+        mosaic.update([frame], labels=["0: layer"])
+        mosaic.update([frame], labels=["0: layer"])
+        self.assertEqual(1, mosaic.redraws)
+        mosaic.update([frame], labels=["0: other"])
+        self.assertEqual(2, mosaic.redraws)
+
+
+if __name__ == "__main__":
+    main()
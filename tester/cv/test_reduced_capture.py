@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import cv2
+from numpy import all as np_all
+from numpy import full, uint8, zeros
+
+from cvlayer.cv.fourcc import FOURCC_MJPG
+from cvlayer.cv.reduced_capture import ReducedCapture
+from cvlayer.cv.video_capture import VideoCapture
+from cvlayer.cv.video_writer import VideoWriter
+
+
+class ReducedCaptureTestCase(TestCase):
+    def setUp(self):
+        self.width = 64
+        self.height = 48
+        self.frames = 4
+
+    def _write_video(self, filename: str) -> None:
+        writer = VideoWriter(filename, (self.width, self.height), 10, FOURCC_MJPG)
+        for i in range(self.frames):
+            shape = self.height, self.width, 3
+            writer.write(full(shape, (i * 40, 100, 200), dtype=uint8))
+        writer.release()
+
+    def test_scale_and_grayscale(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            expected = list()
+            capture = VideoCapture(video)
+            while True:
+                retval, frame = capture.read()
+                if not retval:
+                    break
+                size = self.width // 2, self.height // 2
+                small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                expected.append(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
+            capture.release()
+
+            reduced = ReducedCapture(VideoCapture(video), 0.5, grayscale=True)
+            self.assertEqual(self.width // 2, reduced.width)
+            self.assertEqual(self.height // 2, reduced.height)
+
+            results = list()
+            buffers = list()
+            while True:
+                retval, frame = reduced.read()
+                if not retval:
+                    break
+                results.append(frame.copy())
+                buffers.append(frame)
+            reduced.release()
+
+            self.assertEqual(len(expected), len(results))
+            for result, frame in zip(results, expected):
+                self.assertEqual((self.height // 2, self.width // 2), result.shape)
+                self.assertTrue(np_all(result == frame))
+
+            # The output buffer is reused for every frame.
+            self.assertIs(buffers[0], buffers[1])
+
+    def test_separate_outputs(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            for scale, grayscale in ((0.5, True), (1.0, False)):
+                source = VideoCapture(video)
+                reduced = ReducedCapture(source, scale, grayscale, reuse_output=False)
+                _, first = reduced.read()
+                _, second = reduced.read()
+                reduced.release()
+
+                # Each frame must be a separate buffer, not the reused one.
+                self.assertIsNot(first, second)
+                self.assertFalse(np_all(first == second))
+
+    def test_read_into_buffer(self):
+        with TemporaryDirectory() as tmpdir:
+            video = path.join(tmpdir, "video.avi")
+            self._write_video(video)
+
+            reduced = ReducedCapture(VideoCapture(video), grayscale=True)
+            buffer = zeros((self.height, self.width), dtype=uint8)
+            retval, frame = reduced.read(buffer)
+            self.assertTrue(retval)
+            self.assertIs(buffer, frame)
+            reduced.release()
+
+
+if __name__ == "__main__":
+    main()
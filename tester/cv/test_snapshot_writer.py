@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from zipfile import ZipFile
+
+from numpy import all as np_all
+from numpy import full, uint8
+
+from cvlayer.cv.image_io import image_decode, image_read
+from cvlayer.cv.snapshot_writer import SnapshotWriter, freeze_image
+
+
+class SnapshotWriterTestCase(TestCase):
+    def test_freeze_image(self):
+        image = full((4, 4), 1, dtype=uint8)
+        self.assertIsNot(image, freeze_image(image))
+
+        image.setflags(write=False)
+        self.assertIs(image, freeze_image(image))
+
+    def test_submit_files(self):
+        with TemporaryDirectory() as tmpdir:
+            image = full((4, 4, 3), 10, dtype=uint8)
+            writer = SnapshotWriter(max_workers=2)
+            destination = path.join(tmpdir, "snapshot")
+
+            future = writer.submit(destination, [("a", image), ("b", image)])
+            image[:] = 99  # Modifying the source must not affect the snapshot.
+            result = future.result()
+            writer.shutdown()
+
+            self.assertTrue(result.ok)
+            self.assertEqual(2, len(result.files))
+            self.assertTrue(np_all(image_read(result.files[0]) == 10))
+
+            self.assertEqual([result], writer.poll())
+            self.assertEqual(0, writer.pending)
+
+    def test_write_archive(self):
+        with TemporaryDirectory() as tmpdir:
+            image = full((4, 4, 3), 20, dtype=uint8)
+            writer = SnapshotWriter()
+            filename = path.join(tmpdir, "snapshot.zip")
+
+            result = writer.write(filename, [("a", image), ("b", None)], archive=True)
+            writer.shutdown()
+
+            self.assertEqual(["a.png"], result.files)
+            self.assertEqual(1, len(result.errors))
+            self.assertEqual([], writer.poll())
+
+            with ZipFile(filename) as archive:
+                decoded = image_decode(archive.read("a.png"))
+            self.assertTrue(np_all(decoded == 20))
+
+
+if __name__ == "__main__":
+    main()
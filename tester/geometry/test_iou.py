@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+from os import environ
+from time import perf_counter
+from typing import Final
+from unittest import TestCase, main, skipUnless
+
+import cv2
+from numpy import allclose, array, float32, hstack
+from numpy.random import default_rng
+
+from cvlayer.geometry.iou import (
+    calculate_iou,
+    calculate_iou_matrix,
+    calculate_iou_pairs,
+    non_maximum_suppression,
+    soft_non_maximum_suppression,
+)
+
+
+def random_rects(rng, count: int, extent=500.0, max_size=60.0):
+    points = rng.random((count, 2)) * extent
+    sizes = rng.random((count, 2)) * max_size + 1
+    return hstack([points, points + sizes])
+
+
+BENCHMARK_ENV: Final[str] = "CVLAYER_BENCHMARK"
+
+
+class IouTestCase(TestCase):
+    def test_calculate_iou(self):
+        self.assertEqual(1.0, calculate_iou((0, 0, 10, 10), (0, 0, 10, 10)))
+        self.assertEqual(0.0, calculate_iou((0, 0, 10, 10), (10, 0, 20, 10)))
+        self.assertAlmostEqual(25 / 175, calculate_iou((0, 0, 10, 10), (5, 5, 15, 15)))
+
+    def test_calculate_iou_pairs(self):
+        rects1 = array([[0, 0, 10, 10], [0, 0, 10, 10], [0, 0, 10, 10], [0, 0, 0, 0]])
+        rects2 = array([[0, 0, 10, 10], [10, 0, 20, 10], [5, 5, 15, 15], [0, 0, 0, 0]])
+        expected = [calculate_iou(r1, r2) for r1, r2 in zip(rects1[:3], rects2[:3])]
+        result = calculate_iou_pairs(rects1, rects2)
+        self.assertTrue(allclose(expected + [0.0], result))
+
+    def test_calculate_iou_matrix(self):
+        rng = default_rng(0)
+        rects1 = random_rects(rng, 40)
+        rects2 = random_rects(rng, 30)
+        matrix = calculate_iou_matrix(rects1, rects2)
+        self.assertEqual((40, 30), matrix.shape)
+
+        expected = [[calculate_iou(r1, r2) for r2 in rects2] for r1 in rects1]
+        self.assertTrue(allclose(expected, matrix))
+        self.assertEqual((0, 30), calculate_iou_matrix([], rects2).shape)
+        self.assertEqual(0.0, calculate_iou_matrix([(1, 1, 1, 1)], [(1, 1, 1, 1)]))
+
+    @skipUnless(environ.get(BENCHMARK_ENV), f"Set {BENCHMARK_ENV}=1 to run benchmarks")
+    def test_calculate_iou_matrix_benchmark(self):
+        rng = default_rng(1)
+        rects1 = random_rects(rng, 300)
+        rects2 = random_rects(rng, 300)
+        items1 = rects1.tolist()
+        items2 = rects2.tolist()
+
+        begin = perf_counter()
+        calculate_iou_matrix(rects1, rects2)
+        matrix_duration = perf_counter() - begin
+
+        begin = perf_counter()
+        for r1 in items1:
+            for r2 in items2:
+                calculate_iou(r1, r2)
+        scalar_duration = perf_counter() - begin
+
+        self.assertLess(matrix_duration * 5, scalar_duration)
+
+    def test_non_maximum_suppression(self):
+        rng = default_rng(2)
+        rects = random_rects(rng, 300)
+        scores = rng.random(300).astype(float32)
+
+        keep = non_maximum_suppression(rects, scores, 0.3)
+        self.assertTrue((scores[keep][:-1] >= scores[keep][1:]).all())
+
+        boxes = [(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in rects.tolist()]
+        expected = cv2.dnn.NMSBoxes(boxes, scores.tolist(), 0.0, 0.3)
+        self.assertEqual(sorted(array(expected).ravel()), sorted(keep.tolist()))
+
+        self.assertEqual(5, len(non_maximum_suppression(rects, scores, 0.3, 5)))
+        with self.assertRaises(ValueError):
+            non_maximum_suppression(rects, scores[:-1])
+
+    def test_soft_non_maximum_suppression(self):
+        rects = [(0, 0, 10, 10), (0, 0, 10, 9), (20, 20, 30, 30)]
+        scores = [0.9, 0.8, 0.7]
+
+        keep, decayed = soft_non_maximum_suppression(rects, scores)
+        self.assertEqual([0, 2, 1], keep.tolist())
+        self.assertAlmostEqual(0.9, decayed[0])
+        self.assertAlmostEqual(0.7, decayed[1])
+        self.assertLess(decayed[2], 0.8 * 0.5)
+
+        keep, decayed = soft_non_maximum_suppression(rects, scores, iou_threshold=0.5)
+        self.assertEqual([0, 2, 1], keep.tolist())
+        self.assertAlmostEqual(0.8 * 0.1, decayed[2])
+
+        keep, _ = soft_non_maximum_suppression(rects, scores, score_threshold=0.5)
+        self.assertEqual([0, 2], keep.tolist())
+
+
+if __name__ == "__main__":
+    main()
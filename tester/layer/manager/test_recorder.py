@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from numpy import all as np_all
+from numpy import array, full, uint8
+
+from cvlayer.layer.base import LayerBase
+from cvlayer.layer.manager.cvmanager import CvManager
+from cvlayer.layer.manager.recorder import (
+    RECORD_META_FILENAME,
+    PipelineRecorder,
+    PipelineRecordReader,
+    _IndexRanges,
+)
+
+
+class IndexRangesTestCase(TestCase):
+    def test_add(self):
+        ranges = _IndexRanges()
+        for index in (0, 1, 2, 5, 7, 6, 4, 3):
+            self.assertTrue(ranges.add(index))
+        self.assertFalse(ranges.add(3))
+        self.assertEqual(([0], [8]), (ranges.starts, ranges.stops))
+
+        self.assertTrue(ranges.add(-3))
+        self.assertTrue(ranges.add(20))
+        self.assertEqual(([-3, 0, 20], [-2, 8, 21]), (ranges.starts, ranges.stops))
+        self.assertIn(7, ranges)
+        self.assertNotIn(8, ranges)
+
+
+class RecorderTestCase(TestCase):
+    def test_record_and_read(self):
+        with TemporaryDirectory() as tmpdir:
+            manager = CvManager(logger=None)
+            recorder = PipelineRecorder(tmpdir, chunk_size=3)
+            manager.set_recorder(recorder)
+
+            for i in range(7):
+                with manager.layer("gray") as layer:
+                    layer.frame = full((4, 6), i, dtype=uint8)
+                    layer.data = {"index": i, "points": array([i, i + 1])}
+                with manager.layer("half") as layer:
+                    size = 2 if i < 5 else 3  # Shape changes in the middle of a chunk
+                    layer.frame = full((size, size, 3), i * 2, dtype=uint8)
+                self.assertTrue(manager.record(i * 10))
+
+            # The same frame index is recorded only once.
+            self.assertFalse(manager.record(60))
+            recorder.close()
+
+            reader = PipelineRecordReader(tmpdir, cache_chunks=1)
+            self.assertEqual(["gray", "half"], reader.layers)
+            self.assertEqual([i * 10 for i in range(7)], reader.frame_indices("gray"))
+
+            frame, data = reader.read("gray", 40)
+            self.assertTrue(np_all(frame == 4))
+            self.assertEqual({"index": 4, "points": [4, 5]}, data)
+
+            frame, data = reader["half", 60]
+            self.assertEqual((3, 3, 3), frame.shape)
+            self.assertTrue(np_all(frame == 12))
+            self.assertIsNone(data)
+
+            frame, _ = reader["gray", 0]
+            self.assertTrue(np_all(frame == 0))
+
+            with self.assertRaises(KeyError):
+                reader.read("gray", 5)
+
+    def test_same_layer_names(self):
+        with TemporaryDirectory() as tmpdir:
+            layers = [LayerBase("same"), LayerBase("same"), LayerBase("same#1")]
+            with PipelineRecorder(tmpdir, chunk_size=2, max_pending=1) as recorder:
+                for i in range(5):
+                    for value, layer in enumerate(layers):
+                        layer.frame = full((2, 2), value, dtype=uint8)
+                    self.assertTrue(recorder.record(layers, i))
+
+                # Seeking back doesn't record the same frame again.
+                self.assertFalse(recorder.record(layers, 2))
+                self.assertTrue(recorder.record(layers, 10))
+                self.assertFalse(recorder.record(layers, 10))
+
+            reader = PipelineRecordReader(tmpdir)
+            self.assertEqual(["same", "same#1", "same#1#1"], reader.layers)
+            for value, name in enumerate(reader.layers):
+                self.assertEqual([0, 1, 2, 3, 4, 10], reader.frame_indices(name))
+                frame, _ = reader.read(name, 3)
+                self.assertTrue(np_all(frame == value))
+
+    def test_unclosed_record(self):
+        with TemporaryDirectory() as tmpdir:
+            layers = [LayerBase("gray")]
+            recorder = PipelineRecorder(tmpdir, chunk_size=2)
+            try:
+                for i in range(5):
+                    layers[0].frame = full((2, 2), i, dtype=uint8)
+                    self.assertTrue(recorder.record(layers, i))
+                recorder.flush(wait=True)
+
+                # The metadata is written only when the recorder closes.
+                self.assertFalse(path.exists(path.join(tmpdir, RECORD_META_FILENAME)))
+                reader = PipelineRecordReader(tmpdir)
+                self.assertEqual([0, 1, 2, 3, 4], reader.frame_indices("gray"))
+                frame, _ = reader.read("gray", 3)
+                self.assertTrue(np_all(frame == 3))
+            finally:
+                recorder.close()
+
+            self.assertTrue(path.exists(path.join(tmpdir, RECORD_META_FILENAME)))
+            with self.assertRaises(FileExistsError):
+                PipelineRecorder(tmpdir)
+
+    def test_exists(self):
+        with TemporaryDirectory() as tmpdir:
+            with PipelineRecorder(tmpdir):
+                pass
+            with self.assertRaises(FileExistsError):
+                PipelineRecorder(tmpdir)
+
+
+if __name__ == "__main__":
+    main()